@@ -241,6 +241,7 @@ if __name__ == "__main__":
         parse_arguments()
 
     print("Starting installer, one moment...")
+    startup_time = time.monotonic()
 
     # Allow a file to be loaded as early as possible
     try:
@@ -285,6 +286,11 @@ if __name__ == "__main__":
         stdout_log.error("anaconda must be run as root.")
         sys.exit(1)
 
+    # Record the activities of the installer.
+    from pyanaconda.core.trace import tracer, trace_span
+    if conf.anaconda.tracing:
+        tracer.enable("anaconda")
+
     # check if input kickstart should be saved
     if flags.nosave_input_ks:
         log.warning("Input kickstart will not be saved to the installed system due to the nosave option.")
@@ -448,14 +454,16 @@ if __name__ == "__main__":
     log.info("Found a kickstart file: %s", kspath)
 
     # Run %pre scripts.
-    startup_utils.run_pre_scripts(kspath)
+    with trace_span("Run the %pre scripts"):
+        startup_utils.run_pre_scripts(kspath)
 
     # Collect all addon paths
     from pyanaconda.addons import collect_addon_paths
     addon_paths = collect_addon_paths(constants.ADDON_PATHS)
 
     # Parse the kickstart file.
-    ksdata = startup_utils.parse_kickstart(kspath, addon_paths, strict_mode=opts.ksstrict)
+    with trace_span("Parse the kickstart"):
+        ksdata = startup_utils.parse_kickstart(kspath, addon_paths, strict_mode=opts.ksstrict)
 
     # Pick up any changes from interactive-defaults.ks that would
     # otherwise be covered by the dracut KS parser.
@@ -552,23 +560,30 @@ if __name__ == "__main__":
     localization.setup_locale_environment(locale_option, text_mode=anaconda.tui_mode)
 
     # Now that LANG is set, do something with it
-    localization.setup_locale(os.environ["LANG"], localization_proxy, text_mode=anaconda.tui_mode)
+    with trace_span("Set up the locale"):
+        localization.setup_locale(os.environ["LANG"], localization_proxy,
+                                  text_mode=anaconda.tui_mode)
 
     # Initialize the network now, in case the display needs it
     from pyanaconda.network import initialize_network, wait_for_connecting_NM_thread, wait_for_connected_NM
 
-    initialize_network()
+    with trace_span("Initialize the network"):
+        initialize_network()
+
     # If required by user, wait for connection before starting the installation.
     if opts.waitfornet:
         log.info("network: waiting for connectivity requested by inst.waitfornet=%d", opts.waitfornet)
-        wait_for_connected_NM(timeout=opts.waitfornet)
+        with trace_span("Wait for the network"):
+            wait_for_connected_NM(timeout=opts.waitfornet)
 
     # In any case do some actions only after NM finishes its connecting.
     threadMgr.add(AnacondaThread(name=constants.THREAD_WAIT_FOR_CONNECTING_NM,
                                  target=wait_for_connecting_NM_thread))
 
     # now start the interface
-    display.setup_display(anaconda, opts)
+    with trace_span("Set up the display"):
+        display.setup_display(anaconda, opts)
+
     if anaconda.gui_startup_failed:
         # we need to reinitialize the locale if GUI startup failed,
         # as we might now be in text mode, which might not be able to display
@@ -752,7 +767,10 @@ if __name__ == "__main__":
         with check_kickstart_error():
             sync_run_task(snapshot_task_proxy)
 
-    anaconda.intf.setup(ksdata)
+    with trace_span("Set up the user interface"):
+        anaconda.intf.setup(ksdata)
+
+    tracer.add_span("Start the installer", startup_time, time.monotonic())
     anaconda.intf.run()
 
 # vim:tw=78:ts=4:et:sw=4
@@ -28,7 +28,6 @@ from pyanaconda.core.constants import DisplayModes
 from pyanaconda.core import constants
 from pyanaconda.core.startup.dbus_launcher import AnacondaDBusLauncher
 from pyanaconda.payload.source import SourceFactory, PayloadSourceTypeUnrecognized
-from pyanaconda.payload.flatpak import FlatpakPayload
 
 from pyanaconda.anaconda_loggers import get_stdout_logger
 stdoutLog = get_stdout_logger()
@@ -79,6 +78,8 @@ class Anaconda(object):
         # class.  If it doesn't give us one, fall back to the default.
         if not self._payload:
             if self.ksdata.ostreesetup.seen:
+                from pyanaconda.payload.flatpak import FlatpakPayload
+
                 if FlatpakPayload.is_available():
                     from pyanaconda.payload.rpmostreepayload import RPMOSTreePayloadWithFlatpaks
                     klass = RPMOSTreePayloadWithFlatpaks
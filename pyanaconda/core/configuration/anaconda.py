@@ -56,6 +56,43 @@ class AnacondaSection(Section):
         """List of enabled kickstart modules."""
         return self._get_option("kickstart_modules").split()
 
+    @property
+    def lazy_kickstart_modules(self):
+        """List of kickstart modules that are started on demand.
+
+        These modules are started only if they are required by
+        the kickstart file or when they are accessed for the first
+        time. Other kickstart modules are started at the startup.
+        """
+        return self._get_option("lazy_kickstart_modules").split()
+
+    @property
+    def configuration_threads(self):
+        """Maximal number of tasks that configure the installed system in parallel.
+
+        The independent installation tasks that configure the installed
+        system are run at the same time in this number of threads.
+        """
+        return self._get_option("configuration_threads", int)
+
+    @property
+    def background_initramfs_generation(self):
+        """Generate the initramfs in the background.
+
+        If enabled, the initramfs is generated while the users,
+        services, security and addons are configured.
+        """
+        return self._get_option("background_initramfs_generation", bool)
+
+    @property
+    def tracing(self):
+        """Record the activities of the installer.
+
+        If enabled, all Anaconda processes record spans
+        of their activities in the trace file.
+        """
+        return self._get_option("tracing", bool)
+
 
 class AnacondaConfiguration(Configuration):
     """Representation of the Anaconda configuration."""
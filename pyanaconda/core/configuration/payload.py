@@ -103,3 +103,37 @@ class PayloadSection(Section):
         this option.
         """
         return self._get_option("verify_ssl", bool)
+
+    @property
+    def enable_pipelined_installation(self):
+        """Enable the pipelined installation of packages.
+
+        If enabled, packages are split into dependency-ordered batches.
+        Every batch is installed in its own RPM transaction as soon as
+        it is downloaded, while the following batches are still being
+        downloaded. The download and the installation phases overlap,
+        but the packages are not installed in a single transaction.
+        """
+        return self._get_option("enable_pipelined_installation", bool)
+
+    @property
+    def enable_precise_space_estimation(self):
+        """Enable the precise estimation of the required space.
+
+        The space required by the installed packages includes a bonus
+        size for every installed file. If enabled, the files are counted
+        from the file lists of the packages, which have to be loaded for
+        the whole transaction. Otherwise, the number of files is estimated
+        from the number of packages.
+        """
+        return self._get_option("enable_precise_space_estimation", bool)
+
+    @property
+    def enable_streamed_tarball_installation(self):
+        """Enable the streamed installation of remote tarballs.
+
+        If enabled, a remote tarball of a live image is extracted to
+        the target system while it is downloaded. The checksum of the
+        tarball is verified at the end of the extraction.
+        """
+        return self._get_option("enable_streamed_tarball_installation", bool)
@@ -142,3 +142,22 @@ class StorageSection(Section):
             raise ValueError("Invalid value: {}".format(value))
 
         return value
+
+    @property
+    def discovery_threads(self):
+        """Maximal number of devices searched for existing installations in parallel.
+
+        The devices are mounted and searched for existing
+        installations at the same time in this number of threads.
+        """
+        return self._get_option("discovery_threads", int)
+
+    @property
+    def checker_threads(self):
+        """Maximal number of storage checks that run in parallel.
+
+        The checks that declare their dependencies on the
+        storage model run at the same time in this number
+        of threads. Other checks run in order.
+        """
+        return self._get_option("checker_threads", int)
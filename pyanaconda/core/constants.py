@@ -73,6 +73,7 @@ ANACONDA_BUS_ADDR_FILE = "/run/anaconda/bus.address"
 ANACONDA_DATA_DIR = "/usr/share/anaconda"
 ANACONDA_CONFIG_DIR = "/etc/anaconda/"
 ANACONDA_CONFIG_TMP = "/run/anaconda/anaconda.conf"
+ANACONDA_TRACE_FILE = "/tmp/anaconda.trace.json"
 
 # NOTE: this should be LANG_TERRITORY.CODESET, e.g. en_US.UTF-8
 DEFAULT_LANG = "en_US.UTF-8"
@@ -118,7 +119,6 @@ THREAD_PAYLOAD = "AnaPayloadThread"
 THREAD_PAYLOAD_RESTART = "AnaPayloadRestartThread"
 THREAD_SYNC_TIME_BASENAME = "AnaSyncTime"
 THREAD_EXCEPTION_HANDLING_TEST = "AnaExceptionHandlingTest"
-THREAD_LIVE_PROGRESS = "AnaLiveProgressThread"
 THREAD_SOFTWARE_WATCHER = "AnaSoftwareWatcher"
 THREAD_CHECK_SOFTWARE = "AnaCheckSoftwareThread"
 THREAD_SOURCE_WATCHER = "AnaSourceWatcher"
@@ -132,6 +132,12 @@ THREAD_ADD_LAYOUTS_INIT = "AnaAddLayoutsInitThread"
 THREAD_NTP_SERVER_CHECK = "AnaNTPserver"
 THREAD_DBUS_TASK = "AnaTaskThread"
 THREAD_SUBSCRIPTION = "AnaSubscriptionThread"
+THREAD_PACKAGE_DOWNLOAD = "AnaPackageDownloadThread"
+THREAD_RESOLVE_DEFAULT_SELECTION = "AnaResolveDefaultSelectionThread"
+THREAD_INITRAMFS = "AnaInitramfsThread"
+
+# Resource of a DBus task that conflicts with all other resources.
+TASK_RESOURCE_ALL = "all"
 
 # Geolocation constants
 
@@ -18,6 +18,8 @@
 # Red Hat, Inc.
 #
 from pykickstart.base import KickstartHandler
+from pykickstart.errors import KickstartParseError
+from pykickstart.i18n import _
 from pykickstart.parser import KickstartParser
 
 from pyanaconda.core.kickstart.version import VERSION
@@ -128,3 +130,45 @@ class KickstartSpecificationParser(KickstartParser):
     def setupSections(self):
         """Do not setup any default sections."""
         pass
+
+    def read_elements(self, elements):
+        """Process pre-parsed kickstart elements.
+
+        The elements are already split and tokenized, so the kickstart
+        doesn't have to be read line by line again. The commands are
+        dispatched and the lines of the sections are passed to the
+        sections as if the kickstart was read from a string.
+
+        :param elements: a list of elements with args, lines and line_number
+        """
+        self._reset()
+
+        for element in elements:
+            self._read_element(element)
+
+    def _read_element(self, element):
+        """Process one pre-parsed kickstart element."""
+        args = element.args
+        lineno = element.line_number
+
+        if not args[0].startswith("%"):
+            # This is a command. Dispatch to it.
+            self._line = element.lines[0]
+            self._tryFunc(lambda: self.handleCommand(lineno, args))
+            return
+
+        if not self._validState(args[0]):
+            raise KickstartParseError(_("Unknown kickstart section: %s") % args[0], lineno=lineno)
+
+        self._state = args[0]
+        obj = self._sections[self._state]
+        self._tryFunc(lambda: obj.handleHeader(lineno, args))
+
+        for line in element.lines:
+            # Throw away blank lines and comments, unless the section wants all lines.
+            if self._isBlankOrComment(line) and not obj.allLines:
+                continue
+
+            obj.handleLine(line)
+
+        self._finalize(obj)
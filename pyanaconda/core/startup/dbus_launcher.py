@@ -31,6 +31,7 @@ from pyanaconda.core.util import startProgram
 from pyanaconda.core.constants import ANACONDA_BUS_ADDR_FILE, ANACONDA_CONFIG_TMP, \
     ANACONDA_BUS_CONF_FILE, DBUS_ANACONDA_SESSION_ADDRESS
 from pyanaconda.core.dbus import DBus
+from pyanaconda.core.trace import trace_span
 from dasbus.constants import DBUS_FLAG_NONE
 from pyanaconda.modules.common.constants.services import BOSS
 
@@ -64,12 +65,16 @@ class AnacondaDBusLauncher(object):
         """
         self._write_temporary_config()
 
-        self._start_dbus_session()
-        self._set_environment()
-        self._write_bus_address()
+        with trace_span("Start the DBus session"):
+            self._start_dbus_session()
+            self._set_environment()
+            self._write_bus_address()
 
-        self._start_boss()
-        self._start_modules()
+        with trace_span("Start the Boss"):
+            self._start_boss()
+
+        with trace_span("Start the kickstart modules"):
+            self._start_modules()
 
     def stop(self, timeout=20):
         """Stop the DBus modules.
@@ -0,0 +1,132 @@
+#
+# Tracing of the installer activities.
+#
+# Copyright (C) 2020  Red Hat, Inc.  All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from pyanaconda.core.constants import ANACONDA_TRACE_FILE
+
+__all__ = ["Tracer", "tracer", "trace_span"]
+
+
+class Tracer(object):
+    """Recorder of spans in the Chrome trace event format.
+
+    Every span is appended to the trace file as a complete event
+    with the name, the start time, the duration and the ids of the
+    process and the thread. The timestamps are taken from the
+    monotonic clock, which is shared by all processes, so all
+    Anaconda processes can write to the same file.
+
+    The file uses the JSON array format. The closing bracket
+    is optional in this format, so the file can be opened in
+    chrome://tracing or in Perfetto at any time.
+
+    The tracer is disabled by default.
+    """
+
+    def __init__(self):
+        self._file_name = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        """Is the tracer enabled?"""
+        return self._file_name is not None
+
+    def enable(self, process_name, file_name=ANACONDA_TRACE_FILE):
+        """Enable the tracer.
+
+        The trace file is created if it doesn't exist yet.
+
+        :param process_name: a name of the current process
+        :param file_name: a path to the trace file
+        """
+        try:
+            with open(file_name, "x") as f:
+                f.write("[\n")
+        except FileExistsError:
+            pass
+
+        self._file_name = file_name
+        self._write_event({
+            "name": "process_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "args": {"name": process_name}
+        })
+
+    def add_span(self, name, start, end, category="anaconda"):
+        """Add a span to the trace.
+
+        :param name: a name of the span
+        :param start: a start time from time.monotonic
+        :param end: an end time from time.monotonic
+        :param category: a category of the span
+        """
+        if not self.enabled:
+            return
+
+        self._write_event({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": int(start * 1000000),
+            "dur": int((end - start) * 1000000),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {"thread": threading.current_thread().name}
+        })
+
+    def _write_event(self, event):
+        """Append the event to the trace file."""
+        line = json.dumps(event) + ",\n"
+
+        with self._lock:
+            with open(self._file_name, "a") as f:
+                f.write(line)
+
+
+tracer = Tracer()
+
+
+@contextmanager
+def trace_span(name, category="anaconda"):
+    """Trace a span of the code.
+
+    Use it as a context manager or as a decorator:
+
+        with trace_span("Parse the kickstart"):
+            parse_kickstart()
+
+        @trace_span("Start the modules")
+        def start_modules():
+            pass
+
+    :param name: a name of the span
+    :param category: a category of the span
+    """
+    start = time.monotonic()
+
+    try:
+        yield
+    finally:
+        tracer.add_span(name, start, time.monotonic(), category)
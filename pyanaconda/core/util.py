@@ -18,7 +18,9 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import collections
 import glob
+import io
 import os
 import os.path
 import subprocess
@@ -32,14 +34,11 @@ import gettext
 import signal
 import sys
 import imp
+import importlib.util
 import types
 import inspect
 import functools
 
-import requests
-from requests_file import FileAdapter
-from requests_ftp import FTPAdapter
-
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.flags import flags
 from pyanaconda.core.process_watchers import WatchProcesses
@@ -58,6 +57,9 @@ from pykickstart.constants import KS_SCRIPT_ONERROR
 
 _child_env = {}
 
+# The number of the last lines of the program output kept for error reporting.
+PROGRAM_OUTPUT_TAIL_SIZE = 100
+
 
 def setenv(name, value):
     """ Set an environment variable to be used by child processes.
@@ -330,6 +332,56 @@ def _run_program(argv, root='/', stdin=None, stdout=None, env_prune=None, log_ou
     return (proc.returncode, output_string)
 
 
+def _stream_program(argv, root='/', stdin=None, stdout=None, env_prune=None, log_output=True,
+                    tail_size=PROGRAM_OUTPUT_TAIL_SIZE):
+    """ Run an external program and log the output while it is running
+
+        The output is processed line by line and it is never held in
+        the memory as a whole. Undecodable data are replaced.
+
+        :param argv: The command to run and argument
+        :param root: The directory to chroot to before running command.
+        :param stdin: The file object to read stdin from.
+        :param stdout: Optional file object to write the output to.
+        :param env_prune: environment variable to remove before execution
+        :param log_output: whether to log the output of command
+        :param tail_size: a maximal number of the last lines to return
+        :return: The return code of the command and the last lines of the output
+    """
+    tail = collections.deque(maxlen=tail_size)
+
+    try:
+        proc = startProgram(argv, root=root, stdin=stdin, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, env_prune=env_prune)
+
+        with proc.stdout:
+            for data in proc.stdout:
+                line = data.decode("utf-8", "replace")
+                if line[-1] != "\n":
+                    line = line + "\n"
+
+                if log_output:
+                    with program_log_lock:
+                        program_log.info(line.strip())
+
+                if stdout:
+                    stdout.write(line)
+
+                tail.append(line)
+
+        proc.wait()
+
+    except OSError as e:
+        with program_log_lock:
+            program_log.error("Error running %s: %s", argv[0], e.strerror)
+        raise
+
+    with program_log_lock:
+        program_log.debug("Return code: %d", proc.returncode)
+
+    return (proc.returncode, "".join(tail))
+
+
 def execInSysroot(command, argv, stdin=None, root=None):
     """ Run an external program in the target root.
         :param command: The command to run
@@ -348,6 +400,10 @@ def execWithRedirect(command, argv, stdin=None, stdout=None,
                      root='/', env_prune=None, log_output=True, binary_output=False):
     """ Run an external program and redirect the output to a file.
 
+        If the command fails, its return code is logged. The last lines of
+        the text output are logged too, unless the output is already logged
+        to program.log.
+
         :param command: The command to run
         :param argv: The argument list
         :param stdin: The file object to read stdin from.
@@ -359,6 +415,19 @@ def execWithRedirect(command, argv, stdin=None, stdout=None,
         :return: The return code of the command
     """
     argv = [command] + argv
+
+    if not binary_output:
+        returncode, tail = _stream_program(argv, stdin=stdin, stdout=stdout, root=root,
+                                           env_prune=env_prune, log_output=log_output)
+        if returncode and log_output:
+            log.info("%s exited with the return code %d, see program.log for the output",
+                     command, returncode)
+        elif returncode:
+            log.info("%s exited with the return code %d, the output ended with:\n%s",
+                     command, returncode, tail)
+
+        return returncode
+
     return _run_program(argv, stdin=stdin, stdout=stdout, root=root, env_prune=env_prune,
                         log_output=log_output, binary_output=binary_output)[0]
 
@@ -396,7 +465,8 @@ def execWithCaptureBinary(command, argv, stdin=None, root='/', log_output=False,
                         filter_stderr=filter_stderr, binary_output=True)[1]
 
 
-def execReadlines(command, argv, stdin=None, root='/', env_prune=None, filter_stderr=False):
+def execReadlines(command, argv, stdin=None, root='/', env_prune=None, filter_stderr=False,
+                  universal_newlines=False):
     """ Execute an external command and return the line output of the command
         in real-time.
 
@@ -414,6 +484,7 @@ def execReadlines(command, argv, stdin=None, root='/', env_prune=None, filter_st
         :param root: The directory to chroot to before running command.
         :param env_prune: environment variable to remove before execution
         :param filter_stderr: Whether stderr should be excluded from the returned output
+        :param universal_newlines: Whether a carriage return should end a line too
 
         Output from the file is not logged to program.log
         This returns an iterator with the lines from the command until it has finished
@@ -428,6 +499,16 @@ def execReadlines(command, argv, stdin=None, root='/', env_prune=None, filter_st
             self._proc = proc
             self._argv = argv
 
+            if universal_newlines:
+                self._stdout = io.TextIOWrapper(proc.stdout, encoding="utf-8", newline=None)
+            else:
+                self._stdout = None
+
+        @property
+        def returncode(self):
+            """The return code of the finished process or None."""
+            return self._proc.returncode
+
         def __iter__(self):
             return self
 
@@ -442,7 +523,10 @@ def execReadlines(command, argv, stdin=None, root='/', env_prune=None, filter_st
 
         def __next__(self):
             # Read the next line, blocking if a line is not yet available
-            line = self._proc.stdout.readline().decode("utf-8")
+            if self._stdout:
+                line = self._stdout.readline()
+            else:
+                line = self._proc.stdout.readline().decode("utf-8")
             if line == '':
                 # Output finished, wait for the process to end
                 self._proc.communicate()
@@ -1096,6 +1180,10 @@ def parent_dir(directory):
 
 def requests_session():
     """Return a requests.Session object with file and ftp support."""
+    import requests
+    from requests_file import FileAdapter
+    from requests_ftp import FTPAdapter
+
     session = requests.Session()
     session.mount("file://", FileAdapter())
     session.mount("ftp://", FTPAdapter())
@@ -1188,6 +1276,37 @@ def touch(file_path):
         os.mknod(file_path)
 
 
+def lazy_import(name):
+    """Import a module lazily.
+
+    The module is not loaded until one of its attributes is accessed
+    for the first time. Use it for heavy modules that are not always
+    needed, so they don't slow down the startup:
+
+        langtable = lazy_import("langtable")
+
+    :param name: a full name of the module
+    :return: a module object
+    :raise ImportError: if the module cannot be found
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+
+    if spec is None:
+        raise ImportError("No module named '{}'".format(name), name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
+
+
 def collect(module_pattern, path, pred):
     """Traverse the directory (given by path), import all files as a module
        module_pattern % filename and find all classes within that match
@@ -1431,3 +1550,21 @@ def is_smt_enabled():
     except (IOError, ValueError):
         log.warning("Failed to detect SMT.")
         return False
+
+
+def get_available_memory():
+    """Get the memory available for starting new applications.
+
+    :return: a number of bytes or None if unknown
+    """
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                fields = line.split()
+
+                if fields[0] == "MemAvailable:" and len(fields) == 3:
+                    return int(fields[1]) * 1024
+    except (IOError, ValueError, IndexError) as e:
+        log.warning("Failed to get the available memory: %s", e)
+
+    return None
@@ -272,7 +272,8 @@ def initExceptionHandling(anaconda):
                  "/tmp/dnf.librepo.log", "/tmp/hawkey.log",
                  "/tmp/lvm.log", conf.target.system_root + "/root/install.log",
                  "/proc/cmdline", "/root/lorax-packages.log",
-                 "/tmp/blivet-gui-utils.log", "/tmp/dbus.log"]
+                 "/tmp/blivet-gui-utils.log", "/tmp/dbus.log",
+                 "/tmp/anaconda.trace.json"]
 
     if os.path.exists("/tmp/syslog"):
         file_list.extend(["/tmp/syslog"])
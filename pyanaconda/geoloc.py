@@ -113,10 +113,8 @@ Backends that could possibly be used in the future
    * cell tower geolocation
 
 """
-from pyanaconda.core.util import requests_session
-import requests
+from pyanaconda.core.util import requests_session, lazy_import
 import urllib.parse
-import dbus
 import threading
 import time
 from pyanaconda import network
@@ -131,6 +129,10 @@ from pyanaconda.threading import AnacondaThread, threadMgr
 from pyanaconda.timezone import get_preferred_timezone, is_valid_timezone
 from pyanaconda.flags import flags
 
+# These modules are needed only for the lookup.
+requests = lazy_import("requests")
+dbus = lazy_import("dbus")
+
 OFFICIALLY_SUPPORTED_GEOLOCATION_PROVIDER_IDS = {
     constants.GEOLOC_PROVIDER_FEDORA_GEOIP,
     constants.GEOLOC_PROVIDER_HOSTIP
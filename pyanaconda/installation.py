@@ -18,7 +18,7 @@
 # Red Hat, Inc.
 #
 from pyanaconda.core.configuration.anaconda import conf
-from pyanaconda.core.constants import PAYLOAD_LIVE_TYPES
+from pyanaconda.core.constants import PAYLOAD_LIVE_TYPES, THREAD_INITRAMFS
 from pyanaconda.core.kernel import kernel_arguments
 from pyanaconda.modules.common.constants.objects import BOOTLOADER, SNAPSHOT, FIREWALL
 from pyanaconda.modules.common.constants.services import STORAGE, USERS, SERVICES, NETWORK, SECURITY, \
@@ -35,7 +35,7 @@ from pyanaconda.core.i18n import N_
 from pyanaconda.threading import threadMgr
 from pyanaconda.kickstart import runPostScripts, runPreInstallScripts
 from pyanaconda.kexec import setup_kexec
-from pyanaconda.installation_tasks import Task, TaskQueue
+from pyanaconda.installation_tasks import Task, TaskQueue, ParallelTaskQueue, BackgroundTask
 from pykickstart.constants import SNAPSHOT_WHEN_POST_INSTALL
 
 from pyanaconda.anaconda_loggers import get_module_logger
@@ -90,48 +90,83 @@ def _prepare_configuration(payload, ksdata):
         configuration_queue.append(subscription_config)
 
     # schedule the execute methods of ksdata that require an installed system to be present
-    os_config = TaskQueue("Installed system configuration", N_("Configuring installed system"))
+    # - the nested queues touch different files of the installed system, so they can run
+    #   in parallel
+    os_config = ParallelTaskQueue(
+        "Installed system configuration",
+        N_("Configuring installed system"),
+        max_workers=conf.anaconda.configuration_threads
+    )
 
     # add installation tasks for the Security DBus module
+    security_config = TaskQueue("Security configuration", N_("Configuring security"))
     security_proxy = SECURITY.get_proxy()
     security_dbus_tasks = security_proxy.InstallWithTasks()
-    os_config.append_dbus_tasks(SECURITY, security_dbus_tasks)
+    security_config.append_dbus_tasks(SECURITY, security_dbus_tasks)
+    os_config.append(security_config)
+
+    # the Services, Timezone and Firewall tasks can enable and disable
+    # the same systemd services, so keep them in the original order
+    services_config = TaskQueue("System services configuration",
+                                N_("Configuring system services"))
 
     # add installation tasks for the Services DBus module
     services_proxy = SERVICES.get_proxy()
     services_dbus_tasks = services_proxy.InstallWithTasks()
-    os_config.append_dbus_tasks(SERVICES, services_dbus_tasks)
+    services_config.append_dbus_tasks(SERVICES, services_dbus_tasks)
 
     # add installation tasks for the Timezone DBus module
     timezone_proxy = TIMEZONE.get_proxy()
     timezone_dbus_tasks = timezone_proxy.InstallWithTasks()
-    os_config.append_dbus_tasks(TIMEZONE, timezone_dbus_tasks)
-
-    # add installation tasks for the Localization DBus module
-    localization_proxy = LOCALIZATION.get_proxy()
-    localization_dbus_tasks = localization_proxy.InstallWithTasks()
-    os_config.append_dbus_tasks(LOCALIZATION, localization_dbus_tasks)
+    services_config.append_dbus_tasks(TIMEZONE, timezone_dbus_tasks)
 
     # add the Firewall configuration task
     firewall_proxy = NETWORK.get_proxy(FIREWALL)
     firewall_dbus_task = firewall_proxy.InstallWithTask()
-    os_config.append_dbus_tasks(NETWORK, [firewall_dbus_task])
+    services_config.append_dbus_tasks(NETWORK, [firewall_dbus_task])
+    os_config.append(services_config)
 
-    configuration_queue.append(os_config)
+    # add installation tasks for the Localization DBus module
+    localization_config = TaskQueue("Localization configuration",
+                                    N_("Configuring localization"))
+    localization_proxy = LOCALIZATION.get_proxy()
+    localization_dbus_tasks = localization_proxy.InstallWithTasks()
+    localization_config.append_dbus_tasks(LOCALIZATION, localization_dbus_tasks)
 
     # schedule network configuration (if required)
+    network_config = None
+
     if conf.system.provides_network_config:
         overwrite = payload.type in PAYLOAD_LIVE_TYPES
         network_config = TaskQueue("Network configuration", N_("Writing network configuration"))
         network_config.append(Task("Network configuration",
                                    network.write_configuration, (overwrite, )))
-        configuration_queue.append(network_config)
+
+    if conf.anaconda.background_initramfs_generation:
+        # the initramfs needs only the installed kernels, the storage configuration and
+        # the console and network configuration, so it is generated while the users,
+        # services, security and addons are configured
+        configuration_queue.append(localization_config)
+
+        if network_config:
+            configuration_queue.append(network_config)
+
+        initramfs_task = BackgroundTask("Start initramfs generation", THREAD_INITRAMFS,
+                                        payload.recreate_initrds)
+        configuration_queue.append(initramfs_task)
+        configuration_queue.append(os_config)
+    else:
+        os_config.append(localization_config)
+        configuration_queue.append(os_config)
+
+        if network_config:
+            configuration_queue.append(network_config)
 
     # add installation tasks for the Users DBus module
     user_config = TaskQueue("User creation", N_("Creating users"))
     users_proxy = USERS.get_proxy()
     users_dbus_tasks = users_proxy.InstallWithTasks()
-    os_config.append_dbus_tasks(USERS, users_dbus_tasks)
+    user_config.append_dbus_tasks(USERS, users_dbus_tasks)
     configuration_queue.append(user_config)
 
     # Anaconda addon configuration
@@ -152,7 +187,12 @@ def _prepare_configuration(payload, ksdata):
 
     # Initramfs generation
     generate_initramfs = TaskQueue("Initramfs generation", N_("Generating initramfs"))
-    generate_initramfs.append(Task("Generate initramfs", payload.recreate_initrds))
+
+    if conf.anaconda.background_initramfs_generation:
+        # wait for the initramfs before the boot loader configuration is fixed
+        generate_initramfs.append(initramfs_task.create_wait_task("Wait for initramfs"))
+    else:
+        generate_initramfs.append(Task("Generate initramfs", payload.recreate_initrds))
 
     # This works around 2 problems, /boot on BTRFS and BTRFS installations where the initrd is
     # recreated after the first writeBootLoader call. This reruns it after the new initrd has
@@ -17,6 +17,7 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+from concurrent.futures import ThreadPoolExecutor
 from threading import RLock
 
 from dasbus.error import DBusError
@@ -24,6 +25,7 @@ from pyanaconda.core.signal import Signal
 from pyanaconda.core.util import synchronized
 from pyanaconda.errors import errorHandler, ERROR_RAISE
 from pyanaconda.modules.common.task import sync_run_task
+from pyanaconda.threading import threadMgr, AnacondaThread
 import time
 
 from pyanaconda.anaconda_loggers import get_module_logger
@@ -111,6 +113,7 @@ class TaskQueue(BaseTask):
         self._status_message = status_message
         self._current_task_number = None
         self._current_queue_number = None
+        self._completed_task_number = None
         # the list backing this TaskQueue instance
         self._list = []
         # triggered if a TaskQueue contained in this one was started/completed
@@ -124,6 +127,7 @@ class TaskQueue(BaseTask):
         # progress reporting purposes
         self.queue_started.connect(self._queue_started_cb)
         self.task_started.connect(self._task_started_cb)
+        self.task_completed.connect(self._task_completed_cb)
 
     @synchronized
     def _queue_started_cb(self, *args):
@@ -133,6 +137,10 @@ class TaskQueue(BaseTask):
     def _task_started_cb(self, *args):
         self._current_task_number += 1
 
+    @synchronized
+    def _task_completed_cb(self, *args):
+        self._completed_task_number += 1
+
     @property
     def status_message(self):
         """A status message describing the Queue is trying to achieve.
@@ -209,14 +217,24 @@ class TaskQueue(BaseTask):
         """Task queue processing progress.
 
         The progress is reported as a floating point number from 0.0 to 1.0.
+        It is based on the number of completed tasks, so it is correct also
+        for tasks that run in parallel.
+
         :returns: task queue processing progress
         :rtype: float
         """
-        if self.current_task_number:
-            return self.task_count / self.current_task_number
+        if self.done:
+            return 1.0
+        elif self._completed_task_number and self.task_count:
+            return self._completed_task_number / self.task_count
         else:
             return 0.0
 
+    @property
+    def _summary_title(self):
+        """A title of the task queue used in the summary."""
+        return "Task queue: %s" % self.name
+
     @property
     @synchronized
     def summary(self):
@@ -232,7 +250,7 @@ class TaskQueue(BaseTask):
             message += "Number of tasks: %d\n" % self.task_count
             message += "Task & task group listing:\n"
         else:
-            message = "Task queue: %s\n" % self.name
+            message = "%s\n" % self._summary_title
         for item in self:
             for line in item.summary.splitlines():
                 message += " %s\n" % line
@@ -298,6 +316,7 @@ class TaskQueue(BaseTask):
                     # only set the initial task number if we have some tasks
                     self._current_task_number = 0
                     self._current_queue_number = 0
+                    self._completed_task_number = 0
                 else:
                     log.warning("Attempting to start an empty task queue (%s).", self.name)
 
@@ -306,9 +325,8 @@ class TaskQueue(BaseTask):
             self.started.emit(self)
             if len(self) == 0:
                 log.warning("The task group %s is empty.", self.name)
-            for item in self:
-                # start the item (TaskQueue/Task)
-                item.start()
+
+            self._start_items()
 
             # we are done, set the task queue state accordingly
             with self._lock:
@@ -317,10 +335,18 @@ class TaskQueue(BaseTask):
                 # also set the current task variables accordingly as we no longer process a task
                 self._current_task_number = None
                 self._current_queue_number = None
+                self._completed_task_number = None
 
             # trigger the "completed" signals
             self.completed.emit(self)
 
+    def _start_items(self):
+        """Start the items of the task queue."""
+        # go over all task groups and their tasks in order
+        for item in self:
+            # start the item (TaskQueue/Task)
+            item.start()
+
     # implement the Python list "interface" and make sure parent is always
     # set to a correct value
     @synchronized
@@ -386,6 +412,66 @@ class TaskQueue(BaseTask):
     # - __add__(), __radd__() - same as above
 
 
+class ParallelTaskQueue(TaskQueue):
+    """ParallelTaskQueue represents a queue of independent TaskQueues or Tasks.
+
+    The items of the queue are started in parallel in a pool of threads,
+    so they must not depend on each other. Use a nested TaskQueue to keep
+    the order of the dependent items.
+
+    The queue is completed once all its items are completed. If some of
+    the items fail, the first error is raised after all running items
+    are finished.
+    """
+
+    def __init__(self, name, status_message=None, max_workers=None):
+        """Create a new parallel task queue.
+
+        :param name: a name of the queue
+        :param status_message: a status message of the queue
+        :param max_workers: a maximal number of items running at the same time
+                            or None for no limit
+        """
+        super().__init__(name=name, status_message=status_message)
+        self._max_workers = max_workers
+
+    @property
+    def max_workers(self):
+        """A maximal number of items running at the same time.
+
+        :returns: a number of items or None for no limit
+        :rtype: int or None
+        """
+        return self._max_workers
+
+    @property
+    def _summary_title(self):
+        """A title of the task queue used in the summary."""
+        return "Parallel task queue: %s" % self.name
+
+    def _start_items(self):
+        """Start the items of the task queue in parallel."""
+        if not len(self):
+            return
+
+        max_workers = min(self.max_workers or len(self), len(self))
+
+        if max_workers <= 1:
+            super()._start_items()
+            return
+
+        log.debug("Starting %d items of the task queue %s in %d threads.",
+                  len(self), self.name, max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="AnaTaskQueueThread") as executor:
+            futures = [executor.submit(item.start) for item in self]
+
+        # raise the first error
+        for future in futures:
+            future.result()
+
+
 class Task(BaseTask):
     """Task is a wrapper for a single installation related task.
 
@@ -497,6 +583,60 @@ class Task(BaseTask):
                 self._done_timestamp = time.time()
 
 
+class BackgroundTask(Task):
+    """Task that runs its callable in a background thread.
+
+    The task is completed as soon as the thread is started, so the following
+    tasks can run at the same time. Use the task returned by create_wait_task
+    to wait for the thread to finish. Errors of the callable are raised by
+    the wait task.
+    """
+
+    def __init__(self, name, thread_name, task=None, task_args=None, task_kwargs=None):
+        """Create a new background task.
+
+        :param name: a name of the task
+        :param thread_name: a name of the background thread
+        :param task: a callable to run in the thread
+        :param task_args: arguments of the callable
+        :param task_kwargs: keyword arguments of the callable
+        """
+        super().__init__(name, task=task, task_args=task_args, task_kwargs=task_kwargs)
+        self._thread_name = thread_name
+
+    @property
+    def thread_name(self):
+        """Name of the background thread.
+
+        :returns: a name of the thread
+        :rtype: str
+        """
+        return self._thread_name
+
+    def run_task(self):
+        """Start the callable in the background thread."""
+        threadMgr.add(AnacondaThread(
+            name=self._thread_name,
+            target=super().run_task,
+            fatal=False
+        ))
+
+    def wait(self):
+        """Wait for the background thread to finish.
+
+        :raise: an error of the callable if any
+        """
+        threadMgr.wait(self._thread_name)
+
+    def create_wait_task(self, name):
+        """Create a task that waits for the background thread.
+
+        :param name: a name of the task
+        :returns: an instance of Task
+        """
+        return Task(name, self.wait)
+
+
 class DBusTask(Task):
     """Wrapper for a DBus installation task."""
 
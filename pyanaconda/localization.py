@@ -21,7 +21,6 @@ import gettext
 import os
 import re
 import shutil
-import langtable
 import locale as locale_mod
 import glob
 from collections import namedtuple
@@ -33,6 +32,9 @@ from pyanaconda.modules.common.constants.services import BOSS
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
+# The language database is loaded on the first use.
+langtable = util.lazy_import("langtable")
+
 SCRIPTS_SUPPORTED_BY_CONSOLE = {'Latn', 'Cyrl', 'Grek'}
 
 
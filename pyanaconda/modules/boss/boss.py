@@ -54,10 +54,11 @@ class Boss(Service):
         DBus.register_service(BOSS.service_name)
 
     def get_modules(self):
-        """Get service names of running modules.
+        """Get service names of available modules.
 
         Get a list of all running DBus modules (including addons)
-        that were discovered and started by the boss.
+        that were discovered and started by the boss, and of all
+        modules that are started on demand.
 
         :return: a list of service names
         """
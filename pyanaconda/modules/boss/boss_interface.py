@@ -30,10 +30,11 @@ class BossInterface(InterfaceTemplate):
     """DBus interface for the Boss."""
 
     def GetModules(self) -> List[Str]:
-        """Get service names of running modules.
+        """Get service names of available modules.
 
         Get a list of all running DBus modules (including addons)
-        that were discovered and started by the boss.
+        that were discovered and started by the boss, and of all
+        modules that are started on demand.
 
         :return: a list of service names
         """
@@ -47,7 +47,9 @@ class InstallManager(object):
         :return: an instance of the main configuration task
         """
         configuration_tasks = self._collect_tasks(lambda proxy: proxy.ConfigureWithTasks())
-        system_task = DBusMetaTask("Configure the runtime system", configuration_tasks)
+        system_task = DBusMetaTask(
+            "Configure the runtime system", configuration_tasks, parallel=True
+        )
         return system_task
 
     def install_system_with_task(self):
@@ -58,7 +60,7 @@ class InstallManager(object):
         :return: an instance of the main installation task
         """
         installation_tasks = self._collect_tasks(lambda proxy: proxy.InstallWithTasks())
-        system_task = DBusMetaTask("Install the system", installation_tasks)
+        system_task = DBusMetaTask("Install the system", installation_tasks, parallel=True)
         return system_task
 
     def _collect_tasks(self, collector):
@@ -63,6 +63,16 @@ class KickstartElement(object):
         """Name of the element."""
         return self._name
 
+    @property
+    def args(self):
+        """Tokens of the command or of the section header."""
+        return list(self._args)
+
+    @property
+    def lines(self):
+        """Lines of the command or of the section body."""
+        return list(self._lines)
+
     @property
     def content(self):
         """Full kickstart content of the element."""
@@ -16,14 +16,21 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+import time
+
+from dasbus.constants import DBUS_FLAG_NONE
 from pykickstart.errors import KickstartError
 from pykickstart.version import makeVersion
 
 from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.core.dbus import DBus
+from pyanaconda.core.glib import create_new_context
+from pyanaconda.core.trace import trace_span
 from pyanaconda.modules.boss.kickstart_manager.parser import SplitKickstartParser,\
     VALID_SECTIONS_ANACONDA
 from pyanaconda.modules.common.constants.services import BOSS
-from pyanaconda.modules.common.structures.kickstart import KickstartReport, KickstartMessage
+from pyanaconda.modules.common.structures.kickstart import KickstartReport, KickstartMessage, \
+    KickstartElementData
 
 log = get_module_logger(__name__)
 
@@ -54,8 +61,14 @@ class KickstartManager(object):
         report = KickstartReport()
 
         try:
-            elements = self._split_to_elements(path)
-            reports = self._distribute_to_modules(elements)
+            with trace_span("Split the kickstart"):
+                elements = self._split_to_elements(path)
+
+            with trace_span("Start the required modules"):
+                self._start_required_modules(elements)
+
+            with trace_span("Distribute the kickstart"):
+                reports = self._distribute_to_modules(elements)
         except KickstartError as e:
             data = KickstartMessage.for_error(e)
             data.module_name = BOSS.service_name
@@ -72,18 +85,85 @@ class KickstartManager(object):
         parser = SplitKickstartParser(handler, valid_sections=VALID_SECTIONS_ANACONDA)
         return parser.split(path)
 
+    def _start_required_modules(self, elements):
+        """Start lazy modules that are required by the kickstart.
+
+        A lazy module is required if the kickstart contains a command,
+        a section or an addon from its kickstart specification. If the
+        specification is unknown, the module is started anyway.
+
+        The modules are started at once and we wait until they own
+        their DBus names.
+
+        :param elements: kickstart elements
+        """
+        observers = []
+
+        for observer in self._module_observers:
+            if not observer.is_lazy or observer.is_service_available:
+                continue
+
+            if not self._is_module_required(observer, elements):
+                log.debug("%s is not required by the kickstart.", observer)
+                continue
+
+            observers.append(observer)
+
+        if not observers:
+            return
+
+        calls = []
+
+        for observer in observers:
+            log.info("Starting %s required by the kickstart.", observer)
+            calls.append((DBus.proxy.StartServiceByName, (observer.service_name, DBUS_FLAG_NONE)))
+
+        start_time = time.time()
+        self._call_modules(calls)
+
+        log.info("Required modules are available after %.2f seconds.", time.time() - start_time)
+
+        for observer in observers:
+            observer.set_service_started()
+
+    def _is_module_required(self, observer, elements):
+        """Is the module required by the kickstart elements?
+
+        :param observer: a module observer
+        :param elements: kickstart elements
+        :return: True or False
+        """
+        specification = observer.kickstart_specification
+
+        if not specification:
+            return True
+
+        return bool(elements.get_elements(
+            commands=list(specification.commands.keys()),
+            sections=list(specification.sections.keys()),
+            addons=list(specification.addons.keys())
+        ))
+
     def _distribute_to_modules(self, elements):
-        """Distribute split kickstart to modules synchronously.
+        """Distribute split kickstart to modules.
+
+        The kickstart data are sent to all modules at once, so the modules
+        can parse them in parallel. The reports are processed in the order
+        of the modules.
+
+        The modules get the already split and tokenized elements, so they
+        don't have to parse the whole kickstart again.
 
         :returns: list of (Line number, Message) errors reported by modules when
                   distributing kickstart
         :rtype: list of kickstart reports
         """
-        reports = []
+        calls = []
+        module_references = []
 
         for observer in self._module_observers:
             if not observer.is_service_available:
-                log.warning("Module %s not available!", observer.service_name)
+                self._log_unavailable_module(observer)
                 continue
 
             commands = observer.proxy.KickstartCommands
@@ -99,32 +179,110 @@ class KickstartManager(object):
                 addons=addons
             )
 
-            module_kickstart = elements.get_kickstart_from_elements(
-                module_elements
-            )
-
-            if not module_kickstart:
+            if not module_elements:
                 log.info("There are no kickstart data for %s.", observer.service_name)
                 continue
 
-            module_report = KickstartReport.from_structure(
-                observer.proxy.ReadKickstart(module_kickstart)
-            )
-
             line_references = elements.get_references_from_elements(
                 module_elements
             )
 
+            module_data = self._get_element_data(module_elements)
+
+            calls.append((observer.proxy.ReadKickstartElements, (module_data, )))
+            module_references.append((observer.service_name, line_references))
+
+        results = self._call_modules(calls)
+        reports = []
+
+        for (module_name, line_references), result in zip(module_references, results):
+            module_report = KickstartReport.from_structure(result)
+
             for message in module_report.get_messages():
                 line_number, file_name = line_references[message.line_number]
                 message.line_number = line_number
                 message.file_name = file_name
-                message.module_name = observer.service_name
+                message.module_name = module_name
 
             reports.append(module_report)
 
         return reports
 
+    def _log_unavailable_module(self, observer):
+        """Log a module that is not available."""
+        if observer.is_lazy:
+            log.debug("Module %s is not started.", observer.service_name)
+        else:
+            log.warning("Module %s not available!", observer.service_name)
+
+    def _get_element_data(self, elements):
+        """Get DBus structures of the kickstart elements.
+
+        The line numbers of the elements are lines of the kickstart
+        generated from the elements, so the line references of this
+        kickstart can be used to find the original lines.
+
+        :param elements: a list of kickstart elements
+        :return: a list of DBus structures
+        """
+        data_list = []
+        line_number = 1
+
+        for element in elements:
+            data = KickstartElementData()
+            data.args = element.args
+            data.lines = element.lines
+            data.line_number = line_number
+            data_list.append(data)
+
+            line_number += element.number_of_lines
+
+        return KickstartElementData.to_structure_list(data_list)
+
+    def _call_modules(self, calls):
+        """Call DBus methods of modules asynchronously and wait for the results.
+
+        The methods are called at once and the replies are dispatched in
+        a new main context, so no other DBus calls are processed while we
+        are waiting.
+
+        :param calls: a list of DBus methods and their arguments
+        :return: a list of results in the order of the calls
+        :raise: the first error in the order of the calls
+        """
+        replies = [None] * len(calls)
+        pending = set(range(len(calls)))
+
+        def callback(call, index):
+            pending.discard(index)
+
+            try:
+                replies[index] = (call(), None)
+            except Exception as e:  # pylint: disable=broad-except
+                replies[index] = (None, e)
+
+        context = create_new_context()
+        context.push_thread_default()
+
+        try:
+            for index, (method, args) in enumerate(calls):
+                method(*args, callback=callback, callback_args=(index, ))
+
+            while pending:
+                context.iteration(True)
+        finally:
+            context.pop_thread_default()
+
+        results = []
+
+        for result, error in replies:
+            if error:
+                raise error
+
+            results.append(result)
+
+        return results
+
     def _merge_module_reports(self, report, module_reports):
         """Merge the module reports into the final report."""
         for module_report in module_reports:
@@ -136,26 +294,31 @@ class KickstartManager(object):
 
         :return: a kickstart string
         """
-        kickstarts = self._generate_from_modules()
+        with trace_span("Generate the kickstart"):
+            kickstarts = self._generate_from_modules()
+
         return self._merge_module_kickstarts(kickstarts)
 
     def _generate_from_modules(self):
         """Generate kickstart from modules.
 
+        The kickstart is generated by all modules at once.
+
         :return: a map of module names and kickstart strings
         """
-        result = {}
+        calls = []
+        module_names = []
 
         for observer in self._module_observers:
             if not observer.is_service_available:
-                log.warning("Module %s not available!", observer.service_name)
+                self._log_unavailable_module(observer)
                 continue
 
-            module_name = observer.service_name
-            module_kickstart = observer.proxy.GenerateKickstart()
-            result[module_name] = module_kickstart
+            calls.append((observer.proxy.GenerateKickstart, ()))
+            module_names.append(observer.service_name)
 
-        return result
+        results = self._call_modules(calls)
+        return dict(zip(module_names, results))
 
     def _merge_module_kickstarts(self, module_kickstarts):
         """Merge kickstart from modules
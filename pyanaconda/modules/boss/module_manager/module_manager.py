@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+import time
+
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.signal import Signal
 from pyanaconda.core.dbus import DBus
@@ -31,6 +33,8 @@ class ModuleManager(object):
     def __init__(self):
         self._module_observers = []
         self.module_observers_changed = Signal()
+        self._start_time = None
+        self._locale = None
 
     @property
     def module_observers(self):
@@ -40,14 +44,35 @@ class ModuleManager(object):
     def set_module_observers(self, observers):
         """Set the module observers."""
         self._module_observers = observers
+
+        for observer in self._module_observers:
+            if not observer.is_lazy:
+                continue
+
+            observer.service_available.connect(self._lazy_module_available_callback)
+
         self.module_observers_changed.emit(self._module_observers)
 
+    def _lazy_module_available_callback(self, observer):
+        """Set up a module that was started on demand."""
+        log.info("%s was started on demand after %.2f seconds.",
+                 observer, time.time() - self._start_time)
+
+        if self._locale:
+            observer.proxy.SetLocale(self._locale)
+
     def start_modules_with_task(self):
-        """Start modules with the task."""
+        """Start modules with the task.
+
+        The lazy modules are started later on demand.
+        """
+        self._start_time = time.time()
+
         task = StartModulesTask(
             DBus,
             conf.anaconda.kickstart_modules,
-            conf.anaconda.addons_enabled
+            conf.anaconda.addons_enabled,
+            conf.anaconda.lazy_kickstart_modules
         )
         task.succeeded_signal.connect(
             lambda: self.set_module_observers(task.get_result())
@@ -55,14 +80,17 @@ class ModuleManager(object):
         return task
 
     def get_service_names(self):
-        """Get service names of running modules.
+        """Get service names of available modules.
+
+        The lazy modules are available even if they are not
+        running yet, because they are started on the first access.
 
         :return: a list of service names
         """
         names = []
 
         for observer in self.module_observers:
-            if not observer.is_service_available:
+            if not observer.is_service_available and not observer.is_lazy:
                 continue
 
             names.append(observer.service_name)
@@ -75,7 +103,13 @@ class ModuleManager(object):
         :param str locale: locale to set
         """
         log.info("Setting locale of all modules to %s.", locale)
+        self._locale = locale
+
         for observer in self.module_observers:
+            if not observer.is_service_available and observer.is_lazy:
+                log.debug("%s will get the locale once it is started.", observer)
+                continue
+
             if not observer.is_service_available:
                 log.warning("%s is not available when setting locale", observer)
                 continue
@@ -14,7 +14,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+import importlib
+
 from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.core.kickstart import KickstartSpecification
+from pyanaconda.modules.common.constants.namespaces import MODULES_NAMESPACE
 from dasbus.namespace import get_namespace_from_name, get_dbus_path
 from dasbus.client.observer import DBusObserver, DBusObserverError
 
@@ -24,16 +28,18 @@ log = get_module_logger(__name__)
 class ModuleObserver(DBusObserver):
     """Observer of an Anaconda module."""
 
-    def __init__(self, message_bus, service_name, is_addon=False):
+    def __init__(self, message_bus, service_name, is_addon=False, is_lazy=False):
         """Creates a module observer.
 
         :param message_bus: a message bus
         :param service_name: a DBus name of a service
         :param is_addon: is the observed module an addon?
+        :param is_lazy: is the observed module started on demand?
         """
         super().__init__(message_bus, service_name)
         self._proxy = None
         self._is_addon = is_addon
+        self._is_lazy = is_lazy
         self._namespace = get_namespace_from_name(service_name)
         self._object_path = get_dbus_path(*self._namespace)
 
@@ -45,6 +51,45 @@ class ModuleObserver(DBusObserver):
         """
         return self._is_addon
 
+    @property
+    def is_lazy(self):
+        """Is the observed module started on demand?
+
+        :return: True or False
+        """
+        return self._is_lazy
+
+    @property
+    def kickstart_specification(self):
+        """Kickstart specification of the observed module.
+
+        The specification is looked up in the kickstart module
+        of the Python package that implements the observed module,
+        so we don't have to start the module to get it.
+
+        :return: a subclass of KickstartSpecification or None
+        """
+        if self._namespace[:-1] != MODULES_NAMESPACE:
+            return None
+
+        module_name = "pyanaconda.modules.{}.kickstart".format(
+            self._namespace[-1].lower()
+        )
+
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            log.warning("Failed to import %s: %s", module_name, e)
+            return None
+
+        for value in vars(module).values():
+            if isinstance(value, type) \
+                    and issubclass(value, KickstartSpecification) \
+                    and value.__module__ == module_name:
+                return value
+
+        return None
+
     @property
     def proxy(self):
         """Returns a proxy of the remote object."""
@@ -58,8 +103,19 @@ class ModuleObserver(DBusObserver):
 
         return self._proxy
 
+    def set_service_started(self):
+        """Set the service as available after it was started.
+
+        Call this method if the service was started synchronously,
+        so it can be used before the name watcher is notified.
+        """
+        self._enable_service()
+
     def _enable_service(self):
         """Enable the service."""
+        if self._is_service_available:
+            return
+
         self._proxy = None
         super()._enable_service()
 
@@ -16,9 +16,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+import time
 from queue import SimpleQueue
 
 from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.core.trace import tracer
 from dasbus.constants import DBUS_FLAG_NONE, DBUS_START_REPLY_SUCCESS
 from dasbus.namespace import get_dbus_name
 from pyanaconda.modules.boss.module_manager import ModuleObserver
@@ -37,21 +39,28 @@ class StartModulesTask(Task):
     The timeout service_start_timeout from the Anaconda bus
     configuration file is applied by default when the DBus
     method StartServiceByName is called.
+
+    Lazy modules are not started by the task. They are only
+    observed, so they can be used once they are started on
+    demand.
     """
 
-    def __init__(self, message_bus, module_names, addons_enabled):
+    def __init__(self, message_bus, module_names, addons_enabled, lazy_module_names=()):
         """Create a new task.
 
         :param message_bus: a message bus
         :param module_names: a list of DBus names of modules
         :param addons_enabled: True to enable addons, otherwise False
+        :param lazy_module_names: a list of DBus names of modules started on demand
         """
         super().__init__()
         self._message_bus = message_bus
         self._module_names = module_names
         self._addons_enabled = addons_enabled
+        self._lazy_module_names = set(lazy_module_names)
         self._module_observers = []
         self._callbacks = SimpleQueue()
+        self._start_time = None
 
     @property
     def name(self):
@@ -66,11 +75,16 @@ class StartModulesTask(Task):
         # Collect the modules.
         self._module_observers = self._find_modules() + self._find_addons()
 
-        # All modules are unavailable now.
-        unavailable = set(self._module_observers)
+        # Observe the lazy modules.
+        lazy = [o for o in self._module_observers if o.is_lazy]
+        self._observe_modules(lazy)
+
+        # All other modules are unavailable now.
+        unavailable = set(self._module_observers) - set(lazy)
 
         # Asynchronously start the modules.
-        self._start_modules(self._module_observers)
+        self._start_time = time.monotonic()
+        self._start_modules([o for o in self._module_observers if not o.is_lazy])
 
         # Process callbacks of the asynchronous calls until all modules
         # are available. A callback returns an observer of an available
@@ -80,8 +94,13 @@ class StartModulesTask(Task):
             callback = self._callbacks.get()
             unavailable.discard(callback())
 
+        log.info("Modules are available after %.2f seconds.", self._get_elapsed_time())
         return self._module_observers
 
+    def _get_elapsed_time(self):
+        """Get seconds elapsed since the modules were started."""
+        return time.monotonic() - self._start_time
+
     def _find_modules(self):
         """Find modules."""
         modules = []
@@ -90,7 +109,8 @@ class StartModulesTask(Task):
             log.debug("Found %s.", service_name)
             modules.append(ModuleObserver(
                 self._message_bus,
-                service_name
+                service_name,
+                is_lazy=service_name in self._lazy_module_names
             ))
 
         return modules
@@ -119,6 +139,12 @@ class StartModulesTask(Task):
 
         return modules
 
+    def _observe_modules(self, module_observers):
+        """Observe the modules without starting them."""
+        for observer in module_observers:
+            log.debug("%s will be started on demand.", observer)
+            observer.connect_once_available()
+
     def _start_modules(self, module_observers):
         """Start the modules."""
         dbus = self._message_bus.proxy
@@ -161,6 +187,13 @@ class StartModulesTask(Task):
 
     def _service_available_handler(self, observer):
         """Handler for the service_available signal."""
-        log.debug("%s is available.", observer)
         observer.proxy.Ping()
+        log.info("%s is available after %.2f seconds.", observer, self._get_elapsed_time())
+
+        tracer.add_span(
+            "Start {}".format(observer.service_name),
+            start=self._start_time,
+            end=time.monotonic(),
+            category="module"
+        )
         return observer
@@ -58,3 +58,8 @@ def init(log_filename=None, log_stream=sys.stderr):
     from pyanaconda.anaconda_loggers import get_module_logger
     log = get_module_logger(__name__)
     log.debug("The configuration is loaded from: %s", conf.get_sources())
+
+    if conf.anaconda.tracing:
+        from pyanaconda.core.trace import tracer
+        main_spec = getattr(sys.modules["__main__"], "__spec__", None)
+        tracer.enable(main_spec.parent if main_spec else "module")
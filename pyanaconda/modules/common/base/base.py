@@ -220,6 +220,26 @@ class KickstartService(Service, KickstartBaseModule):
         :return: a kickstart report
         """
         log.debug("Reading kickstart...")
+        return self._read_kickstart(lambda parser: parser.readKickstartFromString(s))
+
+    def read_kickstart_elements(self, elements):
+        """Read the given pre-parsed kickstart elements.
+
+        The elements should contain only commands and sections
+        that are defined by the kickstart specification.
+
+        :param elements: a list of kickstart element data
+        :return: a kickstart report
+        """
+        log.debug("Reading kickstart elements...")
+        return self._read_kickstart(lambda parser: parser.read_elements(elements))
+
+    def _read_kickstart(self, read):
+        """Read the kickstart with the given function.
+
+        :param read: a function that reads the kickstart with the given parser
+        :return: a kickstart report
+        """
         report = KickstartReport()
 
         try:
@@ -229,7 +249,7 @@ class KickstartService(Service, KickstartBaseModule):
             with warnings.catch_warnings(record=True) as warns:
                 warnings.simplefilter(action="always", category=KickstartParseWarning)
 
-                parser.readKickstartFromString(s)
+                read(parser)
                 self.process_kickstart(handler)
 
                 for warn in warns:
@@ -23,7 +23,8 @@ from dasbus.server.property import emits_properties_changed
 from dasbus.typing import *  # pylint: disable=wildcard-import
 from dasbus.server.interface import dbus_interface
 from pyanaconda.modules.common.containers import TaskContainer
-from pyanaconda.modules.common.structures.kickstart import KickstartReport
+from pyanaconda.modules.common.structures.kickstart import KickstartReport, \
+    KickstartElementData
 from pyanaconda.modules.common.structures.requirement import Requirement
 
 
@@ -89,6 +90,19 @@ class KickstartModuleInterface(KickstartModuleInterfaceTemplate):
             self.implementation.read_kickstart(kickstart)
         )
 
+    @emits_properties_changed
+    def ReadKickstartElements(self, elements: List[Structure]) -> Structure:
+        """Read the pre-parsed kickstart elements.
+
+        :param elements: a list of structures with kickstart elements
+        :returns: a structure with a kickstart report
+        """
+        return KickstartReport.to_structure(
+            self.implementation.read_kickstart_elements(
+                KickstartElementData.from_structure_list(elements)
+            )
+        )
+
     def GenerateKickstart(self) -> Str:
         """Return a kickstart representation of the module
 
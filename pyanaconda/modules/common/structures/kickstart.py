@@ -19,7 +19,59 @@
 from dasbus.structure import DBusData
 from dasbus.typing import *  # pylint: disable=wildcard-import
 
-__all__ = ["KickstartMessage", "KickstartReport"]
+__all__ = ["KickstartElementData", "KickstartMessage", "KickstartReport"]
+
+
+class KickstartElementData(DBusData):
+    """The pre-parsed kickstart element.
+
+    The element is a command, a section or an addon split from
+    the kickstart file by the Boss.
+    """
+
+    def __init__(self):
+        self._args = []
+        self._lines = []
+        self._line_number = 0
+
+    @property
+    def args(self) -> List[Str]:
+        """Tokens of the command or of the section header.
+
+        :return: a list of strings
+        """
+        return self._args
+
+    @args.setter
+    def args(self, value: List[Str]):
+        self._args = list(value)
+
+    @property
+    def lines(self) -> List[Str]:
+        """Lines of the element.
+
+        The command line for a command or the body lines
+        for a section or an addon.
+
+        :return: a list of strings
+        """
+        return self._lines
+
+    @lines.setter
+    def lines(self, value: List[Str]):
+        self._lines = list(value)
+
+    @property
+    def line_number(self) -> UInt32:
+        """Number of the first line of the element.
+
+        :return: a number
+        """
+        return UInt32(self._line_number)
+
+    @line_number.setter
+    def line_number(self, value: UInt32):
+        self._line_number = value
 
 
 class KickstartMessage(DBusData):
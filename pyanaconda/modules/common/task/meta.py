@@ -16,6 +16,7 @@
 # Red Hat, Inc.
 #
 from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.core.constants import TASK_RESOURCE_ALL
 from pyanaconda.modules.common.task import AbstractTask
 
 log = get_module_logger(__name__)
@@ -24,20 +25,34 @@ __all__ = ['DBusMetaTask']
 
 
 class DBusMetaTask(AbstractTask):
-    """A task that runs DBus tasks."""
+    """A task that runs DBus tasks.
 
-    def __init__(self, name, tasks):
+    By default, the subtasks run one by one in the given order. In the
+    parallel mode, a subtask starts as soon as all previous subtasks that
+    share a resource with it or that it requires are stopped, so independent
+    subtasks run at the same time. The resources and the required tasks are
+    declared by the Resources and Prerequisites properties of the subtasks.
+    Subtasks that don't declare any resources run one by one.
+    """
+
+    def __init__(self, name, tasks, parallel=False):
         """Create a new meta task.
 
         :param name: a name of the meta task
         :param tasks: a list of proxies to DBus tasks
+        :param parallel: should be independent tasks run in parallel?
         """
         super().__init__()
         self._name = name
         self._subtasks = tasks
-        self._current_subtask = None
+        self._parallel = parallel
+        self._pending_subtasks = []
+        self._running_subtasks = []
+        self._last_subtask = None
+        self._failed_subtask = None
         self._total_steps = self._count_steps()
         self._finished_steps = 0
+        self._subtask_steps = {}
 
     @property
     def name(self):
@@ -56,77 +71,141 @@ class DBusMetaTask(AbstractTask):
     @property
     def is_running(self):
         """Is the meta task running?"""
-        return bool(self._current_subtask and self._current_subtask.IsRunning)
+        return any(subtask.IsRunning for subtask, _ in self._running_subtasks)
+
+    def _get_resources(self, subtask):
+        """Get resources required by the subtask.
+
+        :param subtask: a proxy of the DBus task
+        :return: a set of resources
+        """
+        if not self._parallel:
+            return {TASK_RESOURCE_ALL}
+
+        return set(subtask.Resources)
+
+    def _get_prerequisites(self, subtask):
+        """Get names of tasks required by the subtask.
+
+        :param subtask: a proxy of the DBus task
+        :return: a set of task names
+        """
+        if not self._parallel:
+            return set()
+
+        return set(subtask.Prerequisites)
+
+    @staticmethod
+    def _is_conflicting(resources, other_resources):
+        """Do the resources conflict?"""
+        if TASK_RESOURCE_ALL in resources or TASK_RESOURCE_ALL in other_resources:
+            return True
+
+        return bool(resources & other_resources)
 
     def start(self):
         """Start the meta task."""
         log.info("'%s' has started.", self.name)
+        self._pending_subtasks = [
+            (t, self._get_resources(t), self._get_prerequisites(t)) for t in self._subtasks
+        ]
         self._task_started_callback()
         self._task_run_callback()
 
     def _task_run_callback(self):
-        """Start the next task."""
-        if self._current_subtask:
-            self._disconnect(self._current_subtask)
-
+        """Start the next tasks."""
         if self.check_cancel():
-            log.info("'%s' is canceled.", self.name)
-            self._task_stopped_callback()
+            if not self._running_subtasks:
+                log.info("'%s' is canceled.", self.name)
+                self._task_stopped_callback()
             return
 
-        if not self._subtasks:
+        if not self._pending_subtasks and not self._running_subtasks:
             log.info("'%s' is complete.", self.name)
             self._task_succeeded_callback()
             self._task_stopped_callback()
             return
 
-        self._current_subtask = self._subtasks.pop(0)
-        self._connect(self._current_subtask)
-        self._current_subtask.Start()
+        # Resources and names of the running and the previous pending tasks.
+        occupied = [resources for _, resources in self._running_subtasks]
+        unfinished = {subtask.Name for subtask, _ in self._running_subtasks}
+
+        for item in list(self._pending_subtasks):
+            subtask, resources, prerequisites = item
+            blocked = prerequisites & unfinished \
+                or any(self._is_conflicting(resources, r) for r in occupied)
+
+            occupied.append(resources)
+            unfinished.add(subtask.Name)
+
+            if blocked:
+                continue
+
+            self._pending_subtasks.remove(item)
+            self._running_subtasks.append((subtask, resources))
+            self._subtask_steps[id(subtask)] = 0
+            self._connect(subtask)
+            subtask.Start()
 
     def _connect(self, subtask):
-        """Connect to signals of the current task."""
-        subtask.Started.connect(self._subtask_started_callback)
-        subtask.Failed.connect(self._subtask_failed_callback)
-        subtask.Stopped.connect(self._subtask_stopped_callback)
-        subtask.ProgressChanged.connect(self._subtask_progress_changed)
+        """Connect to signals of the task."""
+        subtask.Started.connect(lambda: self._subtask_started_callback(subtask))
+        subtask.Failed.connect(lambda: self._subtask_failed_callback(subtask))
+        subtask.Stopped.connect(lambda: self._subtask_stopped_callback(subtask))
+        subtask.ProgressChanged.connect(
+            lambda step, msg: self._subtask_progress_changed(subtask, step, msg)
+        )
 
     def _disconnect(self, subtask):
-        """Disconnect from signals of the previous task."""
+        """Disconnect from signals of the task."""
         subtask.Started.disconnect()
         subtask.Failed.disconnect()
         subtask.Stopped.disconnect()
         subtask.ProgressChanged.disconnect()
 
-    def _subtask_started_callback(self):
-        log.info("'%s' has started.", self._current_subtask.Name)
+    def _subtask_started_callback(self, subtask):
+        log.info("'%s' has started.", subtask.Name)
+
+    def _subtask_failed_callback(self, subtask):
+        log.info("'%s' has failed.", subtask.Name)
 
-    def _subtask_failed_callback(self):
-        log.info("'%s' has failed.", self._current_subtask.Name)
+        # Report only the first failure.
+        if self._failed_subtask:
+            return
+
+        self._failed_subtask = subtask
         self._task_failed_callback()
         self.cancel()
 
-    def _subtask_stopped_callback(self):
-        log.info("'%s' has stopped.", self._current_subtask.Name)
-        self._finished_steps += self._current_subtask.Steps
+    def _subtask_stopped_callback(self, subtask):
+        log.info("'%s' has stopped.", subtask.Name)
+        self._disconnect(subtask)
+        self._running_subtasks = [(t, r) for t, r in self._running_subtasks if t is not subtask]
+        self._subtask_steps.pop(id(subtask), None)
+        self._finished_steps += subtask.Steps
+        self._last_subtask = subtask
         self._task_run_callback()
 
-    def _subtask_progress_changed(self, step, msg):
-        log.debug("%s (%s/%s)", msg, step, self.steps)
-        self.report_progress(msg, step_number=self._finished_steps + step)
+    def _subtask_progress_changed(self, subtask, step, msg):
+        self._subtask_steps[id(subtask)] = step
+        step_number = self._finished_steps + sum(self._subtask_steps.values())
+        log.debug("%s (%s/%s)", msg, step_number, self.steps)
+        self.report_progress(msg, step_number=step_number)
 
     def cancel(self):
         """Cancel the meta task."""
         super().cancel()
 
-        if self._current_subtask:
-            self._current_subtask.Cancel()
+        for subtask, _ in self._running_subtasks:
+            subtask.Cancel()
 
     def finish(self):
         """Finish the meta task.
 
         If the meta task failed, we should raise an error
-        from the last running task.
+        from the failed task.
         """
-        if self._current_subtask:
-            self._current_subtask.Finish()
+        subtask = self._failed_subtask or self._last_subtask
+
+        if subtask:
+            subtask.Finish()
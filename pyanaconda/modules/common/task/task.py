@@ -23,7 +23,8 @@
 import traceback
 from abc import abstractmethod
 
-from pyanaconda.core.constants import THREAD_DBUS_TASK
+from pyanaconda.core.constants import THREAD_DBUS_TASK, TASK_RESOURCE_ALL
+from pyanaconda.core.trace import trace_span
 from dasbus.server.publishable import Publishable
 
 from pyanaconda.modules.common.errors.task import NoResultError
@@ -54,6 +55,30 @@ class AbstractTask(Runnable, Cancellable, Publishable, ProgressReporter, ResultP
         """
         return ""
 
+    @property
+    def resources(self):
+        """Resources required by this task.
+
+        Tasks that don't share any resources can run in parallel.
+        For example: ["sysroot-rpmdb", "network"]
+
+        By default, the task conflicts with all other tasks.
+
+        :returns: a list of resource names
+        """
+        return [TASK_RESOURCE_ALL]
+
+    @property
+    def prerequisites(self):
+        """Names of tasks required by this task.
+
+        The task doesn't start until all previous tasks with
+        these names are stopped.
+
+        :returns: a list of task names
+        """
+        return []
+
     def for_publication(self):
         """Return a DBus representation."""
         return TaskInterface(self)
@@ -94,7 +119,10 @@ class Task(AbstractTask):
     def _task_run_callback(self):
         """Report the first step and run the task."""
         self.report_progress(self.name, step_number=1)
-        self._set_result(self.run())
+
+        with trace_span(self.name, category="task"):
+            self._set_result(self.run())
+
         self._task_succeeded_callback()
 
     def _task_succeeded_callback(self):
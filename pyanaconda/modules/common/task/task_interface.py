@@ -73,6 +73,22 @@ class TaskInterface(InterfaceTemplate):
         """Get total number of steps for this task."""
         return self.implementation.steps
 
+    @property
+    def Resources(self) -> List[Str]:
+        """Get names of resources required by this task.
+
+        Tasks that don't share any resources can run in parallel.
+        """
+        return self.implementation.resources
+
+    @property
+    def Prerequisites(self) -> List[Str]:
+        """Get names of tasks required by this task.
+
+        The task doesn't start until the required tasks are stopped.
+        """
+        return self.implementation.prerequisites
+
     @property
     def IsRunning(self) -> Bool:
         """Return True if this Task is running already."""
@@ -21,11 +21,11 @@ from pyanaconda.modules.common.constants.services import BOSS
 
 
 def is_module_available(module_service_identifier):
-    """Check if the module appears to be running.
+    """Check if the module appears to be running or can be started on demand.
 
     :param module_service_identifier: module service identifier to check
     :type module_service_identifier: DBusServiceIdentifier instance
-    :return: True if module is running, False otherwise
+    :return: True if module is available, False otherwise
     :rtype: bool
     """
     boss_proxy = BOSS.get_proxy()
@@ -28,6 +28,12 @@ from pyanaconda.core.kickstart import KickstartSpecification, commands as COMMAN
 
 class AnacondaPackageSection(PackageSection):
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._package_lines = []
+        self._included_packages = set()
+        self._excluded_packages = set()
+
     def handleHeader(self, lineno, args):
         """Process packages section header.
 
@@ -42,6 +48,51 @@ class AnacondaPackageSection(PackageSection):
                 lineno=lineno
             )
 
+    def handleLine(self, line):
+        """Process a line of the packages section.
+
+        The packages are added in batches, because every call of the add
+        method sorts the whole lists of packages. A batch is flushed before
+        a package is both included and excluded in it and before groups and
+        environments, so the result is the same as if the lines were added
+        one by one.
+        """
+        line = line.partition('#')[0].rstrip()
+        name = line.strip()
+
+        if not name or name.startswith(("@", "-@")):
+            self._add_packages()
+            self.handler.packages.add([line])
+            return
+
+        if name.startswith("-"):
+            conflict = name[1:] in self._included_packages
+            self._excluded_packages.add(name[1:])
+        else:
+            conflict = name in self._excluded_packages
+            self._included_packages.add(name)
+
+        if conflict:
+            self._add_packages()
+            self.handleLine(line)
+            return
+
+        self._package_lines.append(line)
+
+    def finalize(self):
+        """Process the end of the packages section."""
+        self._add_packages()
+        super().finalize()
+
+    def _add_packages(self):
+        """Add the batch of package lines."""
+        if self._package_lines:
+            self.handler.packages.add(self._package_lines)
+
+        self._package_lines = []
+        self._included_packages = set()
+        self._excluded_packages = set()
+
 
 class PayloadKickstartSpecification(KickstartSpecification):
 
@@ -0,0 +1,399 @@
+#
+# Copyright (C) 2020 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from blivet.size import Size
+from requests.exceptions import RequestException
+
+from pyanaconda.core.constants import NETWORK_CONNECTION_TIMEOUT
+
+from pyanaconda.anaconda_loggers import get_module_logger
+log = get_module_logger(__name__)
+
+__all__ = ["DownloadProgress", "ImageDownloader"]
+
+# Size of a downloaded chunk. The incomplete chunk is lost on errors.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maximal number of parallel ranged requests.
+DOWNLOAD_SEGMENTS = 4
+
+# Minimal size of a segment downloaded by one request.
+DOWNLOAD_MIN_SEGMENT_SIZE = 64 * 1024 * 1024
+
+# Number of attempts to resume a failed request.
+DOWNLOAD_RETRIES = 5
+
+# Delay in seconds before the next attempt.
+DOWNLOAD_RETRY_DELAY = 2
+
+
+class DownloadProgress(object):
+    """Provide methods for download progress reporting."""
+
+    def __init__(self, url, size, report_callback):
+        """Create a progress object for given task.
+
+        :param url: url of the download
+        :type url: str
+        :param size: length of the file
+        :type size: int
+        :param report_callback: callback with progress message argument
+        :type report_callback: callable taking str argument
+        """
+        self.report = report_callback
+        self.url = url
+        self.size = size
+        self._pct = -1
+        self._start_time = time.time()
+
+    def _get_speed(self, bytes_read):
+        """Get the average download speed in bytes per second."""
+        elapsed = time.time() - self._start_time
+
+        if elapsed <= 0:
+            return 0
+
+        return bytes_read / elapsed
+
+    def update(self, bytes_read):
+        """Download update.
+
+        :param bytes_read: Bytes read so far
+        :type bytes_read:  int
+        """
+        if not bytes_read:
+            return
+        pct = min(100, int(100 * bytes_read / self.size))
+
+        if pct == self._pct:
+            return
+        self._pct = pct
+        self.report("Downloading image %(url)s (%(pct)d%%, %(speed)s/s)" %
+                    {"url": self.url, "pct": pct,
+                     "speed": Size(int(self._get_speed(bytes_read)))})
+
+    def end(self):
+        """Download complete."""
+        self.report("Downloading image %(url)s (%(pct)d%%)" %
+                    {"url": self.url, "pct": 100})
+
+
+class _RangesIgnoredError(Exception):
+    """The server ignored a range request."""
+
+
+class _Segment(object):
+    """A continuous part of the downloaded file."""
+
+    def __init__(self, start, end=None):
+        """Create a new segment.
+
+        :param start: an offset of the first byte
+        :param end: an offset after the last byte or None if unknown
+        """
+        self.start = start
+        self.end = end
+        self.offset = start
+
+    @property
+    def done(self):
+        """Is the segment downloaded?"""
+        return self.end is not None and self.offset >= self.end
+
+    def __repr__(self):
+        return "_Segment({}, {}, offset={})".format(self.start, self.end, self.offset)
+
+
+class ImageDownloader(object):
+    """Downloader of installation images.
+
+    If the server supports HTTP range requests, the image is split into
+    segments that are downloaded in parallel and every failed request is
+    resumed from the last received byte. The SHA256 sum of the image is
+    calculated while the data are downloaded, so the image doesn't have
+    to be read again.
+    """
+
+    def __init__(self, session, url, image_path, proxies=None, verify=True,
+                 report_callback=None, segments=DOWNLOAD_SEGMENTS,
+                 min_segment_size=DOWNLOAD_MIN_SEGMENT_SIZE, retries=DOWNLOAD_RETRIES,
+                 retry_delay=DOWNLOAD_RETRY_DELAY):
+        """Create a new downloader.
+
+        :param session: Requests session for the download
+        :param url: an url of the image
+        :param image_path: a destination path of the image
+        :param proxies: a dictionary of proxies
+        :param verify: should be the ssl certificates verified?
+        :param report_callback: a callback for the progress messages or None
+        :param segments: a maximal number of parallel requests
+        :param min_segment_size: a minimal size of a segment in bytes
+        :param retries: a number of attempts to resume a failed request
+        :param retry_delay: a delay in seconds before the next attempt
+        """
+        self._session = session
+        self._url = url
+        self._image_path = image_path
+        self._proxies = proxies or {}
+        self._verify = verify
+        self._report_callback = report_callback
+        self._max_segments = max(segments, 1)
+        self._min_segment_size = min_segment_size
+        self._retries = retries
+        self._retry_delay = retry_delay
+
+        self._lock = threading.Lock()
+        self._failed = threading.Event()
+        self._fd = None
+        self._segments = []
+        self._progress = None
+        self._downloaded = 0
+        self._sha256 = None
+        self._hashed = 0
+        self._hashed_index = 0
+
+    def _request(self, method, headers=None):
+        """Send a request for the image."""
+        return self._session.request(
+            method,
+            self._url,
+            headers=headers,
+            proxies=self._proxies,
+            verify=self._verify,
+            stream=True,
+            timeout=NETWORK_CONNECTION_TIMEOUT
+        )
+
+    def _get_image_info(self):
+        """Get the size of the image and the support of ranges.
+
+        :return: a tuple of the size or None and True if ranges are supported
+        """
+        try:
+            response = self._request("HEAD")
+            response.raise_for_status()
+        except RequestException as e:
+            log.debug("Failed to get info about %s: %s", self._url, e)
+            return None, False
+
+        size = response.headers.get("content-length")
+        size = int(size) if size else None
+        ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+        return size, ranges
+
+    def _split_into_segments(self, size, ranges):
+        """Split the image into segments.
+
+        :param size: a size of the image or None
+        :param ranges: are the range requests supported?
+        :return: a list of segments
+        """
+        if not size or not ranges:
+            return [_Segment(0, size)]
+
+        count = min(self._max_segments, max(size // self._min_segment_size, 1))
+        step = size // count
+        bounds = [i * step for i in range(count)] + [size]
+        return [_Segment(bounds[i], bounds[i + 1]) for i in range(count)]
+
+    def _create_progress(self, size):
+        """Create the progress reporting if the size is known."""
+        if self._progress or not self._report_callback or not size:
+            return
+
+        self._progress = DownloadProgress(self._url, int(size), self._report_callback)
+
+    def _update_hash(self, offset, data):
+        """Update the checksum with the downloaded data.
+
+        The data have to be hashed in the order of the file. The data
+        at the current position are hashed from the memory, the data of
+        the following segments are read back from the file once all
+        previous segments are hashed.
+
+        :param offset: an offset of the data in the file
+        :param data: the downloaded data
+        """
+        if offset == self._hashed:
+            self._sha256.update(data)
+            self._hashed += len(data)
+
+        while self._hashed_index < len(self._segments):
+            segment = self._segments[self._hashed_index]
+
+            if segment.done and self._hashed >= segment.end:
+                self._hashed_index += 1
+                continue
+
+            if segment.offset <= self._hashed:
+                break
+
+            length = min(segment.offset - self._hashed, DOWNLOAD_CHUNK_SIZE)
+            self._sha256.update(os.pread(self._fd, length, self._hashed))
+            self._hashed += length
+
+    def _write(self, segment, data):
+        """Write the downloaded data of the segment."""
+        os.pwrite(self._fd, data, segment.offset)
+
+        with self._lock:
+            offset = segment.offset
+            segment.offset += len(data)
+            self._downloaded += len(data)
+            self._update_hash(offset, data)
+
+            if self._progress:
+                self._progress.update(self._downloaded)
+
+    def _restart(self, segment):
+        """Download the segment again from the beginning.
+
+        This is possible only for a single segment of the whole file.
+        """
+        with self._lock:
+            os.ftruncate(self._fd, 0)
+            self._downloaded = 0
+            self._sha256 = hashlib.sha256()
+            self._hashed = 0
+            self._hashed_index = 0
+            segment.offset = segment.start
+
+    def _download_segment(self, segment, ranges):
+        """Download the segment.
+
+        :param segment: a segment to download
+        :param ranges: are the range requests supported?
+        :raise: _RangesIgnoredError if the server ignores a range request
+        """
+        attempt = 0
+
+        while not segment.done and not self._failed.is_set():
+            headers = {}
+
+            if ranges and segment.end is not None:
+                headers["Range"] = "bytes={}-{}".format(segment.offset, segment.end - 1)
+            elif ranges and segment.offset:
+                headers["Range"] = "bytes={}-".format(segment.offset)
+            elif segment.offset:
+                self._restart(segment)
+
+            try:
+                response = self._request("GET", headers)
+
+                with response:
+                    response.raise_for_status()
+
+                    if headers and response.status_code != 206:
+                        self._failed.set()
+                        raise _RangesIgnoredError(
+                            "Unexpected response status: {}".format(response.status_code)
+                        )
+
+                    if not headers and not self._progress:
+                        self._create_progress(response.headers.get("content-length"))
+
+                    for buf in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        if self._failed.is_set():
+                            return
+
+                        if buf:
+                            self._write(segment, buf)
+
+                if segment.end is None:
+                    segment.end = segment.offset
+
+            except (RequestException, OSError) as e:
+                attempt += 1
+
+                if attempt > self._retries:
+                    self._failed.set()
+                    raise
+
+                log.warning("Failed to download %s from %s (attempt %d): %s",
+                            self._url, segment.offset, attempt, e)
+                time.sleep(self._retry_delay)
+
+    def _download_segments(self, segments, ranges, size):
+        """Download the segments in parallel.
+
+        :param segments: a list of segments to download
+        :param ranges: are the range requests supported?
+        :param size: a size of the image or None
+        """
+        self._segments = segments
+        self._failed.clear()
+        self._downloaded = 0
+        self._sha256 = hashlib.sha256()
+        self._hashed = 0
+        self._hashed_index = 0
+
+        os.ftruncate(self._fd, 0)
+
+        if size:
+            os.ftruncate(self._fd, size)
+
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            futures = [
+                executor.submit(self._download_segment, segment, ranges)
+                for segment in segments
+            ]
+
+            for future in futures:
+                future.result()
+
+    def download(self):
+        """Download the image.
+
+        :return: a SHA256 sum of the image
+        :raise: RequestException or OSError if the download fails
+        """
+        size, ranges = self._get_image_info()
+        segments = self._split_into_segments(size, ranges)
+
+        self._create_progress(size)
+
+        log.info("Downloading %s in %d segment(s).", self._url, len(segments))
+        self._fd = os.open(self._image_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+
+        try:
+            try:
+                self._download_segments(segments, ranges, size)
+            except _RangesIgnoredError as e:
+                # The server announced the support of ranges, but it doesn't
+                # support them. Download the whole image in a single request.
+                log.warning("Failed to download %s in segments: %s", self._url, e)
+                self._download_segments([_Segment(0, size)], False, size)
+
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+        # Fake the progress reporting if the size was unknown.
+        self._create_progress(self._downloaded)
+
+        if self._progress:
+            self._progress.end()
+
+        checksum = self._sha256.hexdigest()
+        log.debug("sha256 of %s is %s", self._url, checksum)
+        return checksum
@@ -24,6 +24,7 @@ from pyanaconda.core.constants import NETWORK_CONNECTION_TIMEOUT, IMAGE_DIR
 from pyanaconda.core.util import lowerASCII, execWithRedirect
 from pyanaconda.modules.common.errors.payload import SourceSetupError
 from pyanaconda.modules.common.task import Task
+from pyanaconda.modules.payloads.payload.live_image.download import ImageDownloader
 from pyanaconda.modules.payloads.payload.live_image.utils import get_local_image_path_from_url, \
     get_proxies_from_option, url_target_is_tarfile
 from pyanaconda.payload.utils import mount, unmount
@@ -35,7 +36,7 @@ log = get_module_logger(__name__)
 class CheckInstallationSourceImageTask(Task):
     """Task to check installation source image and get its size."""
 
-    def __init__(self, url, proxy, session):
+    def __init__(self, url, proxy, session, streamed=False):
         """Create a new task.
 
         :param url: installation source image url
@@ -44,11 +45,14 @@ class CheckInstallationSourceImageTask(Task):
         :type proxy: str
         :param session: Requests session for image download
         :type session:
+        :param streamed: will be the image installed without download?
+        :type streamed: bool
         """
         super().__init__()
         self._url = url
         self._proxy = proxy
         self._session = session
+        self._streamed = streamed
 
     @property
     def name(self):
@@ -73,8 +77,10 @@ class CheckInstallationSourceImageTask(Task):
             # At this point we know we can get the image and what its size is
             # Make a guess as to minimum size needed:
             # Enough space for image and image * 3
+            # The streamed image is not stored, so only the image * 3 is needed.
             if response.headers.get('content-length'):
-                size = int(response.headers.get('content-length')) * 4
+                multiplier = 3 if self._streamed else 4
+                size = int(response.headers.get('content-length')) * multiplier
         except IOError as e:
             raise SourceSetupError("Error opening liveimg: {}".format(e))
         else:
@@ -143,47 +149,49 @@ class SetupInstallationSourceImageTask(Task):
         return "Set up installation source image."
 
     def _download_image(self, url, image_path, session):
-        """Download the image using Requests with progress reporting"""
-        error = None
+        """Download the image using Requests with progress reporting.
+
+        :return: a SHA256 sum of the downloaded image
+        """
+        downloader = ImageDownloader(
+            session,
+            url,
+            image_path,
+            proxies=get_proxies_from_option(self._proxy),
+            verify=not self._noverifyssl,
+            report_callback=self.report_progress
+        )
+
         try:
             log.info("Starting image download")
-            with open(image_path, "wb") as f:
-                ssl_verify = not self._noverifyssl
-                proxies = get_proxies_from_option(self._proxy)
-                response = session.get(url, proxies=proxies, verify=ssl_verify, stream=True,
-                                       timeout=NETWORK_CONNECTION_TIMEOUT)
-                total_length = response.headers.get('content-length')
-                if total_length is None:
-                    # just download the file in one go and fake the progress reporting once done
-                    log.warning("content-length header is missing for the installation image, "
-                                "download progress reporting will not be available")
-                    f.write(response.content)
-                    size = f.tell()
-                    progress = DownloadProgress(self._url, size, self.report_progress)
-                    progress.end()
-                else:
-                    # requests return headers as strings, so convert total_length to int
-                    progress = DownloadProgress(self._url, int(total_length), self.report_progress)
-                    bytes_read = 0
-                    for buf in response.iter_content(1024 * 1024):
-                        if buf:
-                            f.write(buf)
-                            f.flush()
-                            bytes_read += len(buf)
-                            progress.update(bytes_read)
-                    progress.end()
-                log.info("Image download finished")
-        except RequestException as e:
+            checksum = downloader.download()
+            log.info("Image download finished")
+        except (RequestException, OSError) as e:
             error = "Error downloading liveimg: {}".format(e)
             log.error(error)
             raise SourceSetupError(error)
-        else:
-            if not os.path.exists(image_path):
-                error = "Failed to download {}, file doesn't exist".format(self._url)
-                log.error(error)
-                raise SourceSetupError(error)
 
-    def _check_image_sum(self, image_path, checksum):
+        if not os.path.exists(image_path):
+            error = "Failed to download {}, file doesn't exist".format(self._url)
+            log.error(error)
+            raise SourceSetupError(error)
+
+        return checksum
+
+    def _check_image_sum(self, image_path, checksum, filesum=None):
+        """Check the checksum of the image.
+
+        :param image_path: a path to the image
+        :param checksum: an expected checksum
+        :param filesum: a SHA256 sum calculated during the download or None
+        """
+        if not filesum:
+            filesum = self._calculate_image_sum(image_path)
+
+        self._compare_image_sum(image_path, checksum, filesum)
+
+    def _calculate_image_sum(self, image_path):
+        """Calculate the SHA256 sum of the image."""
         self.report_progress("Checking image checksum")
         sha256 = hashlib.sha256()
         with open(image_path, "rb") as f:
@@ -194,7 +202,10 @@ class SetupInstallationSourceImageTask(Task):
                 sha256.update(data)
         filesum = sha256.hexdigest()
         log.debug("sha256 of %s is %s", image_path, filesum)
+        return filesum
 
+    def _compare_image_sum(self, image_path, checksum, filesum):
+        """Compare the expected checksum with the SHA256 sum of the image."""
         if lowerASCII(checksum) != filesum:
             log.error("%s does not match checksum of %s.", checksum, image_path)
             raise SourceSetupError("Checksum of image {} does not match".format(image_path))
@@ -245,18 +256,19 @@ class SetupInstallationSourceImageTask(Task):
 
     def run(self):
         """Run set up or installation source."""
+        filesum = None
         image_path_from_url = get_local_image_path_from_url(self._url)
         if image_path_from_url:
             self._image_path = image_path_from_url
         else:
-            self._download_image(self._url, self._image_path, self._session)
+            filesum = self._download_image(self._url, self._image_path, self._session)
 
         # TODO - do we use it at all in LiveImage
         # Used to make install progress % look correct
         # self._adj_size = os.stat(self.image_path).st_size
 
         if self._checksum:
-            self._check_image_sum(self._image_path, self._checksum)
+            self._check_image_sum(self._image_path, self._checksum, filesum)
 
         if not url_target_is_tarfile(self._url):
             self._mount_image(self._image_path, self._image_mount_point)
@@ -301,43 +313,3 @@ class TeardownInstallationSourceImageTask(Task):
         if not get_local_image_path_from_url(self._url):
             if os.path.exists(self._image_path):
                 os.unlink(self._image_path)
-
-
-class DownloadProgress(object):
-    """Provide methods for download progress reporting."""
-
-    def __init__(self, url, size, report_callback):
-        """Create a progress object for given task.
-
-        :param url: url of the download
-        :type url: str
-        :param size: length of the file
-        :type size: int
-        :param report_callback: callback with progress message argument
-        :type report_callback: callable taking str argument
-        """
-        self.report = report_callback
-        self.url = url
-        self.size = size
-        self._pct = -1
-
-    def update(self, bytes_read):
-        """Download update.
-
-        :param bytes_read: Bytes read so far
-        :type bytes_read:  int
-        """
-        if not bytes_read:
-            return
-        pct = min(100, int(100 * bytes_read / self.size))
-
-        if pct == self._pct:
-            return
-        self._pct = pct
-        self.report("Downloading image %(url)s (%(pct)d%%)" %
-                    {"url": self.url, "pct": pct})
-
-    def end(self):
-        """Download complete."""
-        self.report("Downloading image %(url)s (%(pct)d%%)" %
-                    {"url": self.url, "pct": 100})
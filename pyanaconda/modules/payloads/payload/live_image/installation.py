@@ -15,37 +15,57 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+import hashlib
+import os
+import threading
+
+from requests.exceptions import RequestException
+
 from pyanaconda.modules.common.task import Task
 from pyanaconda.modules.common.errors.payload import InstallError
-from pyanaconda.core.util import execWithRedirect
-from pyanaconda.modules.payloads.base.utils import create_rescue_image
+from pyanaconda.core.constants import NETWORK_CONNECTION_TIMEOUT
+from pyanaconda.core.util import execWithRedirect, lowerASCII
+from pyanaconda.modules.payloads.base.utils import create_rescue_image, get_kernel_version_list
+from pyanaconda.modules.payloads.payload.live_image.download import DownloadProgress
+from pyanaconda.modules.payloads.payload.live_image.utils import get_proxies_from_option, \
+    get_tar_compression_option
 
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
 
+def get_tar_arguments():
+    """Get the common arguments of tar for the payload extraction."""
+    # preserve: ACL's, xattrs, and SELinux context
+    return ["--numeric-owner", "--selinux", "--acls", "--xattrs", "--xattrs-include", "*",
+            "--exclude", "dev/*", "--exclude", "proc/*", "--exclude", "tmp/*",
+            "--exclude", "sys/*", "--exclude", "run/*", "--exclude", "boot/*rescue*",
+            "--exclude", "boot/loader", "--exclude", "boot/efi/loader",
+            "--exclude", "etc/machine-id"]
+
+
 class InstallFromTarTask(Task):
     """Task to install the payload from tarball."""
 
-    def __init__(self, tarfile_path, dest_path, kernel_version_list):
+    def __init__(self, tarfile_path, dest_path):
         super().__init__()
         self._tarfile_path = tarfile_path
         self._dest_path = dest_path
-        self._kernel_version_list = kernel_version_list
 
     @property
     def name(self):
         return "Install the payload from a tarball"
 
     def run(self):
-        """Run installation of the payload from a tarball."""
+        """Run installation of the payload from a tarball.
+
+        The kernels are found in the extracted files, so the tarball
+        doesn't have to be decompressed again to list its content.
+
+        :return: a list of installed kernel versions
+        """
         cmd = "tar"
-        # preserve: ACL's, xattrs, and SELinux context
-        args = ["--numeric-owner", "--selinux", "--acls", "--xattrs", "--xattrs-include", "*",
-                "--exclude", "dev/*", "--exclude", "proc/*", "--exclude", "tmp/*",
-                "--exclude", "sys/*", "--exclude", "run/*", "--exclude", "boot/*rescue*",
-                "--exclude", "boot/loader", "--exclude", "boot/efi/loader",
-                "--exclude", "etc/machine-id", "-xaf", self._tarfile_path, "-C", self._dest_path]
+        args = get_tar_arguments() + ["-xaf", self._tarfile_path, "-C", self._dest_path]
         try:
             rc = execWithRedirect(cmd, args)
         except (OSError, RuntimeError) as e:
@@ -60,4 +80,162 @@ class InstallFromTarTask(Task):
         if err:
             raise InstallError(err or msg)
 
-        create_rescue_image(self._dest_path, self._kernel_version_list)
+        kernel_version_list = get_kernel_version_list(self._dest_path)
+        create_rescue_image(self._dest_path, kernel_version_list)
+        return kernel_version_list
+
+
+class InstallFromTarStreamTask(Task):
+    """Task to install the payload from a remote tarball.
+
+    The tarball is extracted while it is downloaded, so it is never
+    stored on the target disk. The checksum is calculated from the
+    same stream and the installation fails if it doesn't match.
+    """
+
+    def __init__(self, url, proxy, checksum, noverifyssl, session, dest_path):
+        """Create a new task.
+
+        :param url: installation source tarball url
+        :type url: str
+        :param proxy: proxy to be used to fetch the tarball
+        :type proxy: str
+        :param checksum: checksum of the tarball
+        :type checksum: str
+        :param noverifyssl: should the ssl verification be disabled?
+        :type noverifyssl: bool
+        :param session: Requests session for the download
+        :type session:
+        :param dest_path: destination path of the installation
+        :type dest_path: str
+        """
+        super().__init__()
+        self._url = url
+        self._proxy = proxy
+        self._checksum = checksum
+        self._noverifyssl = noverifyssl
+        self._session = session
+        self._dest_path = dest_path
+        self._download_error = None
+
+    @property
+    def name(self):
+        return "Install the payload from a remote tarball"
+
+    def _open_stream(self):
+        """Start the download of the tarball.
+
+        :return: a response of the request
+        """
+        try:
+            response = self._session.get(
+                self._url,
+                proxies=get_proxies_from_option(self._proxy),
+                verify=not self._noverifyssl,
+                stream=True,
+                timeout=NETWORK_CONNECTION_TIMEOUT
+            )
+            response.raise_for_status()
+        except RequestException as e:
+            raise InstallError("Error downloading liveimg: {}".format(e))
+
+        return response
+
+    def _feed_stream(self, response, pipe, sha256):
+        """Write the downloaded data to the pipe.
+
+        :param response: a response of the request
+        :param pipe: a file object of the pipe
+        :param sha256: a hash object updated with the data
+        """
+        total_length = int(response.headers.get('content-length') or 0)
+        progress = DownloadProgress(self._url, total_length, self.report_progress)
+        bytes_read = 0
+
+        try:
+            with pipe:
+                for buf in response.iter_content(1024 * 1024):
+                    if not buf:
+                        continue
+
+                    sha256.update(buf)
+                    pipe.write(buf)
+                    bytes_read += len(buf)
+
+                    if total_length:
+                        progress.update(bytes_read)
+
+            progress.end()
+        except (RequestException, OSError) as e:
+            self._download_error = e
+        finally:
+            response.close()
+
+    def _check_sum(self, sha256):
+        """Check the checksum of the extracted tarball."""
+        if not self._checksum:
+            return
+
+        filesum = sha256.hexdigest()
+        log.debug("sha256 of %s is %s", self._url, filesum)
+
+        if lowerASCII(self._checksum) != filesum:
+            log.error("%s does not match checksum of %s.", self._checksum, self._url)
+            raise InstallError("Checksum of image {} does not match".format(self._url))
+
+    def run(self):
+        """Run installation of the payload from a remote tarball.
+
+        :return: a list of installed kernel versions
+        """
+        log.info("Starting streamed installation from %s", self._url)
+        response = self._open_stream()
+        sha256 = hashlib.sha256()
+
+        read_fd, write_fd = os.pipe()
+        feeder = threading.Thread(
+            target=self._feed_stream,
+            args=(response, os.fdopen(write_fd, "wb"), sha256),
+            daemon=True
+        )
+
+        cmd = "tar"
+        args = get_tar_arguments()
+
+        compression = get_tar_compression_option(self._url)
+        if compression:
+            args.append(compression)
+
+        args += ["-xf", "-", "-C", self._dest_path]
+
+        with os.fdopen(read_fd, "rb") as pipe:
+            feeder.start()
+
+            try:
+                rc = execWithRedirect(cmd, args, stdin=pipe)
+            except (OSError, RuntimeError) as e:
+                log.error(str(e))
+                raise InstallError(str(e))
+            finally:
+                # Unblock the feeder if tar hasn't read everything.
+                pipe.close()
+                feeder.join()
+
+        log.info("%s exited with code %d", cmd, rc)
+
+        if isinstance(self._download_error, BrokenPipeError):
+            msg = "{} exited with code {} before the end of the stream".format(cmd, rc)
+            log.error(msg)
+            raise InstallError(msg)
+
+        if self._download_error:
+            msg = "Error downloading liveimg: {}".format(self._download_error)
+            log.error(msg)
+            raise InstallError(msg)
+
+        # The installed system is not finished until the checksum is verified.
+        self._check_sum(sha256)
+
+        kernel_version_list = get_kernel_version_list(self._dest_path)
+        create_rescue_image(self._dest_path, kernel_version_list)
+        return kernel_version_list
@@ -36,9 +36,10 @@ from pyanaconda.modules.payloads.payload.live_image.live_image_interface import
 from pyanaconda.modules.payloads.payload.live_image.initialization import \
     CheckInstallationSourceImageTask, SetupInstallationSourceImageTask, \
     TeardownInstallationSourceImageTask
-from pyanaconda.modules.payloads.payload.live_image.installation import InstallFromTarTask
+from pyanaconda.modules.payloads.payload.live_image.installation import InstallFromTarTask, \
+    InstallFromTarStreamTask
 from pyanaconda.modules.payloads.payload.live_image.utils import \
-    get_kernel_version_list_from_tar, url_target_is_tarfile
+    get_kernel_version_list_from_tar, url_target_is_tarfile, get_local_image_path_from_url
 
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
@@ -184,9 +185,24 @@ class LiveImageModule(PayloadBase):
             self._requests_session = requests_session()
         return self._requests_session
 
+    @property
+    def is_streamed(self):
+        """Should be the image extracted while it is downloaded?
+
+        Only remote tarballs can be streamed.
+
+        :rtype: bool
+        """
+        return conf.payload.enable_streamed_tarball_installation \
+            and url_target_is_tarfile(self._url) \
+            and not get_local_image_path_from_url(self._url)
+
     def update_kernel_version_list(self):
         """Update list of kernel versions."""
-        if url_target_is_tarfile(self._url):
+        if self.is_streamed:
+            # The streamed tarball is available only in the installed system.
+            kernel_version_list = get_kernel_version_list(conf.target.system_root)
+        elif url_target_is_tarfile(self._url):
             if not os.path.exists(self.image_path):
                 raise SourceSetupError("Failed to find tarfile image")
             kernel_version_list = get_kernel_version_list_from_tar(self.image_path)
@@ -211,7 +227,8 @@ class LiveImageModule(PayloadBase):
         task = CheckInstallationSourceImageTask(
             self.url,
             self.proxy,
-            self.requests_session
+            self.requests_session,
+            streamed=self.is_streamed
         )
         task.succeeded_signal.connect(lambda: self.set_required_space(task.get_result()))
         return task
@@ -222,7 +239,12 @@ class LiveImageModule(PayloadBase):
         * Download the image
         * Check the checksum
         * Mount the image
+
+        The streamed tarball doesn't need any preparation.
         """
+        if self.is_streamed:
+            return []
+
         task = SetupInstallationSourceImageTask(
             self.url,
             self.proxy,
@@ -250,19 +272,35 @@ class LiveImageModule(PayloadBase):
         ]
 
     def install_with_tasks(self):
-        """Install the payload."""
-        if url_target_is_tarfile(self._url):
+        """Install the payload.
+
+        The list of kernel versions of a tarball is updated from
+        the installed system.
+        """
+        if self.is_streamed:
+            task = InstallFromTarStreamTask(
+                self.url,
+                self.proxy,
+                self.checksum,
+                not self.verifyssl,
+                self.requests_session,
+                conf.target.system_root
+            )
+        elif url_target_is_tarfile(self._url):
             task = InstallFromTarTask(
                 self.image_path,
-                conf.target.system_root,
-                self.kernel_version_list
+                conf.target.system_root
             )
         else:
             task = InstallFromImageTask(
                 conf.target.system_root,
                 self.kernel_version_list
             )
+            return [task]
 
+        task.succeeded_signal.connect(
+            lambda: self.set_kernel_version_list(task.get_result())
+        )
         return [task]
 
     def teardown_with_task(self):
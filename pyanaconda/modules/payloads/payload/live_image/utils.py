@@ -59,3 +59,24 @@ def get_proxies_from_option(proxy_option):
 def url_target_is_tarfile(url):
     """Does the url point to a tarfile?"""
     return any(url.endswith(suffix) for suffix in TAR_SUFFIX)
+
+
+def get_tar_compression_option(url):
+    """Get the tar option for the compression of the tarball.
+
+    The compression can't be detected from a stream, so it
+    has to be guessed from the suffix of the url.
+
+    :param url: an url of the tarball
+    :return: a tar option or None
+    """
+    if url.endswith((".tgz", "tar.gz")):
+        return "--gzip"
+
+    if url.endswith((".tbz", ".tar.bz2")):
+        return "--bzip2"
+
+    if url.endswith((".txz", "tar.xz")):
+        return "--xz"
+
+    return None
@@ -19,7 +19,10 @@ import gi
 gi.require_version("BlockDev", "2.0")
 from gi.repository import BlockDev as blockdev
 
+import copy
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from blivet import arch, util
 from blivet.devicefactory import get_device_type
@@ -39,7 +42,101 @@ from pyanaconda.modules.storage.platform import platform
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
+# Parts of the storage model the checks can depend on.
+MODEL_MOUNT_POINTS = "mount-points"
+MODEL_SWAPS = "swaps"
+MODEL_LUKS_DEVICES = "luks-devices"
+MODEL_BOOTLOADER = "bootloader"
+MODEL_ACTIONS = "actions"
 
+
+def _get_id(obj):
+    """Get an id of a device, a format or an action or None."""
+    return obj.id if obj is not None else None
+
+
+def _get_mount_points_state(storage):
+    """Get a state of the mount points."""
+    return tuple(
+        (mount, device.id, device.format.id, device.format.exists, device.size)
+        for mount, device in storage.mountpoints.items()
+    )
+
+
+def _get_swaps_state(storage):
+    """Get a state of the swap devices."""
+    return tuple(
+        (device.id, device.format.id, device.format.exists, device.format.uuid)
+        for device in storage.fsset.swap_devices
+    )
+
+
+def _get_luks_devices_state(storage):
+    """Get a state of the LUKS devices."""
+    return tuple(
+        (device.id, device.format.id, device.format.exists, device.format.has_key,
+         device.format.map_name, tuple(c.name for c in device.children))
+        for device in storage.devices
+        if device.format.type == "luks"
+    )
+
+
+def _get_bootloader_state(storage):
+    """Get a state of the boot loader.
+
+    The boot loader validates its devices against the whole
+    device tree, so any change of the storage model changes
+    the state.
+    """
+    bootloader = storage.bootloader
+
+    if not bootloader:
+        return None
+
+    return (
+        storage.generation,
+        bootloader.skip_bootloader,
+        _get_id(bootloader.stage1_disk),
+        _get_id(bootloader.stage1_device),
+        _get_id(bootloader.stage2_device),
+    )
+
+
+def _get_actions_state(storage):
+    """Get a state of the scheduled actions."""
+    return tuple(action.id for action in storage.devicetree.actions)
+
+
+# Functions that return a comparable state of the model parts.
+_STATE_GETTERS = {
+    MODEL_MOUNT_POINTS: _get_mount_points_state,
+    MODEL_SWAPS: _get_swaps_state,
+    MODEL_LUKS_DEVICES: _get_luks_devices_state,
+    MODEL_BOOTLOADER: _get_bootloader_state,
+    MODEL_ACTIONS: _get_actions_state,
+}
+
+
+def depends_on(*parts):
+    """Declare parts of the storage model the check depends on.
+
+    The check has to depend only on the given parts of the model
+    and the constraints. The storage checker reuses the results
+    of the check until one of these parts or the constraints are
+    changed, and runs the check in parallel with other declared
+    checks. Checks without the declaration run every time.
+
+    :param parts: names of the model parts
+    :return: a decorator of the check
+    """
+    def decorator(callback):
+        callback.dependencies = frozenset(parts)
+        return callback
+
+    return decorator
+
+
+@depends_on(MODEL_MOUNT_POINTS)
 def verify_root(storage, constraints, report_error, report_warning):
     """ Verify the root.
 
@@ -101,6 +198,7 @@ def verify_s390_constraints(storage, constraints, report_error, report_warning):
                          .format(name="/dev/" + disk.name, busid=disk.busid))
 
 
+@depends_on(MODEL_MOUNT_POINTS)
 def verify_partition_formatting(storage, constraints, report_error, report_warning):
     """ Verify partitions that should be reformatted by default.
 
@@ -122,6 +220,7 @@ def verify_partition_formatting(storage, constraints, report_error, report_warni
                          "%(mount)s partition.") % {'mount': mount})
 
 
+@depends_on(MODEL_MOUNT_POINTS)
 def verify_partition_sizes(storage, constraints, report_error, report_warning):
     """ Verify the minimal and required partition sizes.
 
@@ -147,6 +246,7 @@ def verify_partition_sizes(storage, constraints, report_error, report_warning):
                          % {'mount': mount, 'size': size})
 
 
+@depends_on(MODEL_MOUNT_POINTS)
 def verify_partition_format_sizes(storage, constraints, report_error, report_warning):
     """ Verify that the size of the device is allowed by the format used.
 
@@ -175,6 +275,7 @@ def verify_partition_format_sizes(storage, constraints, report_error, report_war
                             "minSize": device.min_size, "maxSize": device.max_size})
 
 
+@depends_on(MODEL_BOOTLOADER)
 def verify_bootloader(storage, constraints, report_error, report_warning):
     """ Verify that the size of the device is allowed by the format used.
 
@@ -215,6 +316,7 @@ def verify_bootloader(storage, constraints, report_error, report_warning):
                     report_error(msg)
 
 
+@depends_on(MODEL_BOOTLOADER)
 def verify_gpt_biosboot(storage, constraints, report_error, report_warning):
     """ Verify that GPT boot disk on BIOS system has a BIOS boot partition.
 
@@ -242,6 +344,7 @@ def verify_gpt_biosboot(storage, constraints, report_error, report_warning):
                                "'biosboot' type partition."))
 
 
+@depends_on(MODEL_SWAPS)
 def verify_swap(storage, constraints, report_error, report_warning):
     """ Verify the existence of swap.
 
@@ -277,6 +380,7 @@ def verify_swap(storage, constraints, report_error, report_warning):
                                  "for most installations."))
 
 
+@depends_on(MODEL_SWAPS)
 def verify_swap_uuid(storage, constraints, report_error, report_warning):
     """ Verify swap uuid.
 
@@ -298,6 +402,7 @@ def verify_swap_uuid(storage, constraints, report_error, report_warning):
                          "circumstances. "))
 
 
+@depends_on(MODEL_MOUNT_POINTS)
 def verify_mountpoints_on_root(storage, constraints, report_error, report_warning):
     """ Verify mountpoints on the root.
 
@@ -312,6 +417,7 @@ def verify_mountpoints_on_root(storage, constraints, report_error, report_warnin
                            "be on the / file system.") % mountpoint)
 
 
+@depends_on(MODEL_MOUNT_POINTS)
 def verify_mountpoints_not_on_root(storage, constraints, report_error, report_warning):
     """ Verify mountpoints not on the root.
 
@@ -328,6 +434,7 @@ def verify_mountpoints_not_on_root(storage, constraints, report_error, report_wa
                          % mountpoint)
 
 
+@depends_on(MODEL_MOUNT_POINTS)
 def verify_mountpoints_on_linuxfs(storage, constraints, report_error, report_warning):
     """ Verify mountpoints on linuxfs.
 
@@ -344,6 +451,7 @@ def verify_mountpoints_on_linuxfs(storage, constraints, report_error, report_war
             report_error(_("The mount point %s must be on a linux file system.") % mountpoint)
 
 
+@depends_on(MODEL_LUKS_DEVICES)
 def verify_unlocked_devices_have_key(storage, constraints, report_error, report_warning):
     """ Verify that existing unlocked LUKS devices have some way of obtaining a key.
 
@@ -371,6 +479,7 @@ def verify_unlocked_devices_have_key(storage, constraints, report_error, report_
                        "this device. Please, rescan the storage.").format(dev.name))
 
 
+@depends_on(MODEL_LUKS_DEVICES)
 def verify_luks_devices_have_key(storage, constraints, report_error, report_warning):
     """ Verify that all non-existant LUKS devices have some way of obtaining a key.
 
@@ -440,6 +549,7 @@ def verify_mounted_partitions(storage, constraints, report_error, report_warning
                                "installation. Please unmount it and retry.") % part.path)
 
 
+@depends_on(MODEL_ACTIONS)
 def verify_lvm_destruction(storage, constraints, report_error, report_warning):
     """Verify that destruction of LVM devices is correct.
 
@@ -550,6 +660,7 @@ class StorageChecker(object):
     def __init__(self):
         self.checks = list()
         self.constraints = dict()
+        self._results = dict()
 
     def add_check(self, callback):
         """ Add a callback for storage checking.
@@ -570,6 +681,8 @@ class StorageChecker(object):
         if callback in self.checks:
             self.checks.remove(callback)
 
+        self._results.pop(callback, None)
+
     def add_constraint(self, name, value):
         """ Add a new constraint for storage checking.
 
@@ -602,6 +715,10 @@ class StorageChecker(object):
         This function is called at the end of partitioning so that we can make
         sure you don't have anything silly (like no /, a really small /, etc).
 
+        Results of checks that declare their dependencies are reused if the
+        dependencies and the constraints haven't changed since the last run.
+        The declared checks run in parallel, other checks run in order.
+
         :param storage: the storage object to check
         :param constraints: an dictionary of constraints that will be used by
                checks or None if we want to use the storage checker's constraints
@@ -617,16 +734,54 @@ class StorageChecker(object):
         result.add_info("Storage check started with constraints %s."
                         % constraints)
 
-        # Process checks.
+        # Reuse the results of unchanged checks.
+        checks = [c for c in self.checks if not skip or c not in skip]
+        keys = self._get_cache_keys(checks, storage, constraints)
+        reused = {
+            c: self._results[c][1] for c in checks
+            if keys[c] is not None
+            and c in self._results
+            and self._results[c][0] == keys[c]
+        }
+
+        # Run the declared checks in parallel and the other checks in order.
+        results = dict(reused)
+        results.update(self._run_checks(
+            [c for c in checks if c not in reused and keys[c] is not None],
+            storage, constraints, parallel=True
+        ))
+        results.update(self._run_checks(
+            [c for c in checks if keys[c] is None],
+            storage, constraints, parallel=False
+        ))
+
+        # Cache the results of the declared checks.
+        for check in checks:
+            if keys[check] is not None:
+                self._results[check] = (keys[check], results[check])
+
+        # Process the results.
         for check in self.checks:
             # Skip this check.
-            if skip and check in skip:
+            if check not in results:
                 result.add_info("Skipped sanity check %s." % check.__name__)
                 continue
 
-            # Run the check.
-            result.add_info("Run sanity check %s." % check.__name__)
-            check(storage, constraints, result.add_error, result.add_warning)
+            errors, warnings, duration = results[check]
+
+            if check in reused:
+                result.add_info("Reused results of sanity check %s." % check.__name__)
+            else:
+                result.add_info("Run sanity check %s." % check.__name__)
+
+            for msg in errors:
+                result.add_error(msg)
+
+            for msg in warnings:
+                result.add_warning(msg)
+
+            if check not in reused:
+                result.add_info("Sanity check %s took %.3f s." % (check.__name__, duration))
 
         # Report the result.
         if result.success:
@@ -636,6 +791,76 @@ class StorageChecker(object):
 
         return result
 
+    def _get_cache_keys(self, checks, storage, constraints):
+        """Get keys for the cached results of the given checks.
+
+        The key of a check without declared dependencies is None.
+
+        :param checks: a list of checks
+        :param storage: the storage object to check
+        :param constraints: a dictionary of constraints
+        :return: a dictionary of checks and their keys
+        """
+        constraints = copy.deepcopy(constraints)
+        states = {}
+        keys = {}
+
+        for check in checks:
+            parts = getattr(check, "dependencies", None)
+
+            if parts is None:
+                keys[check] = None
+                continue
+
+            for part in parts:
+                if part not in states:
+                    states[part] = _STATE_GETTERS[part](storage)
+
+            keys[check] = (
+                constraints,
+                tuple(states[part] for part in sorted(parts))
+            )
+
+        return keys
+
+    def _run_checks(self, checks, storage, constraints, parallel):
+        """Run the given checks.
+
+        :param checks: a list of checks
+        :param storage: the storage object to check
+        :param constraints: a dictionary of constraints
+        :param parallel: should we run the checks in parallel?
+        :return: a dictionary of checks and their results
+        """
+        max_workers = min(conf.storage.checker_threads, len(checks))
+
+        def run_check(check):
+            return self._run_check(check, storage, constraints)
+
+        if not parallel or max_workers <= 1:
+            return dict(zip(checks, map(run_check, checks)))
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="AnaStorageChecker") as executor:
+            return dict(zip(checks, executor.map(run_check, checks)))
+
+    @staticmethod
+    def _run_check(check, storage, constraints):
+        """Run the given check.
+
+        :param check: a check to run
+        :param storage: the storage object to check
+        :param constraints: a dictionary of constraints
+        :return: a tuple of errors, warnings and a duration in seconds
+        """
+        errors = []
+        warnings = []
+        start = time.perf_counter()
+
+        check(storage, constraints, errors.append, warnings.append)
+
+        return errors, warnings, time.perf_counter() - start
+
     def get_default_constraint_names(self):
         """Get a list of default constraint names."""
         return [
@@ -26,6 +26,7 @@ from pyanaconda.modules.common.constants.objects import DEVICE_TREE
 from pyanaconda.modules.common.errors.storage import UnavailableStorageError
 from pyanaconda.modules.storage.devicetree.devicetree_interface import DeviceTreeInterface
 from pyanaconda.modules.storage.devicetree.handler import DeviceTreeHandler
+from pyanaconda.modules.storage.devicetree.model import StorageCopy
 from pyanaconda.modules.storage.devicetree.viewer import DeviceTreeViewer
 
 log = get_module_logger(__name__)
@@ -49,10 +50,16 @@ class DeviceTreeModule(KickstartBaseModule, DeviceTreeViewer, DeviceTreeHandler,
         if self._storage is None:
             raise UnavailableStorageError()
 
+        if isinstance(self._storage, StorageCopy):
+            self._storage = self._storage.get()
+
         return self._storage
 
     def on_storage_changed(self, storage):
-        """Keep the instance of the current storage."""
+        """Keep the instance of the current storage.
+
+        :param storage: an instance of Blivet or StorageCopy
+        """
         self._storage = storage
 
     def for_publication(self):
@@ -126,7 +126,11 @@ class DeviceTreeHandler(ABC):
         :return: True if success, otherwise False
         """
         device = self._get_device(device_name)
-        return unlock_device(self.storage, device, passphrase)
+
+        try:
+            return unlock_device(self.storage, device, passphrase)
+        finally:
+            self.storage.update_generation()
 
     def find_unconfigured_luks(self):
         """Find all unconfigured LUKS devices.
@@ -170,6 +174,7 @@ class DeviceTreeHandler(ABC):
         """
         device = self._get_device(device_name)
         device.format.options = mount_options or None
+        self.storage.update_generation()
         log.debug("Mount options of %s are set to '%s'.", device_name, mount_options)
 
     def find_devices_with_task(self):
@@ -179,7 +184,9 @@ class DeviceTreeHandler(ABC):
 
         :return: a task
         """
-        return FindDevicesTask(self.storage.devicetree)
+        task = FindDevicesTask(self.storage.devicetree)
+        task.stopped_signal.connect(self.storage.update_generation)
+        return task
 
     def find_optical_media(self):
         """Find all devices with mountable optical media.
@@ -204,7 +211,10 @@ class DeviceTreeHandler(ABC):
 
         :return: a task
         """
-        task = FindExistingSystemsTask(self.storage.devicetree)
+        task = FindExistingSystemsTask(
+            self.storage.devicetree,
+            self.storage.installations_cache
+        )
         task.succeeded_signal.connect(
             lambda: self._update_existing_systems(task.get_result())
         )
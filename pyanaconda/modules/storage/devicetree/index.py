@@ -0,0 +1,116 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+__all__ = ["DeviceTreeIndex"]
+
+
+class DeviceTreeIndex(object):
+    """An index of devices in the device tree.
+
+    The index is built from the devices of the device tree at once,
+    so the lookups don't have to scan the whole device tree. The
+    index doesn't follow changes of the device tree. Create a new
+    index every time the device tree is changed.
+
+    If there are more devices with the same key, the index returns
+    the first one in the order of the device tree.
+    """
+
+    def __init__(self, devices):
+        """Create a new index.
+
+        :param devices: a list of devices to index
+        """
+        self._devices = set()
+        self._names = {}
+        self._paths = {}
+        self._uuids = {}
+        self._aliases = {}
+        self._ancestors = {}
+
+        for device in devices:
+            self._add_device(device)
+
+    def _add_device(self, device):
+        """Add the device to the index."""
+        self._devices.add(device)
+        self._names.setdefault(device.name, device)
+        self._paths.setdefault(device.path, device)
+
+        for uuid in (device.uuid, device.format.uuid):
+            if uuid:
+                self._uuids.setdefault(uuid, device)
+
+        alias = getattr(device, "req_name", None)
+
+        if alias:
+            self._aliases.setdefault(alias, device)
+
+    def __contains__(self, device):
+        """Is the device in the index?"""
+        return device in self._devices
+
+    def __len__(self):
+        """Return the number of the indexed devices."""
+        return len(self._devices)
+
+    def get_device_by_name(self, name):
+        """Get a device with the given name.
+
+        :param name: a device name
+        :return: a device or None
+        """
+        return self._names.get(name)
+
+    def get_device_by_path(self, path):
+        """Get a device with the given path.
+
+        :param path: a device path
+        :return: a device or None
+        """
+        return self._paths.get(path)
+
+    def get_device_by_uuid(self, uuid):
+        """Get a device with the given UUID of the device or its format.
+
+        :param uuid: a UUID
+        :return: a device or None
+        """
+        return self._uuids.get(uuid)
+
+    def get_device_by_alias(self, alias):
+        """Get a device with the given alias.
+
+        Aliases are requested names of devices from the kickstart file.
+
+        :param alias: an alias name
+        :return: a device or None
+        """
+        return self._aliases.get(alias)
+
+    def get_ancestors(self, device):
+        """Get ancestors of the given device.
+
+        The ancestors are computed only once for every device.
+
+        :param device: a device
+        :return: a list of devices including the given device
+        """
+        if device not in self._ancestors:
+            self._ancestors[device] = device.ancestors
+
+        return self._ancestors[device]
@@ -17,6 +17,7 @@
 #
 # Red Hat Author(s): David Lehman <dlehman@redhat.com>
 #
+import itertools
 import os
 
 from blivet.blivet import Blivet
@@ -31,6 +32,7 @@ from pyanaconda.modules.storage.bootloader import BootLoaderFactory
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.constants import shortProductName
 from pyanaconda.modules.storage.devicetree.fsset import FSSet
+from pyanaconda.modules.storage.devicetree.index import DeviceTreeIndex
 from pyanaconda.modules.storage.devicetree.utils import download_escrow_certificate, \
     find_live_backing_device
 from pyanaconda.modules.storage.devicetree.root import find_existing_installations
@@ -39,7 +41,7 @@ from pyanaconda.modules.common.constants.services import NETWORK
 import logging
 log = logging.getLogger("anaconda.storage")
 
-__all__ = ["create_storage"]
+__all__ = ["create_storage", "StorageCopy"]
 
 
 def create_storage():
@@ -50,10 +52,64 @@ def create_storage():
     return InstallerStorage()
 
 
+class StorageCopy(object):
+    """A copy of the storage model created on demand.
+
+    A deep copy of the storage model is expensive, so the copy is
+    created when it is accessed for the first time. Until then, the
+    copy shares the whole model with the original. A copy that is
+    dropped before it is used is never created.
+
+    Changes of the original model are visible in the copy until
+    the copy is created.
+    """
+
+    def __init__(self, storage, setup=None):
+        """Create a new copy.
+
+        :param storage: an instance of the storage model to copy
+        :param setup: a function to set up the created copy or None
+        """
+        self._source = storage
+        self._setup = setup
+        self._storage = None
+
+    @property
+    def is_created(self):
+        """Is the copy already created?"""
+        return self._storage is not None
+
+    def get(self):
+        """Get the copy of the storage model.
+
+        The copy is created if it doesn't exist yet.
+
+        :return: an instance of the storage model
+        """
+        if self._storage is None:
+            storage = self._source.copy()
+
+            if self._setup:
+                self._setup(storage)
+
+            self._storage = storage
+            self._source = None
+            self._setup = None
+
+        return self._storage
+
+
 class InstallerStorage(Blivet):
     """ Top-level class for managing installer-related storage configuration. """
 
+    # The source of unique generations of all storage models.
+    _generations = itertools.count(1)
+
     def __init__(self):
+        self._generation = next(self._generations)
+        self._index = None
+        self._index_generation = None
+        self._installations_cache = {}
         super().__init__()
         self.protected_devices = []
         self._escrow_certificates = {}
@@ -69,6 +125,72 @@ class InstallerStorage(Blivet):
         # Set the default LUKS version.
         self.set_default_luks_version(conf.storage.luks_version or self.default_luks_version)
 
+    @property
+    def generation(self):
+        """The generation of the storage model.
+
+        Every change of the model sets a new generation that is unique
+        across all storage models, so the generation identifies the
+        state of the model. A copy of the model has the same generation
+        as the original until one of them is changed.
+
+        :return: a number of the generation
+        """
+        return self._generation
+
+    def update_generation(self):
+        """Set a new generation of the storage model.
+
+        Call this method whenever the model is changed.
+        """
+        self._generation = next(self._generations)
+
+    @property
+    def installations_cache(self):
+        """The cache of the searches for existing installations.
+
+        The cache is cleared when the storage is reset.
+
+        :return: a dictionary with results of the searches
+        """
+        return self._installations_cache
+
+    @property
+    def index(self):
+        """The index of devices in the device tree.
+
+        The index is created again when the generation of the model
+        is changed. Call the update_generation method after changes
+        of the device tree that are not done by this class.
+
+        :return: an instance of DeviceTreeIndex
+        """
+        if self._index is None or self._index_generation != self.generation:
+            self._index = DeviceTreeIndex(self.devices)
+            self._index_generation = self.generation
+
+        return self._index
+
+    def create_device(self, device):
+        super().create_device(device)
+        self.update_generation()
+
+    def destroy_device(self, device):
+        super().destroy_device(device)
+        self.update_generation()
+
+    def format_device(self, device, format):  # pylint: disable=redefined-builtin
+        super().format_device(device, format)
+        self.update_generation()
+
+    def resize_device(self, device, new_size):
+        super().resize_device(device, new_size)
+        self.update_generation()
+
+    def reset_device(self, device):
+        super().reset_device(device)
+        self.update_generation()
+
     @property
     def bootloader(self):
         if self._bootloader is None:
@@ -269,8 +391,12 @@ class InstallerStorage(Blivet):
         self.bootloader.reset()
 
         self.roots = []
-        self.roots = find_existing_installations(self.devicetree)
+        self._installations_cache.clear()
+        self.roots = find_existing_installations(
+            self.devicetree, cache=self._installations_cache
+        )
         self.dump_state("initial")
+        self.update_generation()
 
     def _mark_protected_devices(self):
         """Mark protected devices.
@@ -336,6 +462,7 @@ class InstallerStorage(Blivet):
 
         # Update the list.
         self.protected_devices = protected_names
+        self.update_generation()
 
     @property
     def usable_disks(self):
@@ -386,6 +513,8 @@ class InstallerStorage(Blivet):
                 if disk not in self.devices:
                     self.devicetree.unhide(disk)
 
+        self.update_generation()
+
     def _get_hostname(self):
         """Return a hostname."""
         ignored_hostnames = {None, "", 'localhost', 'localhost.localdomain'}
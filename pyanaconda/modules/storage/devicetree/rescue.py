@@ -32,13 +32,15 @@ __all__ = ["FindExistingSystemsTask", "MountExistingSystemTask"]
 class FindExistingSystemsTask(Task):
     """A task to find existing GNU/Linux installations."""
 
-    def __init__(self, devicetree):
+    def __init__(self, devicetree, cache=None):
         """Create a new task.
 
         :param devicetree: a device tree to search
+        :param cache: a dictionary with results of the previous searches or None
         """
         super().__init__()
         self._devicetree = devicetree
+        self._cache = cache
 
     @property
     def name(self):
@@ -49,7 +51,7 @@ class FindExistingSystemsTask(Task):
 
         :return: a list of data about found systems
         """
-        return find_existing_installations(devicetree=self._devicetree)
+        return find_existing_installations(devicetree=self._devicetree, cache=self._cache)
 
 
 class MountExistingSystemTask(Task):
@@ -17,6 +17,10 @@
 #
 import os
 import shlex
+import tempfile
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from blivet import util as blivet_util
 from blivet.errors import StorageError
@@ -32,6 +36,9 @@ log = get_module_logger(__name__)
 
 __all__ = ["mount_existing_system", "find_existing_installations", "Root"]
 
+# An existing installation found on a device.
+_Installation = namedtuple("_Installation", ["product", "version", "arch", "mounts", "swaps"])
+
 
 def mount_existing_system(storage, root_device, read_only=None):
     """Mount filesystems specified in root_device's /etc/fstab file."""
@@ -69,15 +76,16 @@ def mount_existing_system(storage, root_device, read_only=None):
         storage.make_mtab(chroot=root_path)
 
 
-def find_existing_installations(devicetree, teardown_all=True):
+def find_existing_installations(devicetree, teardown_all=True, cache=None):
     """Find existing GNU/Linux installations on devices from the device tree.
 
     :param devicetree: a device tree to find existing installations in
     :param bool teardown_all: whether to tear down all devices in the end
+    :param cache: a dictionary with results of the previous searches or None
     :return: roots of all found installations
     """
     try:
-        roots = _find_existing_installations(devicetree)
+        roots = _find_existing_installations(devicetree, {} if cache is None else cache)
         return roots
     except Exception:  # pylint: disable=broad-except
         log_exception_info(log.info, "failure detecting existing installations")
@@ -88,59 +96,270 @@ def find_existing_installations(devicetree, teardown_all=True):
     return []
 
 
-def _find_existing_installations(devicetree):
+def _find_existing_installations(devicetree, cache):
     """Find existing GNU/Linux installations on devices from the device tree.
 
+    The devices are searched at the same time in a bounded number of
+    threads. Every device is mounted at its own temporary mount point.
+    The results of the previous searches are reused for devices with
+    unchanged formats.
+
     :param devicetree: a device tree to find existing installations in
+    :param cache: a dictionary with results of the previous searches
     :return: roots of all found installations
     """
-    if not os.path.exists(conf.target.physical_root):
-        blivet_util.makedirs(conf.target.physical_root)
+    devices = [dev for dev in devicetree.devices if _is_installation_candidate(dev)]
+    references = _get_device_references(devicetree)
+    results = [_get_cached_installation(cache, references, dev) for dev in devices]
+    pending = [dev for dev, result in zip(devices, results) if result is None]
+
+    # Search the devices that are not cached.
+    lock = threading.Lock()
+    found = iter(_search_devices(devicetree, pending, lock))
 
-    sysroot = conf.target.physical_root
+    # Keep the order of the devices.
     roots = []
-    direct_devices = (dev for dev in devicetree.devices if dev.direct)
-    for device in direct_devices:
-        if not device.format.linux_native or not device.format.mountable or \
-           not device.controllable or not device.format.exists:
-            continue
 
+    for device, result in zip(devices, results):
+        if result is None:
+            result = next(found)
+            _cache_installation(cache, references, device, result)
+
+        if result:
+            roots.append(_create_root(result))
+
+    return roots
+
+
+def _is_installation_candidate(device):
+    """Can the device contain an existing installation?"""
+    return device.direct \
+        and device.format.linux_native \
+        and device.format.mountable \
+        and device.controllable \
+        and device.format.exists
+
+
+def _get_device_references(devicetree):
+    """Get references to devices from the device tree.
+
+    A device is referenced by the UUID of its format. Devices
+    without a unique UUID cannot be referenced.
+
+    :param devicetree: a device tree
+    :return: a dictionary of UUIDs and devices
+    """
+    uuids = {}
+
+    for device in devicetree.devices:
+        uuid = device.format.uuid
+
+        if uuid:
+            uuids.setdefault(uuid, []).append(device)
+
+    return {uuid: devs[0] for uuid, devs in uuids.items() if len(devs) == 1}
+
+
+def _get_format_state(device):
+    """Get a state of the device format.
+
+    :param device: a device
+    :return: a tuple that identifies the state of the format
+    """
+    fmt = device.format
+    return fmt.uuid, fmt.type, fmt.label, device.size
+
+
+def _resolve_format_state(references, state):
+    """Find a device with the given state of the format.
+
+    :param references: a dictionary of UUIDs and devices
+    :param state: a state of the device format
+    :return: a device or None
+    """
+    device = references.get(state[0])
+
+    if device is None or _get_format_state(device) != state:
+        return None
+
+    return device
+
+
+def _get_cached_installation(cache, references, device):
+    """Get the cached result of the search on the device.
+
+    :param cache: a dictionary with results of the previous searches
+    :param references: a dictionary of UUIDs and devices
+    :param device: a device to search
+    :return: an instance of _Installation, False if there is no
+             installation or None if there is no valid result
+    """
+    if references.get(device.format.uuid) is not device:
+        return None
+
+    result = cache.get(_get_format_state(device))
+
+    if result is None:
+        return None
+
+    if result:
+        mounts = {
+            mount_point: _resolve_format_state(references, state)
+            for mount_point, state in result.mounts.items()
+        }
+        swaps = [_resolve_format_state(references, state) for state in result.swaps]
+
+        if None in mounts.values() or None in swaps:
+            return None
+
+        result = result._replace(mounts=mounts, swaps=swaps)
+
+    log.debug("Using the cached result of the search on %s.", device.name)
+    return result
+
+
+def _cache_installation(cache, references, device, result):
+    """Cache the result of the search on the device.
+
+    The devices of the found installation are stored as states
+    of their formats, so they can be found after a rescan. The
+    result is not cached if any device cannot be referenced.
+
+    :param cache: a dictionary with results of the previous searches
+    :param references: a dictionary of UUIDs and devices
+    :param device: a searched device
+    :param result: an instance of _Installation, False or None
+    """
+    if result is None:
+        return
+
+    devices = [device]
+
+    if result:
+        devices.extend(result.mounts.values())
+        devices.extend(result.swaps)
+
+    if any(references.get(dev.format.uuid) is not dev for dev in devices):
+        log.debug("Not caching the result of the search on %s.", device.name)
+        return
+
+    if result:
+        result = result._replace(
+            mounts={mp: _get_format_state(dev) for mp, dev in result.mounts.items()},
+            swaps=[_get_format_state(dev) for dev in result.swaps]
+        )
+
+    cache[_get_format_state(device)] = result
+
+
+def _search_devices(devicetree, devices, lock):
+    """Search the devices for existing installations.
+
+    :param devicetree: a device tree
+    :param devices: a list of devices to search
+    :param lock: a lock for the setup and the mount of devices
+    :return: a list of results in the order of the devices
+    """
+    max_workers = min(conf.storage.discovery_threads, len(devices))
+
+    def search_device(device):
+        return _search_device(devicetree, device, lock)
+
+    if max_workers <= 1:
+        return list(map(search_device, devices))
+
+    log.debug("Searching %d devices for existing installations in %d threads.",
+              len(devices), max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix="AnaExistingSystems") as executor:
+        return list(executor.map(search_device, devices))
+
+
+def _search_device(devicetree, device, lock):
+    """Search the device for an existing installation.
+
+    :param devicetree: a device tree
+    :param device: a device to search
+    :param lock: a lock for the setup and the mount of devices
+    :return: an instance of _Installation, False if there is no
+             installation or None if the device cannot be mounted
+    """
+    with lock:
         try:
             device.setup()
         except Exception:  # pylint: disable=broad-except
             log_exception_info(log.warning, "setup of %s failed", [device.name])
-            continue
+            return None
 
-        options = device.format.options + ",ro"
+    sysroot = tempfile.mkdtemp(prefix="anaconda-root-")
+
+    try:
+        return _search_mounted_device(devicetree, device, sysroot, lock)
+    finally:
         try:
+            os.rmdir(sysroot)
+        except OSError as e:
+            log.warning("Failed to remove the mount point %s: %s", sysroot, e)
+
+
+def _search_mounted_device(devicetree, device, sysroot, lock):
+    """Mount the device and search it for an existing installation.
+
+    :param devicetree: a device tree
+    :param device: a device to search
+    :param sysroot: a path to the mount point
+    :param lock: a lock for the setup and the mount of devices
+    :return: an instance of _Installation, False or None on failure
+    """
+    options = device.format.options + ",ro"
+    try:
+        with lock:
             device.format.mount(options=options, mountpoint=sysroot)
-        except Exception:  # pylint: disable=broad-except
-            log_exception_info(log.warning, "mount of %s as %s failed", [device.name, device.format.type])
-            blivet_util.umount(mountpoint=sysroot)
-            continue
+    except Exception:  # pylint: disable=broad-except
+        log_exception_info(log.warning, "mount of %s as %s failed",
+                           [device.name, device.format.type])
+        blivet_util.umount(mountpoint=sysroot)
+        return None
 
-        if not os.access(sysroot + "/etc/fstab", os.R_OK):
-            blivet_util.umount(mountpoint=sysroot)
+    if not os.access(sysroot + "/etc/fstab", os.R_OK):
+        blivet_util.umount(mountpoint=sysroot)
+
+        with lock:
             device.teardown()
-            continue
 
-        architecture, product, version = get_release_string(chroot=sysroot)
-        (mounts, swaps) = _parse_fstab(devicetree, chroot=sysroot)
-        blivet_util.umount(mountpoint=sysroot)
+        return False
 
-        if not mounts and not swaps:
-            # empty /etc/fstab. weird, but I've seen it happen.
-            continue
+    architecture, product, version = get_release_string(chroot=sysroot)
+    (mounts, swaps) = _parse_fstab(devicetree, chroot=sysroot)
+    blivet_util.umount(mountpoint=sysroot)
 
-        roots.append(Root(
-            product=product,
-            version=version,
-            arch=architecture,
-            mounts=mounts,
-            swaps=swaps
-        ))
+    if not mounts and not swaps:
+        # empty /etc/fstab. weird, but I've seen it happen.
+        return False
 
-    return roots
+    return _Installation(
+        product=product,
+        version=version,
+        arch=architecture,
+        mounts=mounts,
+        swaps=swaps
+    )
+
+
+def _create_root(installation):
+    """Create a root from the found installation.
+
+    :param installation: an instance of _Installation
+    :return: an instance of Root
+    """
+    return Root(
+        product=installation.product,
+        version=installation.version,
+        arch=installation.arch,
+        mounts=installation.mounts,
+        swaps=installation.swaps
+    )
 
 
 def get_release_string(chroot):
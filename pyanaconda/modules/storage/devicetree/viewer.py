@@ -48,6 +48,17 @@ class DeviceTreeViewer(ABC):
         """
         return None
 
+    def get_generation(self):
+        """Get the generation of the storage model.
+
+        The generation changes with every change of the storage
+        model, so clients can use it to find out if their cached
+        data are still valid.
+
+        :return: a number of the generation
+        """
+        return self.storage.generation
+
     def get_root_device(self):
         """Get the root device.
 
@@ -89,9 +100,31 @@ class DeviceTreeViewer(ABC):
         :return: an instance of DeviceData
         :raise: UnknownDeviceError if the device is not found
         """
-        # Find the device.
         device = self._get_device(name)
+        return self._get_device_data(device)
+
+    def get_devices_data(self, names):
+        """Get data of the specified devices.
+
+        :param names: a list of device names
+        :return: a list of instances of DeviceData
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return list(map(self._get_device_data, self._get_devices(names)))
+
+    def get_all_devices_data(self):
+        """Get data of all devices in the device tree.
+
+        :return: a list of instances of DeviceData
+        """
+        return list(map(self._get_device_data, self.storage.devices))
+
+    def _get_device_data(self, device):
+        """Get the device data.
 
+        :param device: an instance of the Blivet's device
+        :return: an instance of DeviceData
+        """
         # Collect the device data.
         data = DeviceData()
         self._set_device_data(device, data)
@@ -171,6 +204,15 @@ class DeviceTreeViewer(ABC):
         device = self._get_device(device_name)
         return self._get_format_data(device.format)
 
+    def get_formats_data(self, device_names):
+        """Get the format data of the specified devices.
+
+        :param device_names: a list of device names
+        :return: a list of instances of DeviceFormatData
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return [self._get_format_data(d.format) for d in self._get_devices(device_names)]
+
     def get_format_type_data(self, format_name):
         """Get the format type data.
 
@@ -31,6 +31,17 @@ __all__ = ["DeviceTreeViewerInterface"]
 class DeviceTreeViewerInterface(InterfaceTemplate):
     """DBus interface for the device tree viewer."""
 
+    def GetGeneration(self) -> UInt64:
+        """Get the generation of the storage model.
+
+        The generation changes with every change of the storage
+        model. Cached data of the device tree are valid only as
+        long as the generation stays the same.
+
+        :return: a number of the generation
+        """
+        return self.implementation.get_generation()
+
     def GetRootDevice(self) -> Str:
         """Get the root device.
 
@@ -70,6 +81,22 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
         """
         return DeviceData.to_structure(self.implementation.get_device_data(name))
 
+    def GetDevicesData(self, names: List[Str]) -> List[Structure]:
+        """Get data of the specified devices.
+
+        :param names: a list of device names
+        :return: a list of structures with device data
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return DeviceData.to_structure_list(self.implementation.get_devices_data(names))
+
+    def GetAllDevicesData(self) -> List[Structure]:
+        """Get data of all devices in the device tree.
+
+        :return: a list of structures with device data
+        """
+        return DeviceData.to_structure_list(self.implementation.get_all_devices_data())
+
     def GetFormatData(self, name: Str) -> Structure:
         """Get the device format data.
 
@@ -78,6 +105,15 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
         """
         return DeviceFormatData.to_structure(self.implementation.get_format_data(name))
 
+    def GetFormatsData(self, names: List[Str]) -> List[Structure]:
+        """Get the format data of the specified devices.
+
+        :param names: a list of device names
+        :return: a list of structures with format data
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return DeviceFormatData.to_structure_list(self.implementation.get_formats_data(names))
+
     def GetFormatTypeData(self, name: Str) -> Structure:
         """Get the format type data.
 
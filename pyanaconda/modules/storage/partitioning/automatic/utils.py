@@ -61,18 +61,14 @@ def get_pbkdf_args(luks_version, pbkdf_type=None, max_memory_kb=0, iterations=0,
     return LUKS2PBKDFArgs(pbkdf_type or None, max_memory_kb or 0, iterations or 0, time_ms or 0)
 
 
-def lookup_alias(devicetree, alias):
+def lookup_alias(storage, alias):
     """Look up a device of the given alias in the device tree.
 
-    :param devicetree: a device tree to look up devices
+    :param storage: an instance of the storage model
     :param alias: an alias name
-    :return: a device object
+    :return: a device object or None
     """
-    for dev in devicetree.devices:
-        if getattr(dev, "req_name", None) == alias:
-            return dev
-
-    return None
+    return storage.index.get_device_by_alias(alias)
 
 
 def shrink_device(storage, device, size):
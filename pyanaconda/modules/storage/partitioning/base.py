@@ -26,7 +26,7 @@ from dasbus.server.publishable import Publishable
 from pyanaconda.modules.common.base.base import KickstartBaseModule
 from pyanaconda.modules.common.errors.storage import UnavailableStorageError
 from pyanaconda.anaconda_loggers import get_module_logger
-from pyanaconda.modules.storage.devicetree import DeviceTreeModule
+from pyanaconda.modules.storage.devicetree import DeviceTreeModule, StorageCopy
 from pyanaconda.modules.storage.partitioning.validate import StorageValidateTask
 
 log = get_module_logger(__name__)
@@ -59,33 +59,55 @@ class PartitioningModule(KickstartBaseModule, Publishable):
 
         :return: an instance of Blivet
         """
+        return self._get_storage_playground().get()
+
+    def _get_storage_playground(self):
+        """Get the storage playground.
+
+        The playground is a lazy copy of the current storage model.
+        The model is copied when the playground is accessed for the
+        first time.
+
+        :return: an instance of StorageCopy
+        """
         if self._current_storage is None:
             raise UnavailableStorageError()
 
         if self._storage_playground is None:
-            self._storage_playground = self._create_storage_playground()
+            self._storage_playground = StorageCopy(
+                self._current_storage,
+                self._setup_storage_playground
+            )
 
         return self._storage_playground
 
-    def _create_storage_playground(self):
-        """Prepare the current storage model for partitioning."""
-        storage = self._current_storage.copy()
+    def _setup_storage_playground(self, storage):
+        """Prepare the copy of the current storage model for partitioning."""
         storage.select_disks(self._selected_disks)
-        return storage
 
     def on_storage_changed(self, storage):
         """Update the current storage."""
         self._current_storage = storage
 
-        if self._device_tree_module:
-            self._device_tree_module.on_storage_changed(self.storage)
+        # Nobody has used the playground yet, so copy the new storage.
+        if self._storage_playground and not self._storage_playground.is_created:
+            self._storage_playground = None
+
+        self._update_device_tree()
 
     def on_partitioning_reset(self):
         """Drop the storage playground."""
         self._storage_playground = None
+        self._update_device_tree()
 
+    def _update_device_tree(self):
+        """Update the storage of the device tree module.
+
+        The device tree gets the lazy storage playground,
+        so the storage model is not copied until it is used.
+        """
         if self._device_tree_module:
-            self._device_tree_module.on_storage_changed(self.storage)
+            self._device_tree_module.on_storage_changed(self._get_storage_playground())
 
     def on_selected_disks_changed(self, selection):
         """Keep the current disk selection."""
@@ -100,7 +122,7 @@ class PartitioningModule(KickstartBaseModule, Publishable):
 
         if not module:
             module = self._create_device_tree()
-            module.on_storage_changed(self.storage)
+            module.on_storage_changed(self._get_storage_playground())
             self._device_tree_module = module
 
         return module
@@ -137,7 +159,7 @@ class PartitioningModule(KickstartBaseModule, Publishable):
         if not self._storage_playground:
             return
 
-        self._setup_kickstart_from_storage(data, self._storage_playground)
+        self._setup_kickstart_from_storage(data, self._storage_playground.get())
 
     @staticmethod
     def _setup_kickstart_from_storage(data, storage):
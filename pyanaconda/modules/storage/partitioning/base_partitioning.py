@@ -66,6 +66,9 @@ class PartitioningTask(Task, metaclass=ABCMeta):
             self._storage.bootloader.reset()
 
             raise BootloaderConfigurationError(str(e)) from e
+        finally:
+            # The partitioning changes the model.
+            self._storage.update_generation()
 
     @abstractmethod
     def _run(self, storage):
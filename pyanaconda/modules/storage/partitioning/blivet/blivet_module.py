@@ -47,9 +47,9 @@ class BlivetPartitioningModule(PartitioningModule):
         """Return a DBus representation."""
         return BlivetPartitioningInterface(self)
 
-    def _create_storage_playground(self):
-        """Prepare the current storage model for partitioning."""
-        storage = super()._create_storage_playground()
+    def _setup_storage_playground(self, storage):
+        """Prepare the copy of the current storage model for partitioning."""
+        super()._setup_storage_playground(storage)
 
         # Ensure all disks have appropriate disk labels.
         config = DiskInitializationConfig()
@@ -59,8 +59,6 @@ class BlivetPartitioningModule(PartitioningModule):
             if config.can_initialize(storage, disk):
                 storage.initialize_disk(disk)
 
-        return storage
-
     @property
     def storage_handler(self):
         """The handler of the storage.
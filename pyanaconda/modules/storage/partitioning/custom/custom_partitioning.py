@@ -138,6 +138,9 @@ class CustomPartitioningTask(NonInteractivePartitioningTask):
         if data.partition.partitions:
             do_partitioning(storage)
 
+            # The allocation renames the partitions.
+            storage.update_generation()
+
     def _execute_partition_data(self, storage, data, partition_data):
         """Execute the partition data.
 
@@ -579,7 +582,7 @@ class CustomPartitioningTask(NonInteractivePartitioningTask):
             if not dev:
                 # if member is using --onpart, use original device
                 mem = data.onPart.get(member, member)
-                dev = devicetree.resolve_device(mem) or lookup_alias(devicetree, member)
+                dev = devicetree.resolve_device(mem) or lookup_alias(storage, member)
             if dev and dev.format.type == "luks":
                 try:
                     dev = dev.children[0]
@@ -756,7 +759,7 @@ class CustomPartitioningTask(NonInteractivePartitioningTask):
             if not dev:
                 # if pv is using --onpart, use original device
                 pv_name = data.onPart.get(pv, pv)
-                dev = devicetree.resolve_device(pv_name) or lookup_alias(devicetree, pv)
+                dev = devicetree.resolve_device(pv_name) or lookup_alias(storage, pv)
             if dev and dev.format.type == "luks":
                 try:
                     dev = dev.children[0]
@@ -927,7 +930,7 @@ class CustomPartitioningTask(NonInteractivePartitioningTask):
 
         # If cache PVs specified, check that they belong to the same VG this LV is a member of
         if logvol_data.cache_pvs:
-            pv_devices = (lookup_alias(devicetree, pv) for pv in logvol_data.cache_pvs)
+            pv_devices = (lookup_alias(storage, pv) for pv in logvol_data.cache_pvs)
             if not all(pv in vg.pvs for pv in pv_devices):
                 raise KickstartParseError(
                     _("Cache PVs must belong to the same VG as the cached LV"),
@@ -1096,7 +1099,7 @@ class CustomPartitioningTask(NonInteractivePartitioningTask):
                 maxsize = None
 
             if logvol_data.cache_size and logvol_data.cache_pvs:
-                pv_devices = [lookup_alias(devicetree, pv) for pv in logvol_data.cache_pvs]
+                pv_devices = [lookup_alias(storage, pv) for pv in logvol_data.cache_pvs]
                 cache_size = Size("%d MiB" % logvol_data.cache_size)
                 cache_mode = logvol_data.cache_mode or None
                 cache_request = LVMCacheRequest(cache_size, pv_devices, cache_mode)
@@ -1215,7 +1218,7 @@ class CustomPartitioningTask(NonInteractivePartitioningTask):
             if not dev:
                 # if using --onpart, use original device
                 member_name = data.onPart.get(member, member)
-                dev = devicetree.resolve_device(member_name) or lookup_alias(devicetree, member)
+                dev = devicetree.resolve_device(member_name) or lookup_alias(storage, member)
 
             if dev and dev.format.type == "luks":
                 try:
@@ -48,9 +48,9 @@ class InteractivePartitioningModule(PartitioningModule):
         """Create the device tree module."""
         return DeviceTreeSchedulerModule()
 
-    def _create_storage_playground(self):
-        """Prepare the current storage model for partitioning."""
-        storage = super()._create_storage_playground()
+    def _setup_storage_playground(self, storage):
+        """Prepare the copy of the current storage model for partitioning."""
+        super()._setup_storage_playground(storage)
 
         # Ensure all disks have appropriate disk labels.
         config = DiskInitializationConfig()
@@ -60,8 +60,6 @@ class InteractivePartitioningModule(PartitioningModule):
             if config.can_initialize(storage, disk):
                 storage.initialize_disk(disk)
 
-        return storage
-
     def configure_with_task(self):
         """Complete the scheduled partitioning."""
         return InteractivePartitioningTask(self.storage)
@@ -324,7 +324,11 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         :raise: StorageConfigurationError if the device cannot be created
         """
         task = AddDeviceTask(self.storage, request)
-        task.run()
+
+        try:
+            task.run()
+        finally:
+            self.storage.update_generation()
 
     def change_device(self, request, original_request):
         """Change a device in the storage model.
@@ -337,7 +341,11 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         """
         device = self._get_device(request.device_spec)
         task = ChangeDeviceTask(self.storage, device, request, original_request)
-        task.run()
+
+        try:
+            task.run()
+        finally:
+            self.storage.update_generation()
 
     def reset_device(self, device_name):
         """Reset the specified device in the storage model.
@@ -354,7 +362,7 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
             self.storage.reset_device(device)
         else:
             # Destroy a non-existing device.
-            utils.destroy_device(self.storage, device)
+            self._destroy_device(device)
 
     def destroy_device(self, device_name):
         """Destroy the specified device in the storage model.
@@ -363,7 +371,14 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         :raise: StorageConfigurationError in case of failure
         """
         device = self._get_device(device_name)
-        utils.destroy_device(self.storage, device)
+        self._destroy_device(device)
+
+    def _destroy_device(self, device):
+        """Destroy the device and update the generation of the model."""
+        try:
+            utils.destroy_device(self.storage, device)
+        finally:
+            self.storage.update_generation()
 
     def schedule_partitions_with_task(self, request):
         """Schedule the partitioning actions.
@@ -374,4 +389,6 @@ class DeviceTreeSchedulerModule(DeviceTreeModule):
         :param: a partitioning request
         :return: a task
         """
-        return InteractiveAutoPartitioningTask(self.storage, request)
+        task = InteractiveAutoPartitioningTask(self.storage, request)
+        task.stopped_signal.connect(self.storage.update_generation)
+        return task
@@ -45,10 +45,17 @@ from pyanaconda.core.storage import DEVICE_TEXT_MAP, PARTITION_ONLY_FORMAT_TYPES
 log = get_module_logger(__name__)
 
 
-def filter_unsupported_disklabel_devices(devices):
-    """Return input list minus any devices that exist on an unsupported disklabel."""
+def filter_unsupported_disklabel_devices(devices, index=None):
+    """Return input list minus any devices that exist on an unsupported disklabel.
+
+    :param devices: a list of devices
+    :param index: an index of the device tree or None
+    :return: a list of devices
+    """
+    get_ancestors = index.get_ancestors if index else lambda d: d.ancestors
+
     return [d for d in devices if not any(
-        not getattr(p, "disklabel_supported", True) for p in d.ancestors
+        not getattr(p, "disklabel_supported", True) for p in get_ancestors(d)
     )]
 
 
@@ -58,23 +65,27 @@ def collect_used_devices(storage):
     :param storage: an instance of Blivet
     :return: a list of devices
     """
+    index = storage.index
     used_devices = []
 
     for root in storage.roots:
         for device in list(root.mounts.values()) + root.swaps:
-            if device not in storage.devices:
+            if device not in index:
                 continue
-            used_devices.extend(device.ancestors)
+            used_devices.extend(index.get_ancestors(device))
 
     for new in [d for d in storage.devicetree.leaves if not d.format.exists]:
         if new.format.mountable and not new.format.mountpoint:
             continue
-        used_devices.extend(new.ancestors)
+        used_devices.extend(index.get_ancestors(new))
 
     for device in storage.partitions:
         if getattr(device, "is_logical", False):
             extended = device.disk.format.extended_partition.path
-            used_devices.append(storage.devicetree.get_device_by_path(extended))
+            used_devices.append(
+                index.get_device_by_path(extended)
+                or storage.devicetree.get_device_by_path(extended)
+            )
 
     return used_devices
 
@@ -108,7 +119,9 @@ def collect_unused_devices(storage):
         if not d.format.supported
     ]
 
-    return filter_unsupported_disklabel_devices(unused + incomplete + unsupported)
+    return filter_unsupported_disklabel_devices(
+        unused + incomplete + unsupported, storage.index
+    )
 
 
 def collect_bootloader_devices(storage, boot_drive):
@@ -128,7 +141,7 @@ def collect_bootloader_devices(storage, boot_drive):
         if not boot_drive or boot_drive in (d.name for d in device.disks):
             devices.append(device)
 
-    return filter_unsupported_disklabel_devices(devices)
+    return filter_unsupported_disklabel_devices(devices, storage.index)
 
 
 def collect_new_devices(storage, boot_drive):
@@ -149,16 +162,19 @@ def collect_new_devices(storage, boot_drive):
     # If mount points have been assigned to any existing devices, go ahead
     # and pull those in along with any existing swap devices. It doesn't
     # matter if the formats being mounted exist or not.
+    mounted_devices = list(storage.mountpoints.values())
     new_mounts = [
-        d for d in storage.mountpoints.values() if d.exists
+        d for d in mounted_devices if d.exists
     ]
 
     if new_mounts or new_devices:
-        new_devices.extend(storage.mountpoints.values())
+        new_devices.extend(mounted_devices)
         new_devices.extend(collect_bootloader_devices(storage, boot_drive))
 
     # Remove duplicates, but keep the order.
-    return filter_unsupported_disklabel_devices(list(dict.fromkeys(new_devices)))
+    return filter_unsupported_disklabel_devices(
+        list(dict.fromkeys(new_devices)), storage.index
+    )
 
 
 def collect_roots(storage):
@@ -168,7 +184,9 @@ def collect_roots(storage):
     :return: a list of roots
     """
     roots = []
-    supported_devices = set(filter_unsupported_disklabel_devices(storage.devices))
+    supported_devices = set(filter_unsupported_disklabel_devices(
+        storage.devices, storage.index
+    ))
 
     # Get the name of the new installation.
     new_root_name = get_new_root_name()
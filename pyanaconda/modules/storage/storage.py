@@ -309,15 +309,16 @@ class StorageService(KickstartService):
         :param module: a partitioning module
         :raise: InvalidStorageError of the partitioning is not valid
         """
-        # Validate the partitioning.
-        storage = module.storage.copy()
-        task = StorageValidateTask(storage)
+        # Validate the partitioning. The validation doesn't change
+        # the storage model, so copy it only if it is valid.
+        task = StorageValidateTask(module.storage)
         report = task.run()
 
         if not report.is_valid():
             raise InvalidStorageError(" ".join(report.error_messages))
 
         # Apply the partitioning.
+        storage = module.storage.copy()
         self._set_storage_playground(storage)
         self._set_applied_partitioning(module)
 
@@ -16,16 +16,23 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+import io
 import os
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core import util
 from pyanaconda.core.kernel import kernel_arguments
 from pyanaconda.payload.requirement import PayloadRequirements
-from pyanaconda.anaconda_loggers import get_module_logger
+from pyanaconda.anaconda_logging import program_log_lock
+from pyanaconda.anaconda_loggers import get_module_logger, get_program_logger
 
 log = get_module_logger(__name__)
+program_log = get_program_logger()
+
+# Memory that should be available for one run of dracut.
+INITRAMFS_JOB_MEMORY = 512 * 1024 * 1024
 
 __all__ = ["Payload"]
 
@@ -174,6 +181,10 @@ class Payload(metaclass=ABCMeta):
         This needs to be done after all configuration files have been
         written, since dracut depends on some of them.
 
+        The initrds of multiple kernels are generated in parallel if
+        dracut is used directly. The output of every run is logged at
+        once when the run is finished.
+
         :returns: None
         """
         if os.path.exists(conf.target.system_root + "/usr/sbin/new-kernel-pkg"):
@@ -182,37 +193,108 @@ class Payload(metaclass=ABCMeta):
             log.debug("new-kernel-pkg does not exist, using dracut instead.")
             use_dracut = True
 
-        for kernel in self.kernel_version_list:
-            log.info("recreating initrd for %s", kernel)
-            if not conf.target.is_image:
-                if use_dracut:
-                    util.execInSysroot("depmod", ["-a", kernel])
-                    util.execInSysroot("dracut",
-                                       ["-f",
-                                        "/boot/initramfs-%s.img" % kernel,
-                                        kernel])
-                else:
-                    util.execInSysroot("new-kernel-pkg",
-                                       ["--mkinitrd", "--dracut", "--depmod",
-                                        "--update", kernel])
-
-                # if the installation is running in fips mode then make sure
-                # fips is also correctly enabled in the installed system
-                if kernel_arguments.get("fips") == "1":
-                    # We use the --no-bootcfg option as we don't want fips-mode-setup to
-                    # modify the bootloader configuration.
-                    # Anaconda already does everything needed & it would require grubby to
-                    # be available on the system.
-                    util.execInSysroot("fips-mode-setup", ["--enable", "--no-bootcfg"])
+        kernels = self.kernel_version_list
 
-            else:
+        if not kernels:
+            return
+
+        # new-kernel-pkg updates the bootloader configuration,
+        # so it can't run in parallel
+        if use_dracut or conf.target.is_image:
+            max_workers = self._get_initrd_jobs(len(kernels))
+        else:
+            max_workers = 1
+
+        log.debug("Recreating initrds for %d kernel(s) in %d thread(s).",
+                  len(kernels), max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="AnaInitrdThread") as executor:
+            futures = [
+                executor.submit(self._recreate_initrd, kernel, use_dracut)
+                for kernel in kernels
+            ]
+
+        # raise the first error
+        for future in futures:
+            future.result()
+
+        # if the installation is running in fips mode then make sure
+        # fips is also correctly enabled in the installed system
+        if not conf.target.is_image and kernel_arguments.get("fips") == "1":
+            # We use the --no-bootcfg option as we don't want fips-mode-setup to
+            # modify the bootloader configuration.
+            # Anaconda already does everything needed & it would require grubby to
+            # be available on the system.
+            util.execInSysroot("fips-mode-setup", ["--enable", "--no-bootcfg"])
+
+    @staticmethod
+    def _get_initrd_jobs(kernel_count):
+        """Get a number of initrds that can be generated in parallel.
+
+        The number is limited by the number of CPUs and the available memory.
+
+        :param kernel_count: a number of kernels
+        :return: a number of parallel jobs
+        """
+        jobs = min(kernel_count, os.cpu_count() or 1)
+        memory = util.get_available_memory()
+
+        if memory is not None:
+            jobs = min(jobs, memory // INITRAMFS_JOB_MEMORY)
+
+        return max(jobs, 1)
+
+    def _recreate_initrd(self, kernel, use_dracut):
+        """Recreate the initrd of the given kernel.
+
+        :param kernel: a kernel version
+        :param use_dracut: should we call dracut instead of new-kernel-pkg?
+        """
+        log.info("recreating initrd for %s", kernel)
+        output = io.StringIO()
+
+        try:
+            if conf.target.is_image:
                 # hostonly is not sensible for disk image installations
                 # using /dev/disk/by-uuid/ is necessary due to disk image naming
-                util.execInSysroot("dracut",
-                                   ["-N",
-                                    "--persistent-policy", "by-uuid",
-                                    "-f", "/boot/initramfs-%s.img" % kernel,
-                                    kernel])
+                self._run_initrd_command(output, "dracut",
+                                         ["-N",
+                                          "--persistent-policy", "by-uuid",
+                                          "-f", "/boot/initramfs-%s.img" % kernel,
+                                          kernel])
+            elif use_dracut:
+                self._run_initrd_command(output, "depmod", ["-a", kernel])
+                self._run_initrd_command(output, "dracut",
+                                         ["-f",
+                                          "/boot/initramfs-%s.img" % kernel,
+                                          kernel])
+            else:
+                self._run_initrd_command(output, "new-kernel-pkg",
+                                         ["--mkinitrd", "--dracut", "--depmod",
+                                          "--update", kernel])
+        finally:
+            # log the output of the kernel in one block
+            with program_log_lock:
+                for line in output.getvalue().splitlines():
+                    program_log.info("[%s] %s", kernel, line)
+
+        log.info("recreated initrd for %s", kernel)
+
+    @staticmethod
+    def _run_initrd_command(output, command, argv):
+        """Run a command that generates the initrd.
+
+        The command and its return code are logged as usual, but the output
+        is written only to the given file object.
+
+        :param output: a file object to write the output to
+        :param command: a command to run
+        :param argv: a list of arguments
+        :return: a return code of the command
+        """
+        return util.execWithRedirect(command, argv, stdout=output,
+                                     root=conf.target.system_root, log_output=False)
 
     def post_install(self):
         """Perform post-installation tasks."""
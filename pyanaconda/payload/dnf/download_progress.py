@@ -15,7 +15,6 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
-import collections
 import time
 
 import dnf
@@ -43,40 +42,104 @@ def paced(fn):
 
 
 class DownloadProgress(dnf.callback.DownloadProgress):
-    def __init__(self):
+    """Report the progress of the package download.
+
+    The callbacks are called for every downloaded chunk of every package,
+    so they have to take a constant time. The downloaded size of every
+    package in progress is stored under its DNF payload and the total
+    downloaded size is updated with the differences.
+    """
+
+    def __init__(self, queue_instance=None):
+        """Create a new download progress.
+
+        :param queue_instance: a queue for the progress messages or None
+        """
         super().__init__()
-        self.downloads = collections.defaultdict(int)
-        self.last_time = time.time()
+        self._queue = queue_instance
+        self.downloads = {}
+        self.downloaded = 0
+        self.start_time = time.time()
+        self.last_time = self.start_time
         self.total_files = 0
         self.total_size = Size(0)
 
+    def _set_downloaded(self, dnf_payload, done):
+        """Set the downloaded size of the given package."""
+        self.downloaded += done - self.downloads.get(dnf_payload, 0)
+        self.downloads[dnf_payload] = done
+
+    def _get_speed(self):
+        """Get the average download speed in bytes per second."""
+        elapsed = self.last_time - self.start_time
+
+        if elapsed <= 0:
+            return 0
+
+        return self.downloaded / elapsed
+
+    def _get_remaining_time(self, speed):
+        """Get the estimated remaining time in seconds."""
+        if speed <= 0:
+            return None
+
+        return max(int(self.total_size) - self.downloaded, 0) / speed
+
     @paced
     def _update(self):
+        speed = self._get_speed()
+        remaining_time = self._get_remaining_time(speed)
+
         msg = _('Downloading %(total_files)s RPMs, '
                 '%(downloaded)s / %(total_size)s (%(percent)d%%) done.')
-        downloaded = Size(sum(self.downloads.values()))
+
         vals = {
-            'downloaded': downloaded,
-            'percent': int(100 * downloaded / self.total_size),
+            'downloaded': Size(self.downloaded),
+            'percent': int(100 * self.downloaded / self.total_size) if self.total_size else 0,
             'total_files': self.total_files,
             'total_size': self.total_size
         }
-        progressQ.send_message(msg % vals)
+
+        msg = msg % vals
+
+        if remaining_time is not None:
+            msg += " " + _('%(speed)s/s, %(minutes)d:%(seconds)02d remaining.') % {
+                'speed': Size(int(speed)),
+                'minutes': remaining_time // 60,
+                'seconds': remaining_time % 60
+            }
+
+        self._send_message(msg)
+
+    def _send_message(self, msg):
+        """Send the progress message.
+
+        If there is a queue, send the message as a 'download' message
+        of the transaction protocol. Otherwise, send it to the UI.
+        """
+        if self._queue:
+            self._queue.put(('download', msg))
+        else:
+            progressQ.send_message(msg)
 
     def end(self, dnf_payload, status, msg):  # pylint: disable=arguments-differ
-        nevra = str(dnf_payload)
-        if status is dnf.callback.STATUS_OK:
-            self.downloads[nevra] = dnf_payload.download_size
-            self._update()
+        if status is not dnf.callback.STATUS_OK:
+            # Forget the partial download, the package can be downloaded again.
+            self.downloaded -= self.downloads.pop(dnf_payload, 0)
+            log.warning("Failed to download '%s': %d - %s", str(dnf_payload), status, msg)
             return
-        log.warning("Failed to download '%s': %d - %s", nevra, status, msg)
+
+        # Account the whole package and forget it.
+        self._set_downloaded(dnf_payload, dnf_payload.download_size)
+        self.downloads.pop(dnf_payload)
+        self._update()
 
     def progress(self, dnf_payload, done):  # pylint: disable=arguments-differ
-        nevra = str(dnf_payload)
-        self.downloads[nevra] = done
+        self._set_downloaded(dnf_payload, done)
         self._update()
 
     # TODO: Remove pylint disable after DNF-2.5.0 will arrive in Fedora
     def start(self, total_files, total_size, total_drpms=0):  # pylint: disable=arguments-differ
         self.total_files = total_files
         self.total_size = Size(total_size)
+        self.start_time = time.time()
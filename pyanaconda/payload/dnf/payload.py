@@ -17,6 +17,7 @@
 # Red Hat, Inc.
 #
 import configparser
+import copy
 import functools
 import multiprocessing
 import os
@@ -68,10 +69,13 @@ from pyanaconda.modules.common.errors.storage import DeviceSetupError, MountFile
 from pyanaconda.payload import utils as payload_utils
 from pyanaconda.payload.base import Payload
 from pyanaconda.payload.dnf.utils import DNF_CACHE_DIR, DNF_PLUGINCONF_DIR, REPO_DIRS, \
-    DNF_LIBREPO_LOG, DNF_PACKAGE_CACHE_DIR_SUFFIX, BONUS_SIZE_ON_FILE, YUM_REPOS_DIR, \
-    go_to_failure_limbo, do_transaction, get_df_map, pick_mount_point
+    DNF_LIBREPO_LOG, DNF_PACKAGE_CACHE_DIR_SUFFIX, YUM_REPOS_DIR, calculate_required_space, \
+    go_to_failure_limbo, do_transaction, do_batch_transaction, get_df_map, get_package_filter, \
+    load_repositories, pick_mount_point, split_packages_into_batches
 from pyanaconda.payload.dnf.download_progress import DownloadProgress
-from pyanaconda.payload.dnf.repomd import RepoMDMetaHash
+from pyanaconda.payload.dnf.repomd import RepoMDMetaHash, RepoMDCache
+from pyanaconda.payload.dnf.resolution import ResolutionCache, ResolutionResult, \
+    get_selection_key
 from pyanaconda.payload.errors import MetadataError, PayloadError, NoSuchGroup, DependencyError, \
     PayloadInstallError, PayloadSetupError
 from pyanaconda.payload.image import find_first_iso_image, mountImage
@@ -79,6 +83,7 @@ from pyanaconda.payload.install_tree_metadata import InstallTreeMetadata
 from pyanaconda.product import productName, productVersion
 from pyanaconda.progress import progressQ, progress_message
 from pyanaconda.simpleconfig import SimpleConfigFile
+from pyanaconda.threading import threadMgr, AnacondaThread
 from pyanaconda.ui.lib.payload import get_payload, get_source, create_source, set_source, \
     set_up_sources, tear_down_sources
 
@@ -127,6 +132,20 @@ class DNFPayload(Payload):
         # save repomd metadata
         self._repoMD_list = []
 
+        # hashes of repomd files of repos with cached metadata
+        self._repoMD_cache = RepoMDCache()
+
+        # Results of the dependency resolution of software selections.
+        # The lock protects the goal and the transaction of the DNF base.
+        self._resolution_cache = ResolutionCache()
+        self._resolution_lock = threading.RLock()
+        self._resolution_cancelled = threading.Event()
+        self._resolution = None
+        self._transaction_key = None
+
+        # The space required by the current transaction.
+        self._space_required_memo = (None, None, None)
+
         self._req_groups = set()
         self._req_packages = set()
         self.requirements.set_apply_callback(self._apply_requirements)
@@ -214,8 +233,13 @@ class DNFPayload(Payload):
 
     def unsetup(self):
         super().unsetup()
-        self._base = None
-        self._configure()
+
+        self._cancel_resolution_in_advance()
+        with self._resolution_lock:
+            self._reset_resolution()
+            self._base = None
+            self._configure()
+
         self._repoMD_list = []
         self._install_tree_metadata = None
         tear_down_sources(self.proxy)
@@ -349,19 +373,38 @@ class DNFPayload(Payload):
         :type repo_name: str
         :returns: None
         """
-        repo = self._base.repos[repo_name]
-        repo.enable()
-        try:
-            # Load the metadata to verify that the repo is valid
-            repo.load()
-        except dnf.exceptions.RepoError as e:
-            repo.disable()
-            log.debug("repo: '%s' - %s failed to load repomd", repo.id,
+        self._fetch_repos_md([repo_name])
+
+    def _fetch_repos_md(self, repo_names):
+        """Download metadata of the given repos concurrently.
+
+        All repos are loaded even if some of them fail. The repos that
+        failed are disabled and the error of the first one is raised.
+
+        :param repo_names: a list of names/ids of repos to fetch
+        :raise MetadataError: if any of the repos failed to load
+        """
+        repos = [self._base.repos[name] for name in repo_names]
+
+        for repo in repos:
+            repo.enable()
+
+        error = None
+
+        for repo, repo_error in zip(repos, self._load_repositories(repos)):
+            if repo_error:
+                self._repoMD_cache.invalidate(repo)
+                repo.disable()
+                log.debug("repo: '%s' - %s failed to load repomd", repo.id,
+                          repo.baseurl or repo.mirrorlist or repo.metalink)
+                error = error or repo_error
+                continue
+
+            log.info("enabled repo: '%s' - %s and got repomd", repo.id,
                      repo.baseurl or repo.mirrorlist or repo.metalink)
-            raise MetadataError(e)
 
-        log.info("enabled repo: '%s' - %s and got repomd", repo.id,
-                 repo.baseurl or repo.mirrorlist or repo.metalink)
+        if error:
+            raise MetadataError(error)
 
     def add_repo(self, ksrepo):
         """Add an enabled repo to dnf and kickstart repo lists.
@@ -384,8 +427,11 @@ class DNFPayload(Payload):
         ksrepo.enabled = True
         self.data.repo.dataList().append(ksrepo)
 
-    def _process_module_command(self):
-        """Enable/disable modules (if any)."""
+    def _get_module_specs(self):
+        """Get module specs to enable and to disable.
+
+        :return: a tuple of two lists of module specs
+        """
         # convert data from kickstart to module specs
         module_specs_to_enable = []
         module_specs_to_disable = []
@@ -404,6 +450,16 @@ class DNFPayload(Payload):
             else:
                 module_specs_to_disable.append(module_spec)
 
+        return module_specs_to_enable, module_specs_to_disable
+
+    def _process_module_command(self, report_error=None):
+        """Enable/disable modules (if any).
+
+        :param report_error: a function for error reporting or None
+        """
+        report_error = report_error or self._payload_setup_error
+        module_specs_to_enable, module_specs_to_disable = self._get_module_specs()
+
         # forward the module specs to disable to DNF
         log.debug("disabling modules: %s", module_specs_to_disable)
         try:
@@ -414,7 +470,7 @@ class DNFPayload(Payload):
                 "ModuleBase.disable(): some packages, groups "
                 "or modules are missing or broken:\n%s", e
             )
-            self._payload_setup_error(e)
+            report_error(e)
 
         # forward the module specs to enable to DNF
         log.debug("enabling modules: %s", module_specs_to_enable)
@@ -424,11 +480,14 @@ class DNFPayload(Payload):
         except dnf.exceptions.MarkingErrors as e:
             log.debug("ModuleBase.enable(): some packages, groups "
                       "or modules are missing or broken:\n%s", e)
-            self._payload_setup_error(e)
+            report_error(e)
 
-    def _apply_selections(self):
-        log.debug("applying DNF package/group/module selection")
+    def _get_selection(self, packages):
+        """Get specs of packages and groups to include and exclude.
 
+        :param packages: the kickstart data of the packages section
+        :return: a tuple of the include list and the exclude list
+        """
         # note about package/group/module spec formatting:
         # - leading @ signifies a group or module
         # - no leading @ means a package
@@ -437,12 +496,12 @@ class DNFPayload(Payload):
         exclude_list = []
 
         # handle "normal" groups
-        for group in self.data.packages.excludedGroupList:
+        for group in packages.excludedGroupList:
             log.debug("excluding group %s", group.name)
             exclude_list.append("@{}".format(group.name))
 
         # core groups
-        if self.data.packages.nocore:
+        if packages.nocore:
             log.info("skipping core group due to %%packages "
                      "--nocore; system may not be complete")
             exclude_list.append("@core")
@@ -452,17 +511,17 @@ class DNFPayload(Payload):
 
         # environment
         env = None
-        if self.data.packages.default and self.environments:
+        if packages.default and self.environments:
             env = self.environments[0]
             log.info("selecting default environment: %s", env)
-        elif self.data.packages.environment:
-            env = self.data.packages.environment
+        elif packages.environment:
+            env = packages.environment
             log.info("selected environment: %s", env)
         if env:
             include_list.append("@{}".format(env))
 
         # groups from kickstart data
-        for group in self.data.packages.groupList:
+        for group in packages.groupList:
             default = group.include in (GROUP_ALL,
                                         GROUP_DEFAULT)
             optional = group.include == GROUP_ALL
@@ -496,11 +555,11 @@ class DNFPayload(Payload):
             include_list.append(group_spec)
 
         # handle packages
-        for pkg_name in self.data.packages.excludedList:
+        for pkg_name in packages.excludedList:
             log.info("excluded package: '%s'", pkg_name)
             exclude_list.append(pkg_name)
 
-        for pkg_name in self.data.packages.packageList:
+        for pkg_name in packages.packageList:
             log.info("selected package: '%s'", pkg_name)
             include_list.append(pkg_name)
 
@@ -518,6 +577,36 @@ class DNFPayload(Payload):
         # add packages
         include_list.extend(self._req_packages)
 
+        return include_list, exclude_list
+
+    def _get_selection_key(self, include_list, exclude_list):
+        """Get a key of the software selection for the resolution cache.
+
+        :param include_list: a list of specs to include
+        :param exclude_list: a list of specs to exclude
+        :return: a hashable key
+        """
+        options = (
+            self.data.packages.handleMissing,
+            self._base.conf.strict,
+            self._base.conf.multilib_policy,
+            self._base.conf.install_weak_deps,
+        )
+        return get_selection_key(include_list, exclude_list, self._get_module_specs(), options)
+
+    def _apply_selections(self, include_list, exclude_list, report_error=None,
+                          report_warning=None):
+        """Apply the selection of packages, groups and modules.
+
+        :param include_list: a list of specs to include
+        :param exclude_list: a list of specs to exclude
+        :param report_error: a function for error reporting or None
+        :param report_warning: a function for warning reporting or None
+        """
+        report_error = report_error or self._payload_setup_error
+        report_warning = report_warning or log.info
+        log.debug("applying DNF package/group/module selection")
+
         # log the resulting set
         log.debug("transaction include list")
         log.debug(include_list)
@@ -538,12 +627,12 @@ class DNFPayload(Payload):
                 e.error_pkg_specs or \
                 e.module_depsolv_errors
             if not transaction_broken and self.data.packages.handleMissing == KS_MISSING_IGNORE:
-                log.info("ignoring missing package/group/module "
-                         "specs due to --ignoremissing flag in kickstart")
+                report_warning("ignoring missing package/group/module "
+                               "specs due to --ignoremissing flag in kickstart")
             else:
-                self._payload_setup_error(e)
+                report_error(e)
         except Exception as e:  # pylint: disable=broad-except
-            self._payload_setup_error(e)
+            report_error(e)
 
     def _apply_requirements(self, requirements):
         self._req_groups = set()
@@ -710,6 +799,12 @@ class DNFPayload(Payload):
 
     @property
     def _download_space(self):
+        if self._resolution and self._resolution.download_space is not None:
+            return self._resolution.download_space
+
+        return self._get_download_space()
+
+    def _get_download_space(self):
         transaction = self._base.transaction
         if transaction is None:
             return Size(0)
@@ -806,14 +901,49 @@ class DNFPayload(Payload):
             langpacks.append("langpacks-" + loc)
         return langpacks
 
-    def _sync_metadata(self, dnf_repo):
-        try:
-            dnf_repo.load()
-        except dnf.exceptions.RepoError as e:
-            id_ = dnf_repo.id
-            log.info('_sync_metadata: addon repo error: %s', e)
-            self.disable_repo(id_)
-            self.verbose_errors.append(str(e))
+    def _load_repositories(self, repos):
+        """Load metadata of the given repos concurrently.
+
+        :param repos: a list of DNF repositories
+        :return: a list of errors or None values in the same order
+        """
+        proxy_url = self._get_proxy_url()
+
+        def prepare(repo):
+            self._use_cached_metadata(repo, proxy_url)
+
+        return load_repositories(repos, prepare=prepare)
+
+    def _use_cached_metadata(self, repo, proxy_url):
+        """Reuse the cached metadata of the repo if they are still valid.
+
+        If the hash of the repomd.xml file is the same as when the metadata
+        were loaded last time, DNF will use its cache without any checks.
+        Otherwise, DNF will check the repo and download the metadata only
+        if they changed.
+
+        :param repo: a DNF repository
+        :param proxy_url: a proxy URL or None
+        """
+        if self._repoMD_cache.is_valid(repo, proxy_url):
+            log.debug("repo %s: using cached metadata", repo.id)
+            repo.metadata_expire = -1
+        else:
+            repo.metadata_expire = 0
+
+    def _sync_metadata(self, dnf_repo, error=None):
+        """Process the result of loading the repo metadata.
+
+        :param dnf_repo: a DNF repository
+        :param error: an error raised by loading the metadata or None
+        """
+        if error:
+            log.info('_sync_metadata: addon repo error: %s', error)
+            self._repoMD_cache.invalidate(dnf_repo)
+            self.disable_repo(dnf_repo.id)
+            self.verbose_errors.append(str(error))
+            return
+
         log.debug('repo %s: _sync_metadata success from %s', dnf_repo.id,
                   dnf_repo.baseurl or dnf_repo.mirrorlist or dnf_repo.metalink)
 
@@ -1058,26 +1188,28 @@ class DNFPayload(Payload):
         return size
 
     def _space_required(self):
+        if self._resolution and self._resolution.install_space is not None:
+            return self._resolution.install_space
+
+        return self._get_space_required()
+
+    def _get_space_required(self):
         transaction = self._base.transaction
         if transaction is None:
             return Size("3000 MB")
 
-        size = 0
-        files_nm = 0
-        for tsi in transaction:
-            # space taken by all files installed by the packages
-            size += tsi.pkg.installsize
-            # number of files installed on the system
-            files_nm += len(tsi.pkg.files)
-
-        # append bonus size depending on number of files
-        bonus_size = files_nm * BONUS_SIZE_ON_FILE
-        size = Size(size)
-        # add another 10% as safeguard
-        total_space = (size + bonus_size) * 1.1
-        log.debug("Size from DNF: %s", size)
-        log.debug("Bonus size %s by number of files %s", bonus_size, files_nm)
-        log.debug("Total size required %s", total_space)
+        # The result is memoized for the current transaction.
+        tx_id, memoized_transaction, total_space = self._space_required_memo
+
+        if tx_id == self.tx_id and memoized_transaction is transaction:
+            return total_space
+
+        total_space = calculate_required_space(
+            [tsi.pkg for tsi in transaction],
+            precise=conf.payload.enable_precise_space_estimation
+        )
+
+        self._space_required_memo = (self.tx_id, transaction, total_space)
         return total_space
 
     def _is_group_visible(self, grpid):
@@ -1086,12 +1218,84 @@ class DNFPayload(Payload):
             raise NoSuchGroup(grpid)
         return grp.visible
 
-    def check_software_selection(self):
+    def check_software_selection(self, use_cache=True):
+        """Check the software selection.
+
+        The results of the dependency resolution are cached. If the result
+        of the current selection is cached, the DNF transaction is not
+        resolved again, so the cache shouldn't be used before the installation.
+        A transaction of a different selection is dropped in that case.
+
+        The errors and the warnings of the selection are reported again
+        if a cached result is used.
+
+        :param use_cache: use a cached result of the selection if possible
+        :raise DependencyError: if the dependencies can't be resolved
+        """
         log.info("checking software selection")
         self._bump_tx_id()
+
+        with self._resolution_lock:
+            self._resolution = None
+            include_list, exclude_list = self._get_selection(self.data.packages)
+            key = self._get_selection_key(include_list, exclude_list)
+            result = self._resolution_cache.get(key) if use_cache else None
+
+            if result:
+                log.info("using the cached resolution of the software selection")
+
+                if self._transaction_key != key:
+                    self._base.reset(goal=True)
+                    self._transaction_key = None
+            else:
+                result = self._resolve_selection(include_list, exclude_list, key)
+
+            self._resolution = result
+
+        for msg in result.warnings:
+            log.info(msg)
+
+        for exn in result.setup_errors:
+            self._payload_setup_error(exn)
+
+        if result.error:
+            log.warning(result.error)
+            raise DependencyError(result.error)
+
+        log.info("%d packages selected totalling %s",
+                 result.package_count, self.space_required)
+
+    def _resolve_selection(self, include_list, exclude_list, key, cancelled=None):
+        """Apply the software selection, resolve it and cache the result.
+
+        The errors and the warnings of the selection are not reported.
+        They are stored in the result instead.
+
+        :param include_list: a list of specs to include
+        :param exclude_list: a list of specs to exclude
+        :param key: a key of the software selection
+        :param cancelled: a function that returns True if the resolution is cancelled
+        :return: an instance of ResolutionResult or None if cancelled
+        """
+        cancelled = cancelled or (lambda: False)
+        setup_errors = []
+        warnings = []
+
         self._base.reset(goal=True)
-        self._process_module_command()
-        self._apply_selections()
+        self._transaction_key = None
+
+        if cancelled():
+            return None
+
+        self._process_module_command(setup_errors.append)
+
+        if cancelled():
+            return None
+
+        self._apply_selections(include_list, exclude_list, setup_errors.append, warnings.append)
+
+        if cancelled():
+            return None
 
         try:
             if self._base.resolve():
@@ -1099,12 +1303,114 @@ class DNFPayload(Payload):
             else:
                 log.info("empty transaction")
         except dnf.exceptions.DepsolveError as e:
-            msg = str(e)
-            log.warning(msg)
-            raise DependencyError(msg)
+            result = ResolutionResult(
+                error=str(e),
+                setup_errors=setup_errors,
+                warnings=warnings
+            )
+        else:
+            result = ResolutionResult(
+                package_count=len(self._base.transaction),
+                install_space=self._get_space_required(),
+                download_space=self._get_download_space(),
+                setup_errors=setup_errors,
+                warnings=warnings
+            )
 
-        log.info("%d packages selected totalling %s",
-                 len(self._base.transaction), self.space_required)
+        self._transaction_key = key
+        self._resolution_cache.set(key, result)
+        return result
+
+    def _reset_resolution(self):
+        """Forget all results of the dependency resolution.
+
+        Call this method every time the sack changes.
+        """
+        self._resolution = None
+        self._resolution_cache.clear()
+        self._transaction_key = None
+
+    def _cancel_resolution_in_advance(self):
+        """Cancel the resolution of the default selection in advance.
+
+        Call this method before the resolution lock is acquired
+        to reset the sack, so the reset doesn't have to wait for
+        the whole resolution in advance.
+        """
+        self._resolution_cancelled.set()
+
+    def _get_default_environment(self):
+        """Get the environment selected by default in the UI."""
+        environments = self.environments
+
+        if conf.payload.default_environment in environments:
+            return conf.payload.default_environment
+
+        if environments:
+            return environments[0]
+
+        return None
+
+    def _start_resolution_of_default_selection(self):
+        """Start to resolve the default software selection in the background.
+
+        The result will be cached, so the first check of the software
+        selection will be fast.
+        """
+        if flags.automatedInstall or self.data.module.dataList():
+            return
+
+        if threadMgr.get(constants.THREAD_RESOLVE_DEFAULT_SELECTION):
+            return
+
+        packages = copy.deepcopy(self.data.packages)
+
+        if not packages.environment and not packages.default:
+            environment = self._get_default_environment()
+
+            if not environment:
+                return
+
+            packages.environment = environment
+            packages.groupList = [
+                Group(group_id, include=GROUP_DEFAULT)
+                for group_id in self.environment_addons[environment][0]
+                if self.environment_option_is_default(environment, group_id)
+            ]
+
+        self._resolution_cancelled.clear()
+        threadMgr.add(AnacondaThread(
+            name=constants.THREAD_RESOLVE_DEFAULT_SELECTION,
+            target=self._resolve_selection_in_advance,
+            args=(packages,),
+            fatal=False
+        ))
+
+    def _resolve_selection_in_advance(self, packages):
+        """Resolve the given software selection and cache the result.
+
+        The errors and the warnings are stored in the result and they
+        will be reported by the check of the software selection. The
+        resolution stops if it is cancelled before the dependencies
+        are resolved.
+
+        :param packages: the kickstart data of the packages section
+        """
+        with self._resolution_lock:
+            include_list, exclude_list = self._get_selection(packages)
+            key = self._get_selection_key(include_list, exclude_list)
+
+            if self._resolution_cache.get(key):
+                return
+
+            log.info("resolving the default software selection in advance")
+            result = self._resolve_selection(
+                include_list, exclude_list, key,
+                cancelled=self._resolution_cancelled.is_set
+            )
+
+            if not result:
+                log.debug("The resolution in advance was cancelled.")
 
     def set_updates_enabled(self, state):
         """Enable or Disable the repos used to update closest mirror.
@@ -1204,11 +1510,19 @@ class DNFPayload(Payload):
 
     def gather_repo_metadata(self):
         with self._repos_lock:
-            for repo in self._base.repos.iter_enabled():
-                self._sync_metadata(repo)
-        self._base.fill_sack(load_system_repo=False)
-        self._base.read_comps(arch_filter=True)
+            repos = list(self._base.repos.iter_enabled())
+
+            for repo, error in zip(repos, self._load_repositories(repos)):
+                self._sync_metadata(repo, error)
+
+        self._cancel_resolution_in_advance()
+        with self._resolution_lock:
+            self._reset_resolution()
+            self._base.fill_sack(load_system_repo=False)
+            self._base.read_comps(arch_filter=True)
+
         self._refresh_environment_addons()
+        self._start_resolution_of_default_selection()
 
     def _refresh_environment_addons(self):
         log.info("Refreshing environment_addons")
@@ -1277,7 +1591,7 @@ class DNFPayload(Payload):
             rpm.addMacro(macro[0], macro[1])
 
         try:
-            self.check_software_selection()
+            self.check_software_selection(use_cache=False)
             self._download_location = self._pick_download_location()
         except PayloadError as e:
             if errors.errorHandler.cb(e) == errors.ERROR_RAISE:
@@ -1288,12 +1602,33 @@ class DNFPayload(Payload):
             log.info("Removing existing package download "
                      "location: %s", self._download_location)
             shutil.rmtree(self._download_location)
-        pkgs_to_download = self._base.transaction.install_set
-        log.info('Downloading packages to %s.', self._download_location)
-        progressQ.send_message(_('Downloading packages'))
-        progress = DownloadProgress()
+
+        if conf.payload.enable_pipelined_installation:
+            self._install_packages_in_batches()
+        else:
+            self._install_packages()
+
+        # Don't close the mother base here, because we still need it.
+        if os.path.exists(self._download_location):
+            log.info("Cleaning up downloaded packages: "
+                     "%s", self._download_location)
+            shutil.rmtree(self._download_location)
+        else:
+            # Some installation sources, such as NFS, don't need to download packages to
+            # local storage, so the download location might not always exist. So for now
+            # warn about this, at least until the RFE in bug 1193121 is implemented and
+            # we don't have to care about clearing the download location ourselves.
+            log.warning("Can't delete nonexistent download "
+                        "location: %s", self._download_location)
+
+    def _download_packages(self, packages, progress):
+        """Download the given packages.
+
+        :param packages: a list of DNF packages
+        :param progress: an instance of DownloadProgress
+        """
         try:
-            self._base.download_packages(pkgs_to_download, progress)
+            self._base.download_packages(packages, progress)
         except dnf.exceptions.DownloadError as e:
             msg = 'Failed to download the following packages: %s' % str(e)
             exc = PayloadInstallError(msg)
@@ -1301,6 +1636,41 @@ class DNFPayload(Payload):
                 log.error("Installation failed: %r", exc)
                 go_to_failure_limbo()
 
+    def _handle_transaction_message(self, token, msg):
+        """Handle a progress message of the transaction process.
+
+        :param token: a type of the message
+        :param msg: a content of the message
+        """
+        if token == 'install':
+            msg = _("Installing %s") % msg
+            progressQ.send_message(msg)
+        elif token == 'configure':
+            msg = _("Configuring %s") % msg
+            progressQ.send_message(msg)
+        elif token == 'verify':
+            msg = _("Verifying %s") % msg
+            progressQ.send_message(msg)
+        elif token == 'download':
+            progressQ.send_message(msg)
+        elif token == 'log':
+            log.info(msg)
+        elif token == 'post':
+            msg = (N_("Performing post-installation setup tasks"))
+            progressQ.send_message(msg)
+        elif token == 'error':
+            exc = PayloadInstallError("DNF error: %s" % msg)
+            if errors.errorHandler.cb(exc) == errors.ERROR_RAISE:
+                log.error("Installation failed: %r", exc)
+                go_to_failure_limbo()
+
+    def _install_packages(self):
+        """Download all packages and install them in one transaction."""
+        pkgs_to_download = self._base.transaction.install_set
+        log.info('Downloading packages to %s.', self._download_location)
+        progressQ.send_message(_('Downloading packages'))
+        progress = DownloadProgress()
+        self._download_packages(pkgs_to_download, progress)
         log.info('Downloading packages finished.')
 
         pre_msg = (N_("Preparing transaction from installation source"))
@@ -1315,45 +1685,127 @@ class DNFPayload(Payload):
         # followed by a 'post' message and then a 'quit' message.
         # If the installation fails it will send 'quit' without 'post'
         while token:
-            if token == 'install':
-                msg = _("Installing %s") % msg
-                progressQ.send_message(msg)
-            elif token == 'configure':
-                msg = _("Configuring %s") % msg
-                progressQ.send_message(msg)
-            elif token == 'verify':
-                msg = _("Verifying %s") % msg
-                progressQ.send_message(msg)
-            elif token == 'log':
-                log.info(msg)
-            elif token == 'post':
-                msg = (N_("Performing post-installation setup tasks"))
-                progressQ.send_message(msg)
-            elif token == 'done':
+            if token == 'done':
                 break  # Installation finished successfully
             elif token == 'quit':
                 msg = ("Payload error - DNF installation has ended up abruptly: %s" % msg)
                 raise PayloadError(msg)
-            elif token == 'error':
-                exc = PayloadInstallError("DNF error: %s" % msg)
-                if errors.errorHandler.cb(exc) == errors.ERROR_RAISE:
-                    log.error("Installation failed: %r", exc)
-                    go_to_failure_limbo()
+
+            self._handle_transaction_message(token, msg)
             (token, msg) = queue_instance.get()
 
         process.join()
-        # Don't close the mother base here, because we still need it.
-        if os.path.exists(self._download_location):
-            log.info("Cleaning up downloaded packages: "
-                     "%s", self._download_location)
-            shutil.rmtree(self._download_location)
-        else:
-            # Some installation sources, such as NFS, don't need to download packages to
-            # local storage, so the download location might not always exist. So for now
-            # warn about this, at least until the RFE in bug 1193121 is implemented and
-            # we don't have to care about clearing the download location ourselves.
-            log.warning("Can't delete nonexistent download "
-                        "location: %s", self._download_location)
+
+    def _install_packages_in_batches(self):
+        """Download and install packages in dependency-ordered batches.
+
+        The batches are downloaded one after another in a separate thread.
+        Every downloaded batch is installed in a new transaction process,
+        while the following batches are still being downloaded. The download
+        thread reports to the same queue as the transaction processes:
+
+            'download' - a progress message of the download
+            'downloaded' - a batch with the given index is downloaded
+            'download_failed' - the download has failed with the given error
+
+        A batch is successfully installed if its process sends 'done' and
+        then 'quit'. If the process sends 'quit' without 'done', it failed.
+        """
+        packages = self._base.transaction.install_set
+        batches = split_packages_into_batches(self._base, packages)
+        total = len(packages)
+
+        log.info('Downloading and installing %d packages in %d batches from %s.',
+                 total, len(batches), self._download_location)
+        progressQ.send_message(_('Downloading packages'))
+
+        queue_instance = multiprocessing.Queue()
+        threadMgr.add(AnacondaThread(
+            name=constants.THREAD_PACKAGE_DOWNLOAD,
+            target=self._download_batches,
+            args=(batches, queue_instance)
+        ))
+
+        downloaded = []
+        installed = 0
+        process = None
+        finished = False
+
+        while installed < len(batches):
+            # Start the transaction of the next batch if it is downloaded.
+            if not process and installed in downloaded:
+                batch = batches[installed]
+                offset = sum(len(b) for b in batches[:installed])
+                log.info('Installing the batch %d/%d of %d packages.',
+                         installed + 1, len(batches), len(batch))
+
+                process = multiprocessing.Process(
+                    target=do_batch_transaction,
+                    args=(self._base, [get_package_filter(p) for p in batch],
+                          queue_instance, offset, total)
+                )
+                process.start()
+                finished = False
+
+            (token, msg) = queue_instance.get()
+
+            if token == 'downloaded':
+                downloaded.append(msg)
+            elif token == 'done':
+                finished = True
+            elif token == 'quit' and finished:
+                process.join()
+                process = None
+                installed += 1
+            elif token == 'quit':
+                msg = ("Payload error - DNF installation has ended up abruptly: %s" % msg)
+                raise PayloadError(msg)
+            elif token == 'download_failed':
+                if process:
+                    self._wait_for_batch_transaction(process, queue_instance)
+
+                msg = 'Failed to download the following packages: %s' % msg
+                raise PayloadInstallError(msg)
+            else:
+                self._handle_transaction_message(token, msg)
+
+        threadMgr.wait(constants.THREAD_PACKAGE_DOWNLOAD)
+        log.info('Installing packages in batches finished.')
+
+    def _wait_for_batch_transaction(self, process, queue_instance):
+        """Wait for the running transaction of a batch to end.
+
+        The transaction is not interrupted. Its messages are handled
+        until the process sends 'quit', then the process is joined.
+
+        :param process: a process of the transaction
+        :param queue_instance: a queue for the progress messages
+        """
+        (token, msg) = queue_instance.get()
+
+        while token != 'quit':
+            if token not in ('done', 'downloaded'):
+                self._handle_transaction_message(token, msg)
+
+            (token, msg) = queue_instance.get()
+
+        process.join()
+
+    def _download_batches(self, batches, queue_instance):
+        """Download the given batches of packages.
+
+        :param batches: a list of lists of DNF packages
+        :param queue_instance: a queue for the progress messages
+        """
+        try:
+            for index, batch in enumerate(batches):
+                progress = DownloadProgress(queue_instance)
+                self._base.download_packages(batch, progress)
+                log.info('Downloading the batch %d/%d finished.', index + 1, len(batches))
+                queue_instance.put(('downloaded', index))
+        except BaseException as e:  # pylint: disable=broad-except
+            log.error("Downloading the batches has failed: %s", e)
+            queue_instance.put(('download_failed', str(e)))
 
     def get_repo(self, repo_id):
         """Return the yum repo object."""
@@ -1402,11 +1854,17 @@ class DNFPayload(Payload):
         tear_down_sources(self.proxy)
         self.reset_additional_repos()
 
-        shutil.rmtree(DNF_CACHE_DIR, ignore_errors=True)
+        # Keep the DNF cache. The cached metadata are validated
+        # with hashes of repomd files when the repos are loaded.
         shutil.rmtree(DNF_PLUGINCONF_DIR, ignore_errors=True)
 
         self.tx_id = None
-        self._base.reset(sack=True, repos=True)
+
+        self._cancel_resolution_in_advance()
+        with self._resolution_lock:
+            self._reset_resolution()
+            self._base.reset(sack=True, repos=True)
+
         self._configure_proxy()
         self._repoMD_list = []
 
@@ -1574,9 +2032,7 @@ class DNFPayload(Payload):
 
             # fetch md for enabled repos
             enabled_repos = self.enabled_repos
-            for repo_name in self.addons:
-                if repo_name in enabled_repos:
-                    self._fetch_md(repo_name)
+            self._fetch_repos_md([r for r in self.addons if r in enabled_repos])
 
     def _find_and_mount_iso(self, device, device_mount_dir, iso_path, iso_mount_dir):
         """Find and mount installation source from ISO on device.
@@ -1876,14 +2332,19 @@ class DNFPayload(Payload):
         """Perform post-setup tasks.
 
         Save repomd hash to test if the repositories can be reached.
+        The hashes downloaded by the load of the repositories are reused.
         """
         super().post_setup()
         self._repoMD_list = []
         proxy_url = self._get_proxy_url()
 
         for repo in self._base.repos.iter_enabled():
-            repoMD = RepoMDMetaHash(repo, proxy_url)
-            repoMD.store_repoMD_hash()
+            repoMD = self._repoMD_cache.get_repo_md(repo)
+
+            if not repoMD:
+                repoMD = RepoMDMetaHash(repo, proxy_url)
+                repoMD.store_repoMD_hash()
+
             self._repoMD_list.append(repoMD)
 
     def post_install(self):
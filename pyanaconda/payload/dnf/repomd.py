@@ -16,6 +16,7 @@
 # Red Hat, Inc.
 #
 import hashlib
+import threading
 
 from requests import RequestException
 
@@ -26,7 +27,7 @@ from pyanaconda.payload.dnf.utils import USER_AGENT
 
 log = get_packaging_logger()
 
-__all__ = ["RepoMDMetaHash"]
+__all__ = ["RepoMDMetaHash", "RepoMDCache"]
 
 
 class RepoMDMetaHash(object):
@@ -39,6 +40,7 @@ class RepoMDMetaHash(object):
         self._ssl_verify = repo.sslverify
         self._urls = repo.baseurl
         self._repomd_hash = ""
+        self._repomd_downloaded = False
 
     @property
     def repoMD_hash(self):
@@ -50,10 +52,16 @@ class RepoMDMetaHash(object):
         """Name of the repository."""
         return self._repoId
 
+    @property
+    def repoMD_downloaded(self):
+        """Was the stored repomd.xml file successfully downloaded?"""
+        return self._repomd_downloaded
+
     def store_repoMD_hash(self):
         """Download and store hash of the repomd.xml file content."""
         repomd = self._download_repoMD()
         self._repomd_hash = self._calculate_hash(repomd)
+        self._repomd_downloaded = bool(repomd)
 
     def verify_repoMD(self):
         """Download and compare with stored repomd.xml file."""
@@ -100,3 +108,67 @@ class RepoMDMetaHash(object):
                           url, proxies, e)
 
         return repomd
+
+
+class RepoMDCache(object):
+    """Class that holds hashes of repomd.xml files of loaded repositories.
+
+    DNF keeps the downloaded metadata in its cache directory. The cached
+    metadata of a repository can be reused without checking the repository
+    again, if the repository has the same URLs and its repomd.xml file has
+    still the same hash as when the metadata were loaded.
+
+    The hashes of the last checks can be used to verify the availability
+    of the repositories, so the repomd.xml files are not downloaded again.
+    """
+    def __init__(self):
+        self._repo_mds = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(repo):
+        return repo.id, tuple(repo.baseurl)
+
+    def is_valid(self, repo, proxy_url):
+        """Are the cached metadata of the repository still valid?
+
+        The hash of the current repomd.xml file is stored and used for
+        the next check. Repositories without a base URL are never valid.
+
+        :param repo: a DNF repository
+        :param proxy_url: a proxy URL or None
+        :return: True if the cached metadata can be reused, otherwise False
+        """
+        if not repo.baseurl:
+            return False
+
+        repo_md = RepoMDMetaHash(repo, proxy_url)
+        repo_md.store_repoMD_hash()
+        key = self._get_key(repo)
+
+        with self._lock:
+            if not repo_md.repoMD_downloaded:
+                self._repo_mds.pop(key, None)
+                return False
+
+            old_repo_md = self._repo_mds.get(key)
+            self._repo_mds[key] = repo_md
+
+        return bool(old_repo_md) and old_repo_md.repoMD_hash == repo_md.repoMD_hash
+
+    def get_repo_md(self, repo):
+        """Get the hash of the repomd.xml file from the last check.
+
+        :param repo: a DNF repository
+        :return: an instance of RepoMDMetaHash or None
+        """
+        with self._lock:
+            return self._repo_mds.get(self._get_key(repo))
+
+    def invalidate(self, repo):
+        """Forget the hash of the given repository.
+
+        :param repo: a DNF repository
+        """
+        with self._lock:
+            self._repo_mds.pop(self._get_key(repo), None)
@@ -0,0 +1,123 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import threading
+
+from collections import OrderedDict
+
+__all__ = ["ResolutionResult", "ResolutionCache", "get_selection_key"]
+
+
+def get_selection_key(include_list, exclude_list, module_specs, options):
+    """Get a normalized key of the software selection.
+
+    The order of the specs doesn't change the result of the dependency
+    resolution, so the specs are sorted and the duplicates are removed.
+
+    :param include_list: a list of specs to include
+    :param exclude_list: a list of specs to exclude
+    :param module_specs: a tuple of lists of module specs to enable and to disable
+    :param options: a tuple of other options that change the resolution
+    :return: a hashable key
+    """
+    return (
+        tuple(sorted(set(include_list))),
+        tuple(sorted(set(exclude_list))),
+        tuple(tuple(sorted(set(specs))) for specs in module_specs),
+        tuple(options),
+    )
+
+
+class ResolutionResult(object):
+    """Result of the dependency resolution of a software selection."""
+
+    def __init__(self, package_count=0, install_space=None, download_space=None, error=None,
+                 setup_errors=(), warnings=()):
+        """Create a new result.
+
+        The setup errors and the warnings are reported again every
+        time the result is used, so a cached result is reported the
+        same way as a new one.
+
+        :param package_count: a number of packages in the transaction
+        :param install_space: a space required to install the packages
+        :param download_space: a space required to download the packages
+        :param error: an error message of a failed resolution or None
+        :param setup_errors: a list of exceptions raised by the selection
+        :param warnings: a list of warning messages of the selection
+        """
+        self.package_count = package_count
+        self.install_space = install_space
+        self.download_space = download_space
+        self.error = error
+        self.setup_errors = list(setup_errors)
+        self.warnings = list(warnings)
+
+    def __repr__(self):
+        return "{}(package_count={}, install_space={}, download_space={}, error={})".format(
+            self.__class__.__name__, self.package_count, self.install_space,
+            self.download_space, repr(self.error)
+        )
+
+
+class ResolutionCache(object):
+    """Cache of results of the dependency resolution.
+
+    The results are valid only for the sack they were resolved with,
+    so the cache has to be cleared every time the sack changes.
+    """
+
+    def __init__(self, max_size=32):
+        """Create a new cache.
+
+        :param max_size: a maximal number of cached results
+        """
+        self._max_size = max_size
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get a cached result of the given selection.
+
+        :param key: a key of the software selection
+        :return: an instance of ResolutionResult or None
+        """
+        with self._lock:
+            result = self._results.get(key)
+
+            if result is not None:
+                self._results.move_to_end(key)
+
+            return result
+
+    def set(self, key, result):
+        """Cache a result of the given selection.
+
+        :param key: a key of the software selection
+        :param result: an instance of ResolutionResult
+        """
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+
+            while len(self._results) > self._max_size:
+                self._results.popitem(last=False)
+
+    def clear(self):
+        """Forget all cached results."""
+        with self._lock:
+            self._results.clear()
@@ -22,13 +22,29 @@ __all__ = ["TransactionProgress"]
 
 
 class TransactionProgress(dnf.callback.TransactionProgress):
-    def __init__(self, queue_instance):
+    def __init__(self, queue_instance, offset=0, total=None):
+        """Create a new transaction progress.
+
+        The offset and the total are used to report the progress of
+        the whole installation if the packages are installed in more
+        than one transaction.
+
+        :param queue_instance: a queue for the progress messages
+        :param offset: a number of packages installed in previous transactions
+        :param total: a total number of packages or None
+        """
         super().__init__()
         self._queue = queue_instance
         self._last_ts = None
         self._postinst_phase = False
+        self._offset = offset
+        self._total = total
         self.cnt = 0
 
+    def _format_counts(self, ts_done, ts_total):
+        """Format the numbers of processed packages."""
+        return '(%d/%d)' % (self._offset + ts_done, self._total or ts_total)
+
     def progress(self, package, action, ti_done, ti_total, ts_done, ts_total):
         # Process DNF actions, communicating with anaconda via the queue
         # A normal installation consists of 'install' messages followed by
@@ -39,8 +55,8 @@ class TransactionProgress(dnf.callback.TransactionProgress):
                 return
             self._last_ts = ts_done
 
-            msg = '%s.%s (%d/%d)' % \
-                (package.name, package.arch, ts_done, ts_total)
+            msg = '%s.%s %s' % \
+                (package.name, package.arch, self._format_counts(ts_done, ts_total))
             self.cnt += 1
             self._queue.put(('install', msg))
 
@@ -68,7 +84,8 @@ class TransactionProgress(dnf.callback.TransactionProgress):
                 self._queue.put(('configure', msg))
 
         elif action == dnf.transaction.PKG_VERIFY:
-            msg = '%s.%s (%d/%d)' % (package.name, package.arch, ts_done, ts_total)
+            msg = '%s.%s %s' % \
+                (package.name, package.arch, self._format_counts(ts_done, ts_total))
             self._queue.put(('verify', msg))
 
             # Log the exact package nevra, build time and checksum
@@ -19,6 +19,11 @@ import os
 import operator
 import time
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import dnf.exceptions
+
 from blivet.size import Size
 
 from pyanaconda.anaconda_loggers import get_packaging_logger
@@ -49,6 +54,17 @@ USER_AGENT = "%s (anaconda)/%s" % (productName, productVersion)
 # 6KiB = 4K(max default fragment size) + 2K(rpm db could be taken for a header file)
 BONUS_SIZE_ON_FILE = Size("6 KiB")
 
+# The bonus size of a package used if the file lists are not loaded.
+# It corresponds to 150 files per package, which is a rounded up average
+# number of files per package in the default Fedora installations.
+BONUS_SIZE_ON_PACKAGE = 150 * BONUS_SIZE_ON_FILE
+
+# The preferred number of packages in one batch of the pipelined installation.
+DNF_PIPELINE_BATCH_SIZE = 250
+
+# The maximal number of repositories that load their metadata at the same time.
+DNF_METADATA_WORKERS = 4
+
 
 def go_to_failure_limbo():
     progressQ.send_quit(1)
@@ -56,6 +72,67 @@ def go_to_failure_limbo():
         time.sleep(10000)
 
 
+def load_repositories(repos, max_workers=DNF_METADATA_WORKERS, prepare=None):
+    """Load metadata of the given repositories concurrently.
+
+    The errors are returned in the same order as the repositories,
+    so they can be processed deterministically.
+
+    :param repos: a list of DNF repositories
+    :param max_workers: a maximal number of concurrently loaded repositories
+    :param prepare: a function called with a repository before it is loaded
+    :return: a list of RepoError instances or None values
+    """
+    if not repos:
+        return []
+
+    def load_repository(repo):
+        try:
+            if prepare:
+                prepare(repo)
+
+            repo.load()
+        except dnf.exceptions.RepoError as e:
+            return e
+
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(len(repos), max_workers),
+                            thread_name_prefix="AnaRepoMetadata") as executor:
+        return list(executor.map(load_repository, repos))
+
+
+def calculate_required_space(packages, precise=False):
+    """Calculate the space required to install the given packages.
+
+    The installed sizes of the packages are available in the primary
+    metadata, but the file lists have to be loaded to count the installed
+    files. By default, the number of files is not counted and the bonus
+    size is estimated from the number of packages.
+
+    :param packages: a list of DNF packages
+    :param precise: count the files from the file lists of the packages
+    :return: a required space
+    """
+    size = Size(sum(pkg.installsize for pkg in packages))
+
+    if precise:
+        # append bonus size depending on number of files
+        files_nm = sum(len(pkg.files) for pkg in packages)
+        bonus_size = files_nm * BONUS_SIZE_ON_FILE
+        log.debug("Bonus size %s by number of files %s", bonus_size, files_nm)
+    else:
+        # append bonus size depending on number of packages
+        bonus_size = len(packages) * BONUS_SIZE_ON_PACKAGE
+        log.debug("Bonus size %s by number of packages %s", bonus_size, len(packages))
+
+    # add another 10% as safeguard
+    total_space = (size + bonus_size) * 1.1
+    log.debug("Size from DNF: %s", size)
+    log.debug("Total size required %s", total_space)
+    return total_space
+
+
 def get_df_map():
     """Return (mountpoint -> size available) mapping."""
     output = util.execWithCapture('df', ['--output=target,avail'])
@@ -137,3 +214,243 @@ def do_transaction(base, queue_instance):
     finally:
         base.close()  # Always close this base.
         queue_instance.put(('quit', str(exit_reason)))
+
+
+def split_into_batches(items, get_dependencies, batch_size):
+    """Split items into dependency-ordered batches.
+
+    Every item is placed into the same or a later batch than all
+    items it depends on, so the batches can be processed one after
+    another. Dependency cycles are never split between batches.
+
+    :param items: a list of items
+    :param get_dependencies: a function that returns dependencies of an item
+    :param batch_size: a preferred number of items in a batch
+    :return: a list of lists of items
+    """
+    index = {item: i for i, item in enumerate(items)}
+    edges = [
+        sorted({index[dep] for dep in get_dependencies(item) if dep in index} - {i})
+        for i, item in enumerate(items)
+    ]
+
+    # Find strongly connected components with the iterative Tarjan's
+    # algorithm. A component is emitted only after all components it
+    # depends on, so the components are already in the right order.
+    order = [None] * len(items)
+    lowlink = [0] * len(items)
+    on_stack = [False] * len(items)
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(len(items)):
+        if order[root] is not None:
+            continue
+
+        work = [(root, 0)]
+
+        while work:
+            node, position = work.pop()
+
+            if position == 0:
+                order[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+
+            for i in range(position, len(edges[node])):
+                dep = edges[node][i]
+
+                if order[dep] is None:
+                    work.append((node, i + 1))
+                    work.append((dep, 0))
+                    break
+                elif on_stack[dep]:
+                    lowlink[node] = min(lowlink[node], order[dep])
+            else:
+                if lowlink[node] == order[node]:
+                    component = []
+
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+
+                        if member == node:
+                            break
+
+                    components.append(sorted(component))
+
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+    # Group the components into batches.
+    batches = []
+    batch = []
+
+    for component in components:
+        batch.extend(items[i] for i in component)
+
+        if len(batch) >= batch_size:
+            batches.append(batch)
+            batch = []
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+def split_packages_into_batches(base, packages, batch_size=DNF_PIPELINE_BATCH_SIZE):
+    """Split packages into dependency-ordered batches.
+
+    The packages required by a package are always installed
+    in the same or in one of the previous batches.
+
+    The providers of rich dependencies can't be looked up in the sack,
+    so a package with a requirement that can't be resolved is installed
+    in the last batch together with all packages that depend on it.
+
+    :param base: a DNF base with a filled sack
+    :param packages: a collection of DNF packages
+    :param batch_size: a preferred number of packages in a batch
+    :return: a list of lists of DNF packages
+    """
+    packages = sorted(packages, key=str)
+    query = base.sack.query().filter(pkg=packages)
+    providers = {}
+    unresolved = set()
+
+    def find_providers(requirement):
+        key = str(requirement)
+
+        if key not in providers:
+            providers[key] = None
+
+            if key.startswith("("):
+                log.debug("Can't find providers of the rich dependency '%s'.", key)
+            else:
+                try:
+                    providers[key] = set(query.filter(provides=requirement))
+                except Exception as e:  # pylint: disable=broad-except
+                    log.debug("Failed to find providers of '%s': %s", key, e)
+
+        return providers[key]
+
+    dependencies = {}
+
+    for package in packages:
+        dependencies[package] = set()
+
+        for requirement in package.requires:
+            found = find_providers(requirement)
+
+            if found is None:
+                unresolved.add(package)
+                continue
+
+            dependencies[package].update(found)
+
+    deferred = get_dependent_items(packages, dependencies, unresolved)
+    batches = split_into_batches(
+        [p for p in packages if p not in deferred],
+        dependencies.get,
+        batch_size
+    )
+
+    if deferred:
+        batches.append([p for p in packages if p in deferred])
+
+    log.debug("Split %d packages into %d batches with %d deferred packages.",
+              len(packages), len(batches), len(deferred))
+    return batches
+
+
+def get_dependent_items(items, dependencies, selected):
+    """Get the selected items and all items that depend on them.
+
+    :param items: a list of items
+    :param dependencies: a dictionary of items and their dependencies
+    :param selected: a collection of selected items
+    :return: a set of items
+    """
+    dependents = defaultdict(set)
+
+    for item in items:
+        for dependency in dependencies.get(item, ()):
+            dependents[dependency].add(item)
+
+    result = set(selected)
+    work = list(result)
+
+    while work:
+        for item in dependents[work.pop()]:
+            if item not in result:
+                result.add(item)
+                work.append(item)
+
+    return result
+
+
+def get_package_filter(package):
+    """Get a filter that identifies the given package in a sack.
+
+    :param package: a DNF package
+    :return: a dictionary of keyword arguments for a query filter
+    """
+    return {
+        "name": package.name,
+        "epoch": package.epoch,
+        "version": package.version,
+        "release": package.release,
+        "arch": package.arch,
+        "reponame": package.reponame,
+    }
+
+
+def do_batch_transaction(base, package_filters, queue_instance, offset, total):
+    """Install one batch of the pipelined installation.
+
+    The process inherits the sack with the available packages. Only the
+    installed system is loaded into the sack, so the packages from previous
+    batches satisfy the dependencies of this batch.
+
+    :param base: a DNF base
+    :param package_filters: a list of package filters of the batch
+    :param queue_instance: a queue for the progress messages
+    :param offset: a number of packages installed in previous batches
+    :param total: a total number of packages to install
+    """
+    try:
+        base.reset(goal=True)
+        base.sack.load_system_repo(build_cache=False)
+
+        # Weak dependencies were already resolved for the whole transaction.
+        base.conf.install_weak_deps = False
+        expected = set()
+
+        for package_filter in package_filters:
+            for package in base.sack.query().available().filter(**package_filter):
+                base.package_install(package, strict=True)
+                expected.add(str(package))
+
+        base.resolve()
+        unexpected = {str(p) for p in base.transaction.install_set} - expected
+
+        if unexpected:
+            raise RuntimeError("The batch requires packages that are not downloaded yet: "
+                               "{}".format(", ".join(sorted(unexpected))))
+
+        display = TransactionProgress(queue_instance, offset, total)
+        base.do_transaction(display=display)
+        exit_reason = "DNF quit"
+    except BaseException as e:  # pylint: disable=broad-except
+        log.error('The transaction process has ended abruptly')
+        log.info(e)
+        import traceback
+        exit_reason = str(e) + traceback.format_exc()
+    finally:
+        base.close()  # Always close this base.
+        queue_instance.put(('quit', str(exit_reason)))
@@ -0,0 +1,116 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import re
+import time
+
+from blivet.size import Size
+
+from pyanaconda.core.i18n import _
+from pyanaconda.progress import progressQ
+
+__all__ = ["InstallProgress", "parse_rsync_progress", "parse_tar_checkpoint",
+           "TAR_CHECKPOINT_ARGS"]
+
+# The output of rsync --info=progress2, for example:
+#     1,238,099 100%  146.38MB/s    0:00:00 (xfr#5, to-chk=169/396)
+RSYNC_PROGRESS_PATTERN = re.compile(r"^\s*([\d,]+)\s+(\d+)%\s")
+
+# Report the number of read bytes every 1000 records (about 10 MB).
+TAR_CHECKPOINT_ARGS = ["--checkpoint=1000", "--checkpoint-action=echo=%{r}T"]
+
+# The output of the tar checkpoint, for example:
+#     tar: r: 1013760 (990KiB, 491MiB/s)
+TAR_CHECKPOINT_PATTERN = re.compile(r"^tar: r: (\d+)\s")
+
+
+def parse_rsync_progress(line):
+    """Parse a line of the progress of rsync.
+
+    :param line: a line of the output
+    :return: a tuple of transferred bytes and percents or None
+    """
+    match = RSYNC_PROGRESS_PATTERN.match(line)
+
+    if not match:
+        return None
+
+    return int(match.group(1).replace(",", "")), int(match.group(2))
+
+
+def parse_tar_checkpoint(line):
+    """Parse a line of the checkpoint of tar.
+
+    The percentage is unknown, because the size of the decompressed
+    archive is unknown.
+
+    :param line: a line of the output
+    :return: a tuple of read bytes and None or None
+    """
+    match = TAR_CHECKPOINT_PATTERN.match(line)
+
+    if not match:
+        return None
+
+    return int(match.group(1)), None
+
+
+class InstallProgress(object):
+    """Report the progress of the installation of a live payload."""
+
+    def __init__(self, total_size=0):
+        """Create a new progress.
+
+        :param total_size: a total size of the payload if known
+        """
+        self.total_size = total_size
+        self.installed = 0
+        self._pct = -1
+        self._start_time = time.time()
+
+    def _get_speed(self):
+        """Get the average speed of the installation in bytes per second."""
+        elapsed = time.time() - self._start_time
+
+        if elapsed <= 0:
+            return 0
+
+        return self.installed / elapsed
+
+    def update(self, installed, pct=None):
+        """Update the progress.
+
+        :param installed: a number of installed bytes
+        :param pct: a percentage of the progress or None to calculate it
+        """
+        self.installed = installed
+
+        if pct is None:
+            pct = int(100 * installed / self.total_size) if self.total_size else 0
+
+        pct = min(100, pct)
+
+        if pct == self._pct:
+            return
+
+        self._pct = pct
+        progressQ.send_message(_("Installing software") + (" %d%% (%s/s)") %
+                               (pct, Size(int(self._get_speed()))))
+
+    def end(self):
+        """The installation is complete."""
+        progressQ.send_message(_("Installing software") + (" %d%%") % 100)
@@ -18,13 +18,12 @@
 import functools
 import glob
 import os
-from threading import Lock
-from time import sleep
 
-from pyanaconda.anaconda_loggers import get_packaging_logger
+from pyanaconda.anaconda_logging import program_log_lock
+from pyanaconda.anaconda_loggers import get_packaging_logger, get_program_logger
 from pyanaconda.core import util
 from pyanaconda.core.configuration.anaconda import conf
-from pyanaconda.core.constants import INSTALL_TREE, THREAD_LIVE_PROGRESS
+from pyanaconda.core.constants import INSTALL_TREE
 from pyanaconda.core.i18n import _
 from pyanaconda.errors import errorHandler, ERROR_RAISE
 from pyanaconda.modules.common.constants.objects import BOOTLOADER
@@ -33,10 +32,11 @@ from pyanaconda.modules.common.errors.installation import BootloaderInstallation
 from pyanaconda.payload import utils as payload_utils
 from pyanaconda.payload.base import Payload
 from pyanaconda.payload.errors import PayloadInstallError
+from pyanaconda.payload.live.install_progress import InstallProgress, parse_rsync_progress
 from pyanaconda.progress import progressQ
-from pyanaconda.threading import threadMgr, AnacondaThread
 
 log = get_packaging_logger()
+program_log = get_program_logger()
 
 __all__ = ["BaseLivePayload"]
 
@@ -49,37 +49,42 @@ class BaseLivePayload(Payload):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Used to adjust size of sysroot when files are already present
-        self._adj_size = 0
-        self.pct = 0
-        self.pct_lock = None
         self.source_size = 1
 
         self._kernel_version_list = []
 
-    def progress(self):
-        """Monitor the amount of disk space used on the target and source and
-           update the hub's progress bar.
+    def _run_with_progress(self, cmd, args, progress, parse_line):
+        """Run the command and report the progress parsed from its output.
+
+        :param cmd: a command to run
+        :param args: a list of arguments
+        :param progress: an instance of InstallProgress
+        :param parse_line: a function that returns arguments of the progress update or None
+        :return: a tuple of the return code and an error message
         """
-        mountpoints = payload_utils.get_mount_points()
-        last_pct = -1
-
-        while self.pct < 100:
-            dest_size = 0
-            for mnt in mountpoints:
-                mnt_stat = os.statvfs(conf.target.system_root + mnt)
-                dest_size += mnt_stat.f_frsize * (mnt_stat.f_blocks - mnt_stat.f_bfree)
-            if dest_size >= self._adj_size:
-                dest_size -= self._adj_size
-
-            pct = int(100 * dest_size / self.source_size)
-            if pct != last_pct:
-                with self.pct_lock:
-                    self.pct = pct
-                last_pct = pct
-                progressQ.send_message(_("Installing software") + (" %d%%") %
-                                       (min(100, self.pct),))
-            sleep(0.777)
+        try:
+            lines = util.execReadlines(cmd, args, universal_newlines=True)
+        except OSError as e:
+            return None, str(e)
+
+        try:
+            for line in lines:
+                update = parse_line(line)
+
+                # Log the other output of the command as usual.
+                if update is None:
+                    with program_log_lock:
+                        program_log.info(line)
+
+                    continue
+
+                progress.update(*update)
+        except OSError as e:
+            # Only a failed process should be reported as an error.
+            if not lines.returncode or lines.returncode < 0:
+                return lines.returncode, str(e)
+
+        return lines.returncode, None
 
     def install(self):
         """ Install the payload. """
@@ -87,28 +92,25 @@ class BaseLivePayload(Payload):
         if self.source_size <= 0:
             raise PayloadInstallError("Nothing to install")
 
-        self.pct_lock = Lock()
-        self.pct = 0
-        threadMgr.add(AnacondaThread(name=THREAD_LIVE_PROGRESS,
-                                     target=self.progress))
-
         cmd = "rsync"
         # preserve: permissions, owners, groups, ACL's, xattrs, times,
         #           symlinks, hardlinks
         # go recursively, include devices and special files, don't cross
         # file system boundaries
+        # report the overall progress of the complete file list
         args = ["-pogAXtlHrDx", "--exclude", "/dev/", "--exclude", "/proc/", "--exclude", "/tmp/*",
                 "--exclude", "/sys/", "--exclude", "/run/", "--exclude", "/boot/*rescue*",
                 "--exclude", "/boot/loader/", "--exclude", "/boot/efi/loader/",
-                "--exclude", "/etc/machine-id", INSTALL_TREE + "/", conf.target.system_root]
-        try:
-            rc = util.execWithRedirect(cmd, args)
-        except (OSError, RuntimeError) as e:
-            msg = None
-            err = str(e)
+                "--exclude", "/etc/machine-id", "--info=progress2", "--no-inc-recursive",
+                INSTALL_TREE + "/", conf.target.system_root]
+
+        progress = InstallProgress(self.source_size)
+        rc, err = self._run_with_progress(cmd, args, progress, parse_rsync_progress)
+
+        if err:
             log.error(err)
+            msg = None
         else:
-            err = None
             msg = "%s exited with code %d" % (cmd, rc)
             log.info(msg)
 
@@ -117,10 +119,7 @@ class BaseLivePayload(Payload):
             if errorHandler.cb(exn) == ERROR_RAISE:
                 raise exn
 
-        # Wait for progress thread to finish
-        with self.pct_lock:
-            self.pct = 100
-        threadMgr.wait(THREAD_LIVE_PROGRESS)
+        progress.end()
 
         # Live needs to create the rescue image before bootloader is written
         self._create_rescue_image()
@@ -194,9 +193,9 @@ class BaseLivePayload(Payload):
         if rc:
             raise BootloaderInstallationError("failed to write boot loader configuration")
 
-    def _update_kernel_version_list(self):
-        files = glob.glob(INSTALL_TREE + "/boot/vmlinuz-*")
-        files.extend(glob.glob(INSTALL_TREE + "/boot/efi/EFI/%s/vmlinuz-*" %
+    def _update_kernel_version_list(self, root=INSTALL_TREE):
+        files = glob.glob(root + "/boot/vmlinuz-*")
+        files.extend(glob.glob(root + "/boot/efi/EFI/%s/vmlinuz-*" %
                                conf.bootloader.efi_dir))
 
         self._kernel_version_list = sorted((f.split("/")[-1][8:] for f in files
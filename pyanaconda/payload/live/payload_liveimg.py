@@ -20,7 +20,6 @@ import glob
 import hashlib
 import os
 import stat
-from threading import Lock
 
 import requests
 from blivet.size import Size
@@ -28,16 +27,17 @@ from pyanaconda.anaconda_loggers import get_packaging_logger
 from pyanaconda.core import util
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.constants import PAYLOAD_TYPE_LIVE_IMAGE, TAR_SUFFIX, \
-    NETWORK_CONNECTION_TIMEOUT, INSTALL_TREE, IMAGE_DIR, THREAD_LIVE_PROGRESS
+    NETWORK_CONNECTION_TIMEOUT, INSTALL_TREE, IMAGE_DIR
 from pyanaconda.core.i18n import _
 from pyanaconda.core.payload import ProxyString, ProxyStringError
 from pyanaconda.errors import errorHandler, ERROR_RAISE
 from pyanaconda.payload import utils as payload_utils
 from pyanaconda.payload.errors import PayloadInstallError
 from pyanaconda.payload.live.download_progress import DownloadProgress
+from pyanaconda.payload.live.install_progress import InstallProgress, parse_tar_checkpoint, \
+    TAR_CHECKPOINT_ARGS
 from pyanaconda.payload.live.payload_base import BaseLivePayload
 from pyanaconda.progress import progressQ
-from pyanaconda.threading import threadMgr, AnacondaThread
 
 log = get_packaging_logger()
 
@@ -205,9 +205,6 @@ class LiveImagePayload(BaseLivePayload):
             if errorHandler.cb(exn) == ERROR_RAISE:
                 raise exn
 
-        # Used to make install progress % look correct
-        self._adj_size = os.stat(self.image_path)[stat.ST_SIZE]
-
         if self.data.liveimg.checksum:
             progressQ.send_message(_("Checking image checksum"))
             sha256 = hashlib.sha256()
@@ -282,6 +279,23 @@ class LiveImagePayload(BaseLivePayload):
             source = os.statvfs(INSTALL_TREE)
             self.source_size = source.f_frsize * (source.f_blocks - source.f_bfree)
 
+    def _get_tarball_size(self):
+        """Estimate the size of the installed tarball.
+
+        The checkpoints of tar report the read bytes of the archive. Use 2x
+        the size of a compressed archive to estimate the size of the install.
+        The downloaded archive is always stored as disk.img, so decide the
+        compression from the url.
+
+        :return: a size in bytes
+        """
+        size = os.stat(self.image_path)[stat.ST_SIZE]
+
+        if not self.data.liveimg.url.endswith(".tar"):
+            size *= 2
+
+        return size
+
     def install(self):
         """ Install the payload if it is a tar.
             Otherwise fall back to rsync of INSTALL_TREE
@@ -291,14 +305,7 @@ class LiveImagePayload(BaseLivePayload):
             super().install()
             return
 
-        # Use 2x the archive's size to estimate the size of the install
-        # This is used to drive the progress display
-        self.source_size = os.stat(self.image_path)[stat.ST_SIZE] * 2
-
-        self.pct_lock = Lock()
-        self.pct = 0
-        threadMgr.add(AnacondaThread(name=THREAD_LIVE_PROGRESS,
-                                     target=self.progress))
+        self.source_size = self._get_tarball_size()
 
         cmd = "tar"
         # preserve: ACL's, xattrs, and SELinux context
@@ -306,27 +313,25 @@ class LiveImagePayload(BaseLivePayload):
                 "--exclude", "dev/*", "--exclude", "proc/*", "--exclude", "tmp/*",
                 "--exclude", "sys/*", "--exclude", "run/*", "--exclude", "boot/*rescue*",
                 "--exclude", "boot/loader", "--exclude", "boot/efi/loader",
-                "--exclude", "etc/machine-id", "-xaf", self.image_path, "-C", conf.target.system_root]
-        try:
-            rc = util.execWithRedirect(cmd, args)
-        except (OSError, RuntimeError) as e:
-            msg = None
-            err = str(e)
-            log.error(err)
-        else:
-            err = None
-            msg = "%s exited with code %d" % (cmd, rc)
-            log.info(msg)
+                "--exclude", "etc/machine-id", *TAR_CHECKPOINT_ARGS,
+                "-xaf", self.image_path, "-C", conf.target.system_root]
+
+        progress = InstallProgress(self.source_size)
+        rc, err = self._run_with_progress(cmd, args, progress, parse_tar_checkpoint)
 
         if err:
-            exn = PayloadInstallError(err or msg)
+            log.error(err)
+            exn = PayloadInstallError(err)
             if errorHandler.cb(exn) == ERROR_RAISE:
                 raise exn
+        else:
+            log.info("%s exited with code %d", cmd, rc)
+
+        progress.end()
 
-        # Wait for progress thread to finish
-        with self.pct_lock:
-            self.pct = 100
-        threadMgr.wait(THREAD_LIVE_PROGRESS)
+        # Find the kernels in the installed system instead of
+        # decompressing the whole tarball again.
+        self._update_kernel_version_list(conf.target.system_root)
 
         # Live needs to create the rescue image before bootloader is written
         self._create_rescue_image()
@@ -363,6 +368,7 @@ class LiveImagePayload(BaseLivePayload):
         if not self.is_tarfile:
             return super().kernel_version_list
 
+        # The list is updated during the installation of the tarball.
         if self._kernel_version_list:
             return self._kernel_version_list
 
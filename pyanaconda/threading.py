@@ -20,6 +20,7 @@
 
 import threading
 
+from pyanaconda.core.trace import trace_span
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
@@ -277,7 +278,9 @@ class AnacondaThread(threading.Thread):
 
         try:
             self._target_started()
-            threading.Thread.run(self)
+
+            with trace_span(self.name, category="thread"):
+                threading.Thread.run(self)
 
         except:  # pylint: disable=bare-except
             self._target_failed(*sys.exc_info())
@@ -22,8 +22,6 @@ configuration, valid timezones recognition etc.
 
 """
 
-import pytz
-import langtable
 from collections import OrderedDict
 
 from pyanaconda.core import util
@@ -37,6 +35,10 @@ from blivet import arch
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
+# The databases are loaded on the first use.
+pytz = util.lazy_import("pytz")
+langtable = util.lazy_import("langtable")
+
 # The following zones are not in pytz.common_timezones and
 # Etc category in pytz.all_timezones includes some more,
 # however confusing ones (like UCT, GMT+0, GMT-0,...)
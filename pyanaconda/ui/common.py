@@ -622,21 +622,39 @@ def collect_spokes(mask_paths, category):
        :rtype: list of Spoke classes
 
     """
-    spokes = []
+    return collect_spokes_by_category(mask_paths, [category])[category]
+
+
+def collect_spokes_by_category(mask_paths, categories):
+    """Return lists of all spoke subclasses that should appear for the given
+       categories. The files with spokes are traversed and imported only once
+       for all categories.
+
+       :param mask_paths: list of mask, path tuples to search for classes
+       :type mask_paths: list of (mask, path)
+
+       :param categories: list of category names
+       :return: dictionary mapping category names to lists of Spoke classes
+       :rtype: dictionary[category name] -> [ list of spoke classes ]
+    """
+    spokes = {category: [] for category in categories}
+    hidden_spokes = conf.ui.hidden_spokes
+
     for mask, path in mask_paths:
-        candidate_spokes = (collect(mask, path,
-                            lambda obj: hasattr(obj, "category") and obj.category is not None and obj.category.__name__ == category))
-        # filter out any spokes from the candidates that have already been visited by the user before
-        # (eq. before Anaconda or Initial Setup started) and should not be visible again
-        visible_spokes = []
-        hidden_spokes = conf.ui.hidden_spokes
+        candidate_spokes = collect(mask, path,
+                                   lambda obj: getattr(obj, "category", None) is not None
+                                   and obj.category.__name__ in spokes)
+
         for candidate in candidate_spokes:
+            # filter out any spokes from the candidates that have already been visited by the
+            # user before (eq. before Anaconda or Initial Setup started) and should not be
+            # visible again
             if candidate.__name__ in hidden_spokes:
                 log.info("Spoke %s will not be displayed because it is hidden by "
                          "the Anaconda configuration file.", candidate.__name__)
-            else:
-                visible_spokes.append(candidate)
-        spokes.extend(visible_spokes)
+                continue
+
+            spokes[candidate.category.__name__].append(candidate)
 
     return spokes
 
@@ -667,8 +685,10 @@ def collectCategoriesAndSpokes(paths, klass):
     # spokes belonging to all those categories.
     categories = sorted(collect_categories(paths["categories"]), key=lambda c: c.sortOrder)
 
+    spokes = collect_spokes_by_category(paths["spokes"], [c.__name__ for c in categories])
+
     for c in categories:
-        ret[c] = collect_spokes(paths["spokes"], c.__name__)
+        ret[c] = spokes[c.__name__]
 
     # As we now have a list of all categories this hub holds we can now register it's controller.
     # We need the list of categories so that spokes can find out which controller they should use
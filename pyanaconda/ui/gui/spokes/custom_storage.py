@@ -47,7 +47,8 @@ from pyanaconda.modules.common.structures.partitioning import PartitioningReques
 from pyanaconda.modules.common.structures.device_factory import DeviceFactoryRequest, \
     DeviceFactoryPermissions
 from pyanaconda.product import productName, productVersion
-from pyanaconda.ui.lib.storage import reset_bootloader, create_partitioning, filter_disks_by_names
+from pyanaconda.ui.lib.storage import reset_bootloader, create_partitioning, \
+    filter_disks_by_names, DeviceTreeSnapshot
 from pyanaconda.core.storage import DEVICE_TYPE_UNSUPPORTED, DEVICE_TEXT_MAP, \
     MOUNTPOINT_DESCRIPTIONS, NAMED_DEVICE_TYPES, CONTAINER_DEVICE_TYPES, device_type_from_autopart, \
     PROTECTED_FORMAT_TYPES, DEVICE_TYPE_BTRFS, DEVICE_TYPE_MD, Size
@@ -121,6 +122,7 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
 
         self._partitioning = None
         self._device_tree = None
+        self._device_tree_snapshot = None
         self._request = DeviceFactoryRequest()
         self._original_request = DeviceFactoryRequest()
         self._permissions = DeviceFactoryPermissions()
@@ -293,6 +295,7 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
             # the storage spoke would use it as a default partitioning.
             self._partitioning = create_partitioning(PARTITIONING_METHOD_INTERACTIVE)
             self._device_tree = STORAGE.get_proxy(self._partitioning.GetDeviceTree())
+            self._device_tree_snapshot = DeviceTreeSnapshot(self._device_tree)
 
         self._back_already_clicked = False
 
@@ -376,6 +379,7 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
     def _populate_accordion(self):
         # Make sure we start with a clean state.
         self._accordion.remove_all_pages()
+        self._device_tree_snapshot.refresh()
 
         new_devices = self._get_new_devices()
         all_devices = self._get_all_devices()
@@ -466,13 +470,8 @@ class CustomPartitioningSpoke(NormalSpoke, StorageCheckHandler):
         if not root_name:
             root_name = selector.root_name
 
-        device_data = DeviceData.from_structure(
-            self._device_tree.GetDeviceData(device_name)
-        )
-
-        format_data = DeviceFormatData.from_structure(
-            self._device_tree.GetFormatData(device_name)
-        )
+        device_data = self._device_tree_snapshot.get_device_data(device_name)
+        format_data = self._device_tree_snapshot.get_format_data(device_name)
 
         mount_point = self._get_mount_point_description(
             mount_point, format_data
@@ -21,9 +21,10 @@ from blivet.size import Size
 
 from pyanaconda.core.i18n import _, C_, N_, P_
 from pyanaconda.modules.common.constants.services import STORAGE
-from pyanaconda.modules.common.structures.storage import OSData, DeviceData, DeviceFormatData
+from pyanaconda.modules.common.structures.storage import OSData
 from pyanaconda.ui.gui import GUIObject
 from pyanaconda.ui.gui.utils import blockedHandler, escape_markup, timed_action
+from pyanaconda.ui.lib.storage import DeviceTreeSnapshot
 
 import gi
 gi.require_version("Gdk", "3.0")
@@ -70,6 +71,9 @@ class ResizeDialog(GUIObject):
             partitioning.GetDeviceTree()
         )
 
+        # Get the snapshot of the device tree data.
+        self._snapshot = DeviceTreeSnapshot(self._device_tree)
+
         # Get roots of existing systems.
         self._roots = OSData.from_structure_list(
             self._device_tree.GetExistingSystems()
@@ -130,6 +134,7 @@ class ResizeDialog(GUIObject):
             return None
 
     def populate(self, disks):
+        self._snapshot.refresh()
         self._initial_free_space = Size(0)
         self._selected_reclaimable_space = Size(0)
         self._can_shrink_something = False
@@ -162,12 +167,8 @@ class ResizeDialog(GUIObject):
 
     def _add_disk(self, device_name):
         # Get the device data.
-        device_data = DeviceData.from_structure(
-            self._device_tree.GetDeviceData(device_name)
-        )
-        format_data = DeviceFormatData.from_structure(
-            self._device_tree.GetFormatData(device_name)
-        )
+        device_data = self._snapshot.get_device_data(device_name)
+        format_data = self._snapshot.get_format_data(device_name)
 
         # First add the disk itself.
         is_partitioned = self._device_tree.IsDevicePartitioned(device_name)
@@ -216,12 +217,8 @@ class ResizeDialog(GUIObject):
 
     def _add_partition(self, itr, device_name):
         # Get the device data.
-        device_data = DeviceData.from_structure(
-            self._device_tree.GetDeviceData(device_name)
-        )
-        format_data = DeviceFormatData.from_structure(
-            self._device_tree.GetFormatData(device_name)
-        )
+        device_data = self._snapshot.get_device_data(device_name)
+        format_data = self._snapshot.get_format_data(device_name)
 
         # Calculate the free size.
         # Devices that are not resizable are still deletable.
@@ -385,9 +382,7 @@ class ResizeDialog(GUIObject):
             return
 
         device_name = obj.name
-        device_data = DeviceData.from_structure(
-            self._device_tree.GetDeviceData(device_name)
-        )
+        device_data = self._snapshot.get_device_data(device_name)
 
         # If the selected filesystem does not support shrinking, make that
         # button insensitive.
@@ -448,9 +443,7 @@ class ResizeDialog(GUIObject):
         if is_partitioned:
             return False
 
-        device_data = DeviceData.from_structure(
-            self._device_tree.GetDeviceData(device_name)
-        )
+        device_data = self._snapshot.get_device_data(device_name)
 
         if obj.action == _(PRESERVE):
             return False
@@ -506,9 +499,7 @@ class ResizeDialog(GUIObject):
                     self._disk_store[part_itr][EDITABLE_COL] = False
                 elif new_action == PRESERVE:
                     part_name = self._disk_store[part_itr][DEVICE_NAME_COL]
-                    part_data = DeviceData.from_structure(
-                        self._device_tree.GetDeviceData(part_name)
-                    )
+                    part_data = self._snapshot.get_device_data(part_name)
                     self._disk_store[part_itr][EDITABLE_COL] = not part_data.protected
 
                 part_itr = self._disk_store.iter_next(part_itr)
@@ -558,9 +549,7 @@ class ResizeDialog(GUIObject):
                 continue
 
             device_name = obj.name
-            device_data = DeviceData.from_structure(
-                self._device_tree.GetDeviceData(device_name)
-            )
+            device_data = self._snapshot.get_device_data(device_name)
 
             if device_data.is_disk:
                 self._on_action_changed(itr, action)
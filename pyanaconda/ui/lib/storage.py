@@ -35,6 +35,7 @@ from pyanaconda.modules.common.constants.objects import DISK_SELECTION, BOOTLOAD
 from pyanaconda.modules.common.constants.services import STORAGE
 from pyanaconda.modules.common.errors.configuration import StorageConfigurationError, \
     BootloaderConfigurationError
+from pyanaconda.modules.common.structures.storage import DeviceData, DeviceFormatData
 from pyanaconda.modules.common.structures.validation import ValidationReport
 from pyanaconda.modules.common.task import sync_run_task
 from pyanaconda.core.storage import device_matches
@@ -401,3 +402,89 @@ def filter_disks_by_names(disks, names):
     :return: a list of filtered disk names
     """
     return list(filter(lambda name: name in disks, names))
+
+
+class DeviceTreeSnapshot(object):
+    """A snapshot of the device tree data.
+
+    The snapshot fetches data of all devices and their formats with
+    two DBus calls and keeps them until the generation of the storage
+    model changes. Call the refresh method before a batch of lookups
+    to make sure that the data are up to date.
+    """
+
+    def __init__(self, device_tree):
+        """Create a new snapshot.
+
+        :param device_tree: a proxy of the device tree
+        """
+        self._device_tree = device_tree
+        self._generation = None
+        self._devices = {}
+        self._formats = {}
+
+    @property
+    def generation(self):
+        """The generation of the cached data.
+
+        :return: a number of the generation or None
+        """
+        return self._generation
+
+    def refresh(self):
+        """Refresh the snapshot.
+
+        The data are fetched again only if the generation
+        of the storage model has changed.
+        """
+        generation = self._device_tree.GetGeneration()
+
+        if generation == self._generation:
+            return
+
+        devices = DeviceData.from_structure_list(
+            self._device_tree.GetAllDevicesData()
+        )
+        names = [d.name for d in devices]
+        formats = DeviceFormatData.from_structure_list(
+            self._device_tree.GetFormatsData(names)
+        )
+
+        self._devices = dict(zip(names, devices))
+        self._formats = dict(zip(names, formats))
+        self._generation = generation
+
+    def get_device_data(self, name):
+        """Get the device data.
+
+        Devices that are not in the snapshot, for example hidden
+        devices, are fetched from the device tree and cached.
+
+        :param name: a device name
+        :return: an instance of DeviceData
+        """
+        if self._generation is None:
+            self.refresh()
+
+        if name not in self._devices:
+            self._devices[name] = DeviceData.from_structure(
+                self._device_tree.GetDeviceData(name)
+            )
+
+        return self._devices[name]
+
+    def get_format_data(self, name):
+        """Get the device format data.
+
+        :param name: a device name
+        :return: an instance of DeviceFormatData
+        """
+        if self._generation is None:
+            self.refresh()
+
+        if name not in self._formats:
+            self._formats[name] = DeviceFormatData.from_structure(
+                self._device_tree.GetFormatData(name)
+            )
+
+        return self._formats[name]
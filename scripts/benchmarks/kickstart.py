@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+#
+# Measure the distribution of a large generated kickstart to modules.
+#
+# Start the Boss and the modules with ./run_boss_locally.py and pass the
+# printed bus address to this script. The script generates a kickstart
+# with the given number of packages and measures ReadKickstartFile.
+#
+# For detailed help call ./kickstart.py -h
+#
+
+import os
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+
+# add project top directory to the python paths
+top_dir = os.path.dirname(os.path.realpath(__file__))
+top_dir = os.path.dirname(os.path.dirname(top_dir))
+sys.path.insert(0, top_dir)
+
+from dasbus.connection import AddressedMessageBus
+
+from pyanaconda.modules.common.constants.services import BOSS
+from pyanaconda.modules.common.structures.kickstart import KickstartReport
+
+
+def parse_args():
+    parser = ArgumentParser(description="Measure the distribution of a large "
+                                        "generated kickstart to modules.")
+    parser.add_argument("address", type=str,
+                        help="address of the bus with the running Boss")
+    parser.add_argument("--packages", type=int, default=5000,
+                        help="number of packages in the generated kickstart")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of the measured distributions")
+    return parser.parse_args()
+
+
+def generate_kickstart(packages):
+    """Generate a kickstart with the given number of packages."""
+    lines = [
+        "lang en_US.UTF-8",
+        "keyboard us",
+        "timezone America/New_York",
+        "rootpw --lock",
+        "network --bootproto=dhcp",
+        "autopart",
+        "%packages",
+        "@^minimal-environment",
+        "@core",
+    ]
+
+    for i in range(packages):
+        lines.append("package-{}".format(i))
+
+        if i % 10 == 0:
+            lines.append("-excluded-package-{}".format(i))
+
+    lines.append("%end")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    args = parse_args()
+    message_bus = AddressedMessageBus(args.address)
+    boss_proxy = message_bus.get_proxy(BOSS.service_name, BOSS.object_path)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".ks") as f:
+        f.write(generate_kickstart(args.packages))
+        f.flush()
+
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            report = KickstartReport.from_structure(boss_proxy.ReadKickstartFile(f.name))
+            duration = time.perf_counter() - start
+
+            print("{} packages: ReadKickstartFile {:.3f} s, {}".format(
+                args.packages, duration, "valid" if report.is_valid() else str(report)
+            ))
+
+
+if __name__ == "__main__":
+    main()
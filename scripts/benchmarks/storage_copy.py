@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+#
+# Compare a deep copy of the storage model with resets of a partitioning.
+#
+# Measure the time, the allocated memory and the RSS of a deep copy of
+# synthetic storage models and of resets of the automatic partitioning.
+#
+# For detailed help call ./storage_copy.py -h
+#
+
+import os
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+# add project top directory to the python paths
+top_dir = os.path.dirname(os.path.realpath(__file__))
+top_dir = os.path.dirname(os.path.dirname(top_dir))
+sys.path.insert(0, top_dir)
+
+from blivet.devices import DiskDevice
+from blivet.formats import get_format
+from blivet.size import Size
+
+from pyanaconda.modules.storage.devicetree import create_storage
+from pyanaconda.modules.storage.partitioning.automatic.automatic_module import \
+    AutoPartitioningModule
+
+
+def parse_args():
+    parser = ArgumentParser(description="Compare a deep copy of the storage model "
+                                        "with resets of a partitioning.")
+    parser.add_argument("--disks", type=int, nargs="+", default=[10, 100, 1000],
+                        help="numbers of disks in the synthetic storage models")
+    parser.add_argument("--resets", type=int, default=10,
+                        help="number of the measured partitioning resets")
+    return parser.parse_args()
+
+
+def get_rss():
+    """Get the resident set size of the current process in bytes."""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def create_synthetic_storage(disks):
+    """Create a synthetic storage model with the given number of disks."""
+    storage = create_storage()
+
+    for i in range(disks):
+        storage.devicetree._add_device(DiskDevice(
+            "disk{}".format(i),
+            fmt=get_format("ext4"),
+            size=Size("10 GiB"),
+            exists=True
+        ))
+
+    return storage
+
+
+def measure(callback):
+    """Measure the time, the allocated memory and the RSS of the callback."""
+    rss = get_rss()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    result = callback()
+
+    duration = time.perf_counter() - start
+    _, memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = get_rss() - rss
+
+    # Keep the result alive until the RSS is measured.
+    del result
+    return duration, memory, rss
+
+
+def measure_resets(storage, resets):
+    """Measure resets of a partitioning with a device tree."""
+    module = AutoPartitioningModule()
+    module.on_storage_changed(storage)
+    module.get_device_tree()
+
+    def _reset():
+        for _ in range(resets):
+            module.on_partitioning_reset()
+
+    return measure(_reset)
+
+
+def main():
+    args = parse_args()
+
+    for disks in args.disks:
+        storage = create_synthetic_storage(disks)
+        copy_time, copy_memory, copy_rss = measure(storage.copy)
+        reset_time, reset_memory, reset_rss = measure_resets(storage, args.resets)
+
+        print(
+            "{} disks: copy {:.3f} s, {} B allocated, {} B RSS; "
+            "{} resets {:.3f} s, {} B allocated, {} B RSS".format(
+                disks, copy_time, copy_memory, copy_rss,
+                args.resets, reset_time, reset_memory, reset_rss
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
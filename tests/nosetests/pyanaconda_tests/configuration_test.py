@@ -310,6 +310,16 @@ class AnacondaConfigurationTestCase(unittest.TestCase):
             ))
         )
 
+        self.assertEqual(conf.anaconda.lazy_kickstart_modules, [])
+
+    def configuration_threads_test(self):
+        conf = AnacondaConfiguration.from_defaults()
+        self.assertEqual(conf.anaconda.configuration_threads, 1)
+
+    def tracing_test(self):
+        conf = AnacondaConfiguration.from_defaults()
+        self.assertEqual(conf.anaconda.tracing, False)
+
     def bootloader_test(self):
         conf = AnacondaConfiguration.from_defaults()
         self.assertIn("selinux", conf.bootloader.preserved_arguments)
@@ -0,0 +1,169 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from queue import Queue
+from unittest.mock import Mock, patch
+
+import dnf.callback
+from blivet.size import Size
+
+from pyanaconda.payload.dnf.download_progress import DownloadProgress
+
+
+class DNFPayloadMock(object):
+    """Mock of a DNF payload with an expensive string representation."""
+
+    def __init__(self, name, download_size):
+        self.name = name
+        self.download_size = download_size
+
+    def __str__(self):
+        raise AssertionError("The string representation shouldn't be used.")
+
+
+class CountingDict(dict):
+    """Dictionary that counts the scans of its items."""
+
+    def __init__(self):
+        super().__init__()
+        self.scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return super().__iter__()
+
+    def keys(self):
+        self.scans += 1
+        return super().keys()
+
+    def values(self):
+        self.scans += 1
+        return super().values()
+
+    def items(self):
+        self.scans += 1
+        return super().items()
+
+
+class DownloadProgressTestCase(unittest.TestCase):
+    """Test the download progress."""
+
+    def accounting_test(self):
+        """Test the accounting of the downloaded size."""
+        progress = DownloadProgress()
+        progress.start(2, 300)
+
+        first = DNFPayloadMock("first", 100)
+        second = DNFPayloadMock("second", 200)
+
+        progress.progress(first, 50)
+        self.assertEqual(progress.downloaded, 50)
+
+        progress.progress(second, 150)
+        self.assertEqual(progress.downloaded, 200)
+
+        progress.progress(first, 80)
+        self.assertEqual(progress.downloaded, 230)
+
+        progress.end(first, dnf.callback.STATUS_OK, None)
+        self.assertEqual(progress.downloaded, 250)
+
+        progress.end(second, dnf.callback.STATUS_OK, None)
+        self.assertEqual(progress.downloaded, 300)
+
+    def failed_download_test(self):
+        """Test a failed download."""
+        progress = DownloadProgress()
+        progress.start(1, 100)
+
+        payload = Mock(download_size=100)
+        progress.progress(payload, 20)
+        progress.end(payload, dnf.callback.STATUS_FAILED, "Error!")
+        self.assertEqual(progress.downloaded, 0)
+        self.assertEqual(progress.downloads, {})
+
+    def retried_download_test(self):
+        """Test a download that is retried after a failure."""
+        progress = DownloadProgress()
+        progress.start(2, 200)
+
+        first = Mock(download_size=100)
+        second = DNFPayloadMock("second", 100)
+
+        progress.progress(first, 60)
+        progress.progress(second, 100)
+        progress.end(second, dnf.callback.STATUS_OK, None)
+        progress.end(first, dnf.callback.STATUS_FAILED, "Error!")
+        self.assertEqual(progress.downloaded, 100)
+
+        progress.progress(first, 80)
+        self.assertEqual(progress.downloaded, 180)
+
+        progress.end(first, dnf.callback.STATUS_OK, None)
+        self.assertEqual(progress.downloaded, 200)
+
+    @patch("pyanaconda.payload.dnf.download_progress.time")
+    def message_test(self, time_mock):
+        """Test the progress message."""
+        queue = Queue()
+        time_mock.time.return_value = 100
+
+        progress = DownloadProgress(queue)
+        progress.start(2, Size("100 MiB").get_bytes())
+
+        time_mock.time.return_value = 110
+        progress.progress(Mock(), Size("50 MiB").get_bytes())
+
+        token, msg = queue.get_nowait()
+        self.assertEqual(token, "download")
+        self.assertEqual(
+            msg,
+            "Downloading 2 RPMs, 50 MiB / 100 MiB (50%) done. 5 MiB/s, 0:10 remaining."
+        )
+
+    @patch("pyanaconda.payload.dnf.download_progress.progressQ")
+    def message_without_queue_test(self, progress_queue):
+        """Test the progress message without a queue."""
+        progress = DownloadProgress()
+        progress.start(1, 0)
+        progress.last_time = 0
+
+        progress.progress(Mock(), 0)
+        progress_queue.send_message.assert_called_once_with(
+            "Downloading 1 RPMs, 0 B / 0 B (0%) done."
+        )
+
+    def callbacks_test(self):
+        """Test that the progress callback doesn't scan all packages."""
+        progress = DownloadProgress()
+        progress.downloads = CountingDict()
+        progress.start(1000, 1000 * 10)
+
+        for i in range(1000):
+            payload = DNFPayloadMock(str(i), 10)
+
+            for done in range(1, 10):
+                progress.progress(payload, done)
+
+            progress.end(payload, dnf.callback.STATUS_OK, None)
+
+        self.assertEqual(progress.downloaded, 1000 * 10)
+        self.assertEqual(progress.downloads.scans, 0)
+
+        # The finished packages are forgotten.
+        self.assertEqual(len(progress.downloads), 0)
@@ -0,0 +1,99 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import subprocess
+import sys
+import unittest
+
+# Maximal cumulative import time of an entry point in microseconds.
+# The budget is generous, it should catch only big regressions.
+IMPORT_TIME_BUDGET = 2000000
+
+
+class ImportTimeTestCase(unittest.TestCase):
+    """Test the startup import cost of the entry points."""
+
+    def _import(self, name):
+        """Import the module in a new interpreter.
+
+        :param name: a name of the module
+        :return: a cumulative import time and a set of imported modules
+        """
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import {}".format(name)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True
+        )
+
+        cumulative_time = None
+        imported_modules = set()
+
+        # Parse lines like: import time:  1234 |  5678 | module
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+
+            _self_time, cumulative, module = line[len("import time:"):].split("|")
+
+            if not cumulative.strip().isdigit():
+                continue
+
+            module = module.strip()
+            imported_modules.add(module)
+
+            if module == name:
+                cumulative_time = int(cumulative)
+
+        self.assertIsNotNone(cumulative_time)
+        return cumulative_time, imported_modules
+
+    def _check_import(self, name, lazy_modules):
+        """Check the import of the entry point.
+
+        :param name: a name of the entry point
+        :param lazy_modules: names of modules that shouldn't be imported
+        """
+        cumulative_time, imported_modules = self._import(name)
+
+        for module in lazy_modules:
+            self.assertNotIn(module, imported_modules,
+                             "{} imports {}".format(name, module))
+
+        self.assertLess(cumulative_time, IMPORT_TIME_BUDGET,
+                        "{} is imported in {} us".format(name, cumulative_time))
+
+    def util_test(self):
+        """Test the import of pyanaconda.core.util."""
+        self._check_import("pyanaconda.core.util", ["requests"])
+
+    def localization_test(self):
+        """Test the import of pyanaconda.localization."""
+        self._check_import("pyanaconda.localization", ["langtable"])
+
+    def timezone_test(self):
+        """Test the import of pyanaconda.timezone."""
+        self._check_import("pyanaconda.timezone", ["langtable", "pytz"])
+
+    def geoloc_test(self):
+        """Test the import of pyanaconda.geoloc."""
+        self._check_import("pyanaconda.geoloc", ["langtable", "pytz", "requests", "dbus"])
+
+    def anaconda_test(self):
+        """Test the import of pyanaconda.anaconda."""
+        self._check_import("pyanaconda.anaconda", ["gi.repository.Flatpak", "dnf"])
@@ -19,9 +19,12 @@
 #
 
 import unittest
+from threading import Barrier, Event, current_thread
 
 from pyanaconda.installation_tasks import Task
 from pyanaconda.installation_tasks import TaskQueue
+from pyanaconda.installation_tasks import ParallelTaskQueue
+from pyanaconda.installation_tasks import BackgroundTask
 
 class InstallTasksTestCase(unittest.TestCase):
 
@@ -369,3 +372,147 @@ class InstallTasksTestCase(unittest.TestCase):
         self.assertEqual(self._test_variable1, 3)
         self.assertEqual(self._test_variable2, 2)
         self.assertEqual(self._test_variable3, 1)
+
+    def parallel_task_queue_test(self):
+        """Check that parallel task queue processing works correctly."""
+        barrier = Barrier(2, timeout=10)
+        order = []
+
+        def wait_for_other_task(name):
+            # both tasks have to run at the same time to pass the barrier
+            barrier.wait()
+            order.append(name)
+
+        group1 = TaskQueue(name="group1", status_message="processing group1")
+        group1.append(Task("wait 1", wait_for_other_task, ("wait 1",)))
+        group1.append(Task("append 1", order.append, ("append 1",)))
+        group1.append(Task("append 2", order.append, ("append 2",)))
+        group2 = TaskQueue(name="group2", status_message="processing group2")
+        group2.append(Task("wait 2", wait_for_other_task, ("wait 2",)))
+
+        queue1 = ParallelTaskQueue(name="queue1", max_workers=2)
+        queue1.task_started.connect(lambda *args: self._increment_var1())
+        queue1.task_completed.connect(lambda *args: self._increment_var2())
+        queue1.queue_started.connect(lambda *args: self._increment_var3())
+        queue1.append(group1)
+        queue1.append(group2)
+
+        self.assertEqual(queue1.max_workers, 2)
+        self.assertEqual(queue1.queue_count, 2)
+        self.assertEqual(queue1.task_count, 4)
+        self.assertEqual(queue1.progress, 0.0)
+        self.assertIn(" Task queue: group1", queue1.summary.splitlines())
+
+        queue1.start()
+
+        # the tasks of the nested queue are still run in order
+        self.assertEqual(order.index("append 1") - order.index("wait 1"), 1)
+        self.assertEqual(order.index("append 2") - order.index("append 1"), 1)
+        self.assertIn("wait 2", order)
+
+        self.assertEqual(self._test_variable1, 4)
+        self.assertEqual(self._test_variable2, 4)
+        self.assertEqual(self._test_variable3, 2)
+        self.assertFalse(queue1.running)
+        self.assertTrue(queue1.done)
+        self.assertEqual(queue1.progress, 1.0)
+        self.assertIsNone(queue1.current_task_number)
+
+    def parallel_task_queue_progress_test(self):
+        """Check the progress of a nested parallel task queue."""
+        queue1 = TaskQueue(name="queue1")
+        queue2 = ParallelTaskQueue(name="queue2", status_message="processing queue2")
+        queue1.append(Task("task 1", self._increment_var1))
+        queue1.append(queue2)
+
+        progress = []
+
+        def check_progress():
+            progress.append(queue1.progress)
+
+        queue2.append(Task("task 2", check_progress))
+        queue2.append(Task("task 3", check_progress))
+
+        self.assertEqual(queue1.task_count, 3)
+        self.assertEqual(queue1.queue_count, 1)
+        self.assertIn(" Parallel task queue: queue2", queue1.summary.splitlines())
+
+        queue1.start()
+
+        # the first task is always completed
+        self.assertEqual(len(progress), 2)
+        self.assertTrue(all(1 / 3 <= value < 1.0 for value in progress))
+        self.assertEqual(queue1.progress, 1.0)
+        self.assertEqual(queue2.progress, 1.0)
+
+    def parallel_task_queue_limit_test(self):
+        """Check the limited parallel task queue."""
+        threads = set()
+
+        def save_thread():
+            threads.add(current_thread().name)
+
+        queue1 = ParallelTaskQueue(name="queue1", max_workers=1)
+        queue1.append(Task("task 1", save_thread))
+        queue1.append(Task("task 2", save_thread))
+        queue1.start()
+
+        # the tasks were run in the current thread
+        self.assertEqual(threads, {current_thread().name})
+        self.assertTrue(queue1.done)
+
+    def parallel_task_queue_failure_test(self):
+        """Check the failure of a task in a parallel task queue."""
+        def raise_error():
+            raise ValueError("Fake error.")
+
+        queue1 = ParallelTaskQueue(name="queue1")
+        queue1.append(Task("task 1", raise_error))
+        queue1.append(Task("task 2", self._increment_var1))
+
+        with self.assertRaises(ValueError):
+            queue1.start()
+
+        # the other tasks are finished
+        self.assertEqual(self._test_variable1, 1)
+
+    def background_task_test(self):
+        """Check that background task works correctly."""
+        event = Event()
+        order = []
+
+        def run_in_background():
+            # wait for the next task
+            event.wait(timeout=10)
+            order.append("background")
+
+        def run_in_foreground():
+            order.append("foreground")
+            event.set()
+
+        background_task = BackgroundTask("background", "AnaTestThread", run_in_background)
+        self.assertEqual(background_task.thread_name, "AnaTestThread")
+
+        queue1 = TaskQueue(name="queue1")
+        queue1.append(background_task)
+        queue1.append(Task("foreground", run_in_foreground))
+        queue1.append(background_task.create_wait_task("wait"))
+        queue1.append(Task("after", order.append, ("after",)))
+        queue1.start()
+
+        self.assertEqual(order, ["foreground", "background", "after"])
+        self.assertTrue(background_task.done)
+
+    def background_task_failure_test(self):
+        """Check the failure of a background task."""
+        def raise_error():
+            raise ValueError("Fake error.")
+
+        background_task = BackgroundTask("background", "AnaTestFailingThread", raise_error)
+        wait_task = background_task.create_wait_task("wait")
+
+        background_task.start()
+
+        # the error is raised by the wait task
+        with self.assertRaises(ValueError):
+            wait_task.start()
@@ -19,6 +19,7 @@
 #
 import unittest
 from textwrap import dedent
+from types import SimpleNamespace
 
 from pykickstart.errors import KickstartParseError
 from pykickstart.commands.skipx import FC3_SkipX
@@ -34,7 +35,8 @@ from pyanaconda.core.kickstart.specification import KickstartSpecification,\
     KickstartSpecificationHandler, KickstartSpecificationParser
 from pyanaconda.modules.localization.kickstart import LocalizationKickstartSpecification
 from pyanaconda.modules.network.kickstart import NetworkKickstartSpecification
-from pyanaconda.modules.payloads.kickstart import PayloadKickstartSpecification
+from pyanaconda.modules.payloads.kickstart import PayloadKickstartSpecification, \
+    AnacondaPackageSection
 from pyanaconda.modules.security.kickstart import SecurityKickstartSpecification
 from pyanaconda.modules.services.kickstart import ServicesKickstartSpecification
 from pyanaconda.modules.storage.kickstart import StorageKickstartSpecification
@@ -275,6 +277,58 @@ class KickstartSpecificationTestCase(unittest.TestCase):
         with self.assertRaises(KickstartParseError):
             self.parse_kickstart(specification, "xconfig")
 
+    def read_elements_test(self):
+        """Test reading of pre-parsed kickstart elements."""
+        specification = self.SpecificationE
+        expected = self.parse_kickstart(specification, dedent("""
+        user --name John
+        skipx
+        %packages --excludedocs
+        x
+        # comment
+        -y
+        %end
+        """))
+
+        elements = [
+            SimpleNamespace(
+                args=["user", "--name", "John"],
+                lines=["user --name John\n"],
+                line_number=1
+            ),
+            SimpleNamespace(
+                args=["skipx"],
+                lines=["skipx\n"],
+                line_number=2
+            ),
+            SimpleNamespace(
+                args=["%packages", "--excludedocs"],
+                lines=["x\n", "# comment\n", "-y\n"],
+                line_number=3
+            ),
+        ]
+
+        handler = KickstartSpecificationHandler(specification)
+        parser = KickstartSpecificationParser(handler, specification)
+        parser.read_elements(elements)
+        self.assertEqual(str(handler), str(expected))
+
+        # Test an unknown command.
+        with self.assertRaises(KickstartParseError) as cm:
+            parser.read_elements([
+                SimpleNamespace(args=["xconfig"], lines=["xconfig\n"], line_number=5)
+            ])
+
+        self.assertEqual(cm.exception.lineno, 5)
+
+        # Test an unknown section.
+        with self.assertRaises(KickstartParseError) as cm:
+            parser.read_elements([
+                SimpleNamespace(args=["%post"], lines=["ls\n"], line_number=7)
+            ])
+
+        self.assertEqual(cm.exception.lineno, 7)
+
     def first_addon_specification_test(self):
         specification = self.SpecificationF
 
@@ -381,6 +435,104 @@ class KickstartSpecificationTestCase(unittest.TestCase):
            """)
 
 
+class PackageSectionTestCase(unittest.TestCase):
+    """Test the Anaconda packages section."""
+
+    class SpecificationA(KickstartSpecification):
+
+        sections = {
+            "packages": PackageSection
+        }
+
+        sections_data = {
+            "packages": Packages
+        }
+
+    class SpecificationB(KickstartSpecification):
+
+        sections = {
+            "packages": AnacondaPackageSection
+        }
+
+        sections_data = {
+            "packages": Packages
+        }
+
+    def _parse_packages(self, specification, kickstart_input):
+        """Parse the packages section and return the packages data."""
+        handler = KickstartSpecificationHandler(specification)
+        parser = KickstartSpecificationParser(handler, specification)
+        parser.readKickstartFromString(kickstart_input)
+        return handler.packages
+
+    def _compare_packages(self, kickstart_input):
+        """Compare the batched and the line by line processing."""
+        kickstart_input = dedent(kickstart_input)
+        expected = self._parse_packages(self.SpecificationA, kickstart_input)
+        packages = self._parse_packages(self.SpecificationB, kickstart_input)
+
+        self.assertEqual(packages.packageList, expected.packageList)
+        self.assertEqual(packages.excludedList, expected.excludedList)
+        self.assertEqual(packages.environment, expected.environment)
+        self.assertEqual(
+            [(g.name, g.include) for g in packages.groupList],
+            [(g.name, g.include) for g in expected.groupList]
+        )
+        self.assertEqual(
+            [g.name for g in packages.excludedGroupList],
+            [g.name for g in expected.excludedGroupList]
+        )
+
+    def packages_test(self):
+        """Test the packages and the exclusions."""
+        self._compare_packages("""
+        %packages
+        a
+        b # comment
+        -c
+        -a
+        a
+        b
+        -b
+        %end
+        """)
+
+    def groups_test(self):
+        """Test the groups and the environments."""
+        self._compare_packages("""
+        %packages
+        @^env-1
+        a
+        -@g1
+        @g1 --optional
+        -b
+        @g2
+        b
+        -@^env-1
+        -@g2
+        %end
+        """)
+
+    def multiple_sections_test(self):
+        """Test multiple packages sections."""
+        self._compare_packages("""
+        %packages
+        a
+        -b
+        %end
+        %packages
+        b
+        -a
+        %end
+        """)
+
+    def many_packages_test(self):
+        """Test many packages and exclusions."""
+        self._compare_packages("%packages\n{}\n%end\n".format("\n".join(
+            "package-{0}\n-package-{1}".format(i, i // 2) for i in range(500)
+        )))
+
+
 class ModuleSpecificationsTestCase(unittest.TestCase):
     """Test the kickstart module specifications."""
 
@@ -0,0 +1,185 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+
+from pyanaconda.payload.live.install_progress import InstallProgress, parse_rsync_progress, \
+    parse_tar_checkpoint
+from pyanaconda.payload.live.payload_liveimg import LiveImagePayload
+
+
+class FakeLines(object):
+    """Fake output lines of a program."""
+
+    def __init__(self, lines, returncode=0, error=None):
+        self._lines = lines
+        self._error = error
+        self.returncode = returncode
+
+    def __iter__(self):
+        yield from self._lines
+
+        if self._error:
+            raise self._error
+
+
+class InstallProgressTestCase(unittest.TestCase):
+    """Test the progress of the live payload installation."""
+
+    def parse_rsync_progress_test(self):
+        """Test the parsing of the rsync progress."""
+        self.assertEqual(
+            parse_rsync_progress("    1,238,099  45%  146.38MB/s    0:00:00 (xfr#5, to-chk=1/3)"),
+            (1238099, 45)
+        )
+        self.assertEqual(
+            parse_rsync_progress("0   0%    0.00kB/s    0:00:00"),
+            (0, 0)
+        )
+        self.assertIsNone(parse_rsync_progress("sending incremental file list"))
+        self.assertIsNone(parse_rsync_progress("rsync: failed to set times on \"/a\""))
+        self.assertIsNone(parse_rsync_progress(""))
+
+    def parse_tar_checkpoint_test(self):
+        """Test the parsing of the tar checkpoint."""
+        self.assertEqual(
+            parse_tar_checkpoint("tar: r: 1013760 (990KiB, 491MiB/s)"),
+            (1013760, None)
+        )
+        self.assertIsNone(parse_tar_checkpoint("tar: Removing leading `/' from member names"))
+        self.assertIsNone(parse_tar_checkpoint(""))
+
+    @patch("pyanaconda.payload.live.install_progress.progressQ")
+    def progress_test(self, progress_queue):
+        """Test the progress messages."""
+        progress = InstallProgress(total_size=200)
+
+        progress.update(50, None)
+        self.assertEqual(progress.installed, 50)
+        self.assertRegex(
+            progress_queue.send_message.call_args[0][0],
+            r"^Installing software 25% \(.*/s\)$"
+        )
+
+        # The percentage didn't change.
+        progress_queue.reset_mock()
+        progress.update(51, None)
+        progress_queue.send_message.assert_not_called()
+
+        # Use the reported percentage.
+        progress.update(60, 90)
+        self.assertRegex(
+            progress_queue.send_message.call_args[0][0],
+            r"^Installing software 90% \(.*/s\)$"
+        )
+
+        # Don't report more than 100%.
+        progress.update(1000, None)
+        self.assertRegex(
+            progress_queue.send_message.call_args[0][0],
+            r"^Installing software 100% \(.*/s\)$"
+        )
+
+        progress.end()
+        progress_queue.send_message.assert_called_with("Installing software 100%")
+
+    @patch("pyanaconda.payload.live.install_progress.progressQ")
+    def unknown_size_test(self, progress_queue):
+        """Test the progress with an unknown size."""
+        progress = InstallProgress()
+        progress.update(50, None)
+
+        self.assertRegex(
+            progress_queue.send_message.call_args[0][0],
+            r"^Installing software 0% \(.*/s\)$"
+        )
+
+
+class LiveImagePayloadTestCase(unittest.TestCase):
+    """Test the installation of the live image payload."""
+
+    def setUp(self):
+        self.payload = LiveImagePayload(Mock())
+        self.progress = Mock()
+
+    @patch("pyanaconda.payload.live.payload_base.program_log")
+    @patch("pyanaconda.payload.live.payload_base.util.execReadlines")
+    def run_with_progress_test(self, exec_readlines, program_log):
+        """Test the progress parsed from the output."""
+        exec_readlines.return_value = FakeLines([
+            "tar: r: 1013760 (990KiB, 491MiB/s)",
+            "tar: Removing leading `/' from member names",
+            "tar: r: 2027520 (1.9MiB, 491MiB/s)",
+        ])
+
+        result = self.payload._run_with_progress(
+            "tar", ["-xaf", "disk.img"], self.progress, parse_tar_checkpoint
+        )
+
+        self.assertEqual(result, (0, None))
+        exec_readlines.assert_called_once_with(
+            "tar", ["-xaf", "disk.img"], universal_newlines=True
+        )
+        self.assertEqual(
+            [c[0] for c in self.progress.update.call_args_list],
+            [(1013760, None), (2027520, None)]
+        )
+
+        # The other output is logged to the program log.
+        program_log.info.assert_called_once_with("tar: Removing leading `/' from member names")
+
+    @patch("pyanaconda.payload.live.payload_base.util.execReadlines")
+    def run_with_progress_failure_test(self, exec_readlines):
+        """Test the failures of the command with progress."""
+        exec_readlines.side_effect = OSError("Fake error!")
+        result = self.payload._run_with_progress("tar", [], self.progress, parse_tar_checkpoint)
+        self.assertEqual(result, (None, "Fake error!"))
+
+        exec_readlines.side_effect = None
+        exec_readlines.return_value = FakeLines([], -9, OSError("Killed!"))
+        result = self.payload._run_with_progress("tar", [], self.progress, parse_tar_checkpoint)
+        self.assertEqual(result, (-9, "Killed!"))
+
+        # The exit status is reported by the caller.
+        exec_readlines.return_value = FakeLines([], 2, OSError("Failed!"))
+        result = self.payload._run_with_progress("tar", [], self.progress, parse_tar_checkpoint)
+        self.assertEqual(result, (2, None))
+
+        self.progress.update.assert_not_called()
+
+    def tarball_size_test(self):
+        """Test the estimated size of the tarball."""
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(b"x" * 100)
+            f.flush()
+
+            # The image is always stored as disk.img.
+            self.payload.image_path = f.name
+
+            self.payload.data.liveimg.url = "http://my/image.tar"
+            self.assertEqual(self.payload._get_tarball_size(), 100)
+
+            self.payload.data.liveimg.url = "file:///my/image.tar"
+            self.assertEqual(self.payload._get_tarball_size(), 100)
+
+            self.payload.data.liveimg.url = "http://my/image.tar.xz"
+            self.assertEqual(self.payload._get_tarball_size(), 200)
+
+            self.payload.data.liveimg.url = "ftp://my/image.tgz"
+            self.assertEqual(self.payload._get_tarball_size(), 200)
@@ -19,11 +19,16 @@
 import unittest
 import os
 from contextlib import contextmanager
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+from dasbus.constants import DBUS_FLAG_NONE
+from dasbus.error import DBusError
+from gi.repository import GLib
 
 from pyanaconda.modules.boss.kickstart_manager import KickstartManager
 from pyanaconda.modules.boss.module_manager.module_observer import ModuleObserver
-from pyanaconda.modules.common.structures.kickstart import KickstartReport, KickstartMessage
+from pyanaconda.modules.common.structures.kickstart import KickstartReport, KickstartMessage, \
+    KickstartElementData
 
 KICKSTART1 = """
 text
@@ -264,6 +269,37 @@ class KickstartManagerTestCase(unittest.TestCase):
 
         self.assertEqual(manager.generate_kickstart(), self._m123_kickstart)
 
+    @patch("pyanaconda.modules.boss.kickstart_manager.kickstart_manager.DBus")
+    def start_required_modules_test(self, dbus):
+        """Start lazy modules required by the kickstart."""
+        manager = KickstartManager()
+        manager._call_modules = Mock()
+
+        security = ModuleObserver(Mock(), "org.fedoraproject.Anaconda.Modules.Security",
+                                  is_lazy=True)
+        services = ModuleObserver(Mock(), "org.fedoraproject.Anaconda.Modules.Services",
+                                  is_lazy=True)
+
+        manager.on_module_observers_changed([security, services])
+
+        ks_content = "selinux --permissive"
+        with self._create_ks_files([("ks.mgr.test.lazy.cfg", ks_content)]) as filename:
+            elements = manager._split_to_elements(filename)
+
+        manager._start_required_modules(elements)
+        manager._call_modules.assert_called_once_with([(
+            dbus.proxy.StartServiceByName,
+            ("org.fedoraproject.Anaconda.Modules.Security", DBUS_FLAG_NONE)
+        )])
+
+        self.assertTrue(security.is_service_available)
+        self.assertFalse(services.is_service_available)
+
+        # The started module is not started again.
+        manager._call_modules.reset_mock()
+        manager._start_required_modules(elements)
+        manager._call_modules.assert_not_called()
+
     def nothing_to_parse_test(self):
         ks_content = ""
         manager = KickstartManager()
@@ -343,6 +379,58 @@ network --device=ens3
         )
 
 
+    def distribute_in_parallel_test(self):
+        """Test the distribution with replies in a different order."""
+        manager = KickstartManager()
+
+        module1 = DelayedTestModule(100, commands=["network", "firewall"])
+        module2 = DelayedTestModule(50, addons=["pony"])
+        module3 = DelayedTestModule(0, sections=["packages"])
+
+        manager.on_module_observers_changed([
+            self._get_module_observer("1", module1),
+            self._get_module_observer("2", module2),
+            self._get_module_observer("3", module3),
+        ])
+
+        with self._create_ks_files(self._kickstart_include) as filename:
+            report = manager.read_kickstart_file(filename)
+
+        self.assertEqual(module1.kickstart, self._m1_kickstart)
+        self.assertEqual(module2.kickstart, self._m2_kickstart)
+        self.assertEqual(module3.kickstart, self._m3_kickstart)
+
+        # the messages are in the order of the modules
+        self.assertEqual([m.module_name for m in report.get_messages()], ["1", "3"])
+        self.assertEqual([m.line_number for m in report.get_messages()], [5, 41])
+        self.assertEqual(manager.generate_kickstart(), self._m123_kickstart)
+
+    def distribute_failed_test(self):
+        """Test the distribution with failing modules."""
+        manager = KickstartManager()
+
+        module1 = DelayedTestModule(50, commands=["network", "firewall"])
+        module2 = DelayedTestModule(0, addons=["pony"], error=DBusError("Fake error 2."))
+        module3 = DelayedTestModule(0, sections=["packages"], error=DBusError("Fake error 3."))
+
+        manager.on_module_observers_changed([
+            self._get_module_observer("1", module1),
+            self._get_module_observer("2", module2),
+            self._get_module_observer("3", module3),
+        ])
+
+        with self._create_ks_files(self._kickstart_include) as filename:
+            with self.assertRaises(DBusError) as cm:
+                manager.read_kickstart_file(filename)
+
+        # the first error in the order of the modules is raised
+        self.assertEqual(str(cm.exception), "Fake error 2.")
+
+        # all modules got the kickstart
+        self.assertEqual(module1.kickstart, self._m1_kickstart)
+        self.assertEqual(module3.kickstart, self._m3_kickstart)
+
+
 class TestModule(object):
 
     def __init__(self, commands=None, sections=None, addons=None):
@@ -363,7 +451,12 @@ class TestModule(object):
     def KickstartCommands(self):
         return self.kickstart_commands
 
-    def ReadKickstart(self, kickstart):
+    def _reply(self, result, callback, callback_args):
+        """Reply to an asynchronous call."""
+        callback(lambda: result, *callback_args)
+        return None
+
+    def ReadKickstart(self, kickstart, callback, callback_args):
         """Mock parsing for now.
 
         Returns parse error if PARSE_ERROR string is found in kickstart.
@@ -378,8 +471,50 @@ class TestModule(object):
                 data.line_number = lnum
                 report.error_messages.append(data)
 
-        return KickstartReport.to_structure(report)
+        return self._reply(KickstartReport.to_structure(report), callback, callback_args)
+
+    def ReadKickstartElements(self, elements, callback, callback_args):
+        """Mock parsing of the kickstart elements.
 
-    def GenerateKickstart(self):
+        Returns parse error if PARSE_ERROR string is found in kickstart.
+        """
+        kickstart = ""
+
+        for element in KickstartElementData.from_structure_list(elements):
+            # The line numbers follow the kickstart generated from the elements.
+            assert element.line_number == kickstart.count("\n") + 1
+
+            if element.args[0].startswith("%"):
+                kickstart += "{}\n{}%end\n".format(" ".join(element.args), "".join(element.lines))
+            else:
+                kickstart += element.lines[0]
+
+        return self.ReadKickstart(kickstart, callback, callback_args)
+
+    def GenerateKickstart(self, callback, callback_args):
         """Mock generating a kickstart."""
-        return self.kickstart
+        return self._reply(self.kickstart, callback, callback_args)
+
+
+class DelayedTestModule(TestModule):
+    """Test module that replies later from the main context."""
+
+    def __init__(self, delay, error=None, **kwargs):
+        super().__init__(**kwargs)
+        self._delay = delay
+        self._error = error
+
+    def _reply(self, result, callback, callback_args):
+        def finish():
+            if self._error:
+                raise self._error
+
+            return result
+
+        def reply():
+            callback(finish, *callback_args)
+            return False
+
+        source = GLib.timeout_source_new(self._delay)
+        source.set_callback(reply)
+        source.attach(GLib.MainContext.ref_thread_default())
@@ -22,8 +22,10 @@ from dasbus.constants import DBUS_START_REPLY_SUCCESS, DBUS_FLAG_NONE
 from dasbus.error import DBusError
 
 from pyanaconda.modules.boss.module_manager import ModuleManager
+from pyanaconda.modules.boss.module_manager.module_observer import ModuleObserver
 from pyanaconda.modules.boss.module_manager.start_modules import StartModulesTask
 from pyanaconda.modules.common.errors.module import UnavailableModuleError
+from pyanaconda.modules.common.util import is_module_available
 
 
 class ModuleManagerTestCase(unittest.TestCase):
@@ -89,6 +91,77 @@ class ModuleManagerTestCase(unittest.TestCase):
         task = StartModulesTask(self._message_bus, service_names, addons_enabled=False)
         self._check_started_modules(task, service_names)
 
+    @patch("dasbus.client.observer.Gio")
+    def start_lazy_modules_test(self, gio):
+        """Start modules with lazy modules."""
+        service_names = [
+            "org.fedoraproject.Anaconda.Modules.A",
+            "org.fedoraproject.Anaconda.Modules.B",
+        ]
+
+        task = StartModulesTask(
+            self._message_bus,
+            service_names,
+            addons_enabled=False,
+            lazy_module_names=["org.fedoraproject.Anaconda.Modules.B"]
+        )
+
+        def call():
+            return DBUS_START_REPLY_SUCCESS
+
+        def fake_callbacks():
+            observer = task._module_observers[0]
+            observer._is_service_available = True
+            task._start_service_by_name_callback(call, observer)
+            task._service_available_callback(observer)
+
+        task._callbacks.put(fake_callbacks)
+        (observer_a, observer_b) = task.run()
+
+        self.assertFalse(observer_a.is_lazy)
+        self.assertTrue(observer_b.is_lazy)
+        self.assertFalse(observer_b.is_service_available)
+
+        # Only the first module is started.
+        bus_proxy = self._message_bus.proxy
+        bus_proxy.StartServiceByName.assert_called_once_with(
+            "org.fedoraproject.Anaconda.Modules.A",
+            DBUS_FLAG_NONE,
+            callback=task._start_service_by_name_callback,
+            callback_args=(observer_a,)
+        )
+
+        # Both modules are observed.
+        self.assertEqual(gio.bus_watch_name_on_connection.call_count, 2)
+
+        # The lazy module is not running, but it is available.
+        self._manager.set_module_observers([observer_a, observer_b])
+        self.assertEqual(self._manager.get_service_names(), service_names)
+
+    @patch("pyanaconda.modules.common.util.BOSS")
+    @patch("dasbus.client.observer.Gio")
+    def lazy_module_available_test(self, gio, boss):
+        """Check the availability of a lazy module."""
+        observer_a = ModuleObserver(self._message_bus, "org.fedoraproject.Anaconda.Modules.A")
+        observer_b = ModuleObserver(
+            self._message_bus, "org.fedoraproject.Anaconda.Modules.B", is_lazy=True
+        )
+        self._manager.set_module_observers([observer_a, observer_b])
+
+        boss_proxy = boss.get_proxy.return_value
+        boss_proxy.GetModules.side_effect = self._manager.get_service_names
+
+        # The lazy module is available before it is started.
+        self.assertFalse(observer_b.is_service_available)
+        self.assertTrue(is_module_available(Mock(service_name=observer_b.service_name)))
+
+        # Other modules are not available until they are running.
+        self.assertFalse(observer_a.is_service_available)
+        self.assertFalse(is_module_available(Mock(service_name=observer_a.service_name)))
+
+        # Unknown modules are not available.
+        self.assertFalse(is_module_available(Mock(service_name="org.fedoraproject.C")))
+
     @patch("dasbus.client.observer.Gio")
     def start_addons_test(self, gio):
         """Start addons."""
@@ -39,6 +39,7 @@ from pyanaconda.modules.storage.devicetree.populate import FindDevicesTask
 from pyanaconda.modules.storage.devicetree.rescue import FindExistingSystemsTask, \
     MountExistingSystemTask
 from pyanaconda.modules.storage.devicetree.root import Root
+from pyanaconda.ui.lib.storage import DeviceTreeSnapshot
 
 
 class DeviceTreeInterfaceTestCase(unittest.TestCase):
@@ -314,6 +315,99 @@ class DeviceTreeInterfaceTestCase(unittest.TestCase):
             'description': get_variant(Str, 'swap'),
         })
 
+    def get_devices_data_test(self):
+        """Test GetDevicesData and GetAllDevicesData."""
+        self.assertEqual(self.interface.GetAllDevicesData(), [])
+
+        self._add_device(StorageDevice("dev1", fmt=get_format("ext4"), size=Size("1 GiB")))
+        self._add_device(StorageDevice("dev2", fmt=get_format("xfs"), size=Size("2 GiB")))
+
+        data = self.interface.GetDevicesData(["dev2", "dev1"])
+        self.assertEqual(data, [
+            self.interface.GetDeviceData("dev2"),
+            self.interface.GetDeviceData("dev1"),
+        ])
+
+        data = self.interface.GetAllDevicesData()
+        self.assertEqual(data, [
+            self.interface.GetDeviceData("dev1"),
+            self.interface.GetDeviceData("dev2"),
+        ])
+
+        with self.assertRaises(UnknownDeviceError):
+            self.interface.GetDevicesData(["dev1", "dev3"])
+
+    def get_formats_data_test(self):
+        """Test GetFormatsData."""
+        self.assertEqual(self.interface.GetFormatsData([]), [])
+
+        self._add_device(StorageDevice("dev1", fmt=get_format("ext4"), size=Size("1 GiB")))
+        self._add_device(StorageDevice("dev2", fmt=get_format("xfs"), size=Size("2 GiB")))
+
+        data = self.interface.GetFormatsData(["dev1", "dev2"])
+        self.assertEqual(data, [
+            self.interface.GetFormatData("dev1"),
+            self.interface.GetFormatData("dev2"),
+        ])
+
+        with self.assertRaises(UnknownDeviceError):
+            self.interface.GetFormatsData(["dev3"])
+
+    def get_generation_test(self):
+        """Test GetGeneration."""
+        generation = self.interface.GetGeneration()
+        self.assertEqual(self.interface.GetGeneration(), generation)
+
+        dev1 = StorageDevice("dev1", fmt=get_format("ext4"), size=Size("1 GiB"))
+        self._add_device(dev1)
+
+        self.interface.SetDeviceMountOptions("dev1", "auto")
+        self.assertGreater(self.interface.GetGeneration(), generation)
+        generation = self.interface.GetGeneration()
+
+        self.storage.format_device(dev1, get_format("xfs"))
+        self.assertGreater(self.interface.GetGeneration(), generation)
+        generation = self.interface.GetGeneration()
+
+        # A copy of the storage has the same generation.
+        storage = self.storage.copy()
+        self.assertEqual(storage.generation, generation)
+
+        # A new storage has a new generation.
+        self.module.on_storage_changed(create_storage())
+        self.assertGreater(self.interface.GetGeneration(), generation)
+
+    def device_tree_snapshot_test(self):
+        """Test the snapshot of the device tree data."""
+        self._add_device(StorageDevice("dev1", fmt=get_format("ext4"), size=Size("1 GiB")))
+
+        proxy = Mock(wraps=self.interface)
+        snapshot = DeviceTreeSnapshot(proxy)
+        self.assertEqual(snapshot.generation, None)
+
+        # The data are fetched in bulk.
+        self.assertEqual(snapshot.get_device_data("dev1").size, Size("1 GiB").get_bytes())
+        self.assertEqual(snapshot.get_format_data("dev1").type, "ext4")
+        self.assertEqual(snapshot.generation, self.interface.GetGeneration())
+        proxy.GetAllDevicesData.assert_called_once_with()
+        proxy.GetFormatsData.assert_called_once_with(["dev1"])
+        proxy.GetDeviceData.assert_not_called()
+        proxy.GetFormatData.assert_not_called()
+
+        # The data are not fetched again for the same generation.
+        snapshot.refresh()
+        self.assertEqual(snapshot.get_device_data("dev1").name, "dev1")
+        proxy.GetAllDevicesData.assert_called_once_with()
+
+        # The data are fetched again for a new generation.
+        self.interface.SetDeviceMountOptions("dev1", "auto")
+        snapshot.refresh()
+        self.assertEqual(proxy.GetAllDevicesData.call_count, 2)
+
+        # Unknown devices are fetched one by one.
+        with self.assertRaises(UnknownDeviceError):
+            snapshot.get_device_data("dev2")
+
     def get_actions_test(self):
         """Test GetActions."""
         self.assertEqual(self.interface.GetActions(), [])
@@ -715,6 +809,7 @@ class DeviceTreeInterfaceTestCase(unittest.TestCase):
         obj = check_task_creation(self, task_path, publisher, FindExistingSystemsTask)
 
         self.assertEqual(obj.implementation._devicetree, self.module.storage.devicetree)
+        self.assertIs(obj.implementation._cache, self.module.storage.installations_cache)
 
         roots = [Root(name="My Linux")]
         obj.implementation._set_result(roots)
@@ -137,6 +137,31 @@ class AutopartitioningInterfaceTestCase(unittest.TestCase):
         self.assertNotEqual(self.module.storage, storage)
         self.assertIsNotNone(self.module._storage_playground)
 
+    @patch_dbus_publish_object
+    def lazy_storage_playground_test(self, publisher):
+        """Test that the storage playground is copied on demand."""
+        storage = Mock()
+        self.module.on_storage_changed(storage)
+        self.interface.GetDeviceTree()
+
+        # The device tree doesn't copy the storage.
+        storage.copy.assert_not_called()
+
+        # The storage is copied after a reset only if it is used.
+        self.module.on_partitioning_reset()
+        self.module.on_partitioning_reset()
+        storage.copy.assert_not_called()
+
+        # A new storage replaces the storage that wasn't copied.
+        new_storage = Mock()
+        self.module.on_storage_changed(new_storage)
+        self.assertEqual(self.module.storage, new_storage.copy.return_value)
+        storage.copy.assert_not_called()
+
+        # The used playground is kept.
+        self.module.on_storage_changed(Mock())
+        self.assertEqual(self.module.storage, new_storage.copy.return_value)
+
     @patch_dbus_publish_object
     def configure_with_task_test(self, publisher):
         """Test ConfigureWithTask."""
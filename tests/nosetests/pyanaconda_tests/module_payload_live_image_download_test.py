@@ -0,0 +1,201 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import Mock
+
+import requests
+from requests.exceptions import RequestException
+
+from pyanaconda.modules.payloads.payload.live_image.download import ImageDownloader, \
+    DownloadProgress
+
+
+class ImageRequestHandler(BaseHTTPRequestHandler):
+    """Handler of requests for the image."""
+
+    def log_message(self, *args):
+        pass
+
+    def _get_range(self):
+        """Get the requested range."""
+        value = self.headers.get("Range")
+
+        if not value or not self.server.ranges or self.server.ignore_ranges:
+            return None
+
+        start, end = re.match(r"bytes=(\d+)-(\d*)", value).groups()
+        end = int(end) + 1 if end else len(self.server.image)
+        return int(start), end
+
+    def _send_headers(self, status, length):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._send_headers(200, len(self.server.image))
+
+    def do_GET(self):
+        requested = self._get_range()
+        start, end = requested or (0, len(self.server.image))
+
+        with self.server.lock:
+            self.server.requests.append(requested)
+            failures = self.server.failures
+            self.server.failures = max(failures - 1, 0)
+
+        self._send_headers(206 if requested else 200, end - start)
+        data = self.server.image[start:end]
+
+        if failures:
+            # Send only a part of the data and drop the connection.
+            self.wfile.write(data[:len(data) // 2])
+            self.close_connection = True
+            return
+
+        self.wfile.write(data)
+
+
+class ImageDownloaderTestCase(unittest.TestCase):
+    """Test the downloader of images."""
+
+    def setUp(self):
+        self.image = os.urandom(1024 * 1024 + 123)
+
+        self.server = HTTPServer(("127.0.0.1", 0), ImageRequestHandler)
+        self.server.image = self.image
+        self.server.ranges = True
+        self.server.ignore_ranges = False
+        self.server.failures = 0
+        self.server.requests = []
+        self.server.lock = threading.Lock()
+
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+        self.url = "http://127.0.0.1:{}/image.img".format(self.server.server_port)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.image_path = os.path.join(self.tmp_dir.name, "disk.img")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmp_dir.cleanup()
+
+    def _download(self, **kwargs):
+        """Download the image and check the result."""
+        kwargs.setdefault("retry_delay", 0)
+        kwargs.setdefault("min_segment_size", 1024)
+
+        with requests.Session() as session:
+            downloader = ImageDownloader(session, self.url, self.image_path, **kwargs)
+            checksum = downloader.download()
+
+        self.assertEqual(checksum, hashlib.sha256(self.image).hexdigest())
+
+        with open(self.image_path, "rb") as f:
+            self.assertEqual(f.read(), self.image)
+
+    def parallel_download_test(self):
+        """Test a download in parallel segments."""
+        callback = Mock()
+        self._download(segments=4, report_callback=callback)
+
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(sorted(self.server.requests)[0][0], 0)
+        self.assertEqual(sorted(self.server.requests)[-1][1], len(self.image))
+        callback.assert_called_with("Downloading image {} (100%)".format(self.url))
+
+    def small_image_test(self):
+        """Test a download of an image smaller than a segment."""
+        self._download(segments=4, min_segment_size=len(self.image) + 1)
+        self.assertEqual(self.server.requests, [(0, len(self.image))])
+
+    def resumed_download_test(self):
+        """Test a resumed download of failed segments."""
+        self.server.failures = 2
+        self._download(segments=2)
+
+        self.assertEqual(len(self.server.requests), 4)
+
+        # The failed segments are resumed from the received data.
+        first, resumed_first, second, resumed_second = sorted(self.server.requests)
+        self.assertLess(first[0], resumed_first[0])
+        self.assertLess(second[0], resumed_second[0])
+        self.assertEqual(resumed_first[1], second[0])
+
+    def download_without_ranges_test(self):
+        """Test a download from a server without the support of ranges."""
+        self.server.ranges = False
+        self.server.failures = 1
+        self._download(segments=4)
+
+        # The download is restarted from the beginning.
+        self.assertEqual(self.server.requests, [None, None])
+
+    def download_with_ignored_ranges_test(self):
+        """Test a download from a server that ignores the ranges."""
+        self.server.ignore_ranges = True
+        self._download(segments=4)
+
+        # The image is downloaded again in a single request.
+        self.assertEqual(set(self.server.requests), {None})
+        self.assertLessEqual(len(self.server.requests), 5)
+
+    def failed_download_test(self):
+        """Test a failed download."""
+        self.server.failures = 10
+
+        with self.assertRaises(RequestException):
+            self._download(segments=2, retries=2)
+
+
+class DownloadProgressTestCase(unittest.TestCase):
+    """Test the progress reporting of the image download."""
+
+    def progress_test(self):
+        """Test the progress messages."""
+        callback = Mock()
+        progress = DownloadProgress("http://my/image.img", 200, callback)
+
+        progress.update(0)
+        callback.assert_not_called()
+
+        progress.update(100)
+        self.assertRegex(
+            callback.call_args[0][0],
+            r"^Downloading image http://my/image.img \(50%, .*/s\)$"
+        )
+
+        callback.reset_mock()
+        progress.update(101)
+        callback.assert_not_called()
+
+        progress.end()
+        callback.assert_called_once_with("Downloading image http://my/image.img (100%)")
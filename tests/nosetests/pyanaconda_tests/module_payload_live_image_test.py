@@ -17,16 +17,24 @@
 #
 # Red Hat Author(s): Jiri Konecny <jkonecny@redhat.com>
 #
+import hashlib
+import io
+import os
+import tarfile
+import tempfile
 import unittest
 
 from unittest.mock import Mock, patch
 
+from requests.exceptions import RequestException
+
 from tests.nosetests.pyanaconda_tests import check_task_creation, check_task_creation_list, \
     check_dbus_property, patch_dbus_publish_object
 from tests.nosetests.pyanaconda_tests.module_payload_shared import PayloadKickstartSharedTest, \
     PayloadSharedTest
 
 from pyanaconda.core.constants import INSTALL_TREE
+from pyanaconda.modules.common.errors.payload import InstallError
 from pyanaconda.modules.common.task.task_interface import TaskInterface
 from pyanaconda.modules.common.constants.interfaces import PAYLOAD_LIVE_IMAGE
 from pyanaconda.modules.payloads.base.initialization import CopyDriverDisksFilesTask, \
@@ -41,7 +49,8 @@ from pyanaconda.modules.payloads.payload.live_image.live_image_interface import
 from pyanaconda.modules.payloads.payload.live_image.initialization import \
     CheckInstallationSourceImageTask, SetupInstallationSourceImageTask, \
     TeardownInstallationSourceImageTask
-from pyanaconda.modules.payloads.payload.live_image.installation import InstallFromTarTask
+from pyanaconda.modules.payloads.payload.live_image.installation import InstallFromTarTask, \
+    InstallFromTarStreamTask
 
 
 class LiveImageKSTestCase(unittest.TestCase):
@@ -247,6 +256,37 @@ class LiveImageInterfaceTestCase(unittest.TestCase):
 
         check_task_creation_list(self, task_path, publisher, [InstallFromImageTask])
 
+    @patch("pyanaconda.modules.payloads.payload.live_image.live_image.conf")
+    @patch_dbus_publish_object
+    def prepare_system_for_streamed_installation_test(self, publisher, conf):
+        """Test Live Image doesn't prepare a streamed tarball."""
+        conf.payload.enable_streamed_tarball_installation = True
+        self.live_image_interface.SetUrl("http://my/image.tar.xz")
+
+        task_paths = self.live_image_interface.PreInstallWithTasks()
+        self.assertEqual(task_paths, [])
+        publisher.assert_not_called()
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.live_image.conf")
+    @patch_dbus_publish_object
+    def install_with_task_from_streamed_tar_test(self, publisher, conf):
+        """Test Live Image install with tasks from a streamed tarfile."""
+        conf.payload.enable_streamed_tarball_installation = True
+        self.live_image_interface.SetUrl("http://my/image.tar.xz")
+
+        task_path = self.live_image_interface.InstallWithTasks()
+        check_task_creation_list(self, task_path, publisher, [InstallFromTarStreamTask])
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.live_image.conf")
+    @patch_dbus_publish_object
+    def install_with_task_from_local_tar_test(self, publisher, conf):
+        """Test Live Image doesn't stream a local tarfile."""
+        conf.payload.enable_streamed_tarball_installation = True
+        self.live_image_interface.SetUrl("file:///my/image.tar.xz")
+
+        task_path = self.live_image_interface.InstallWithTasks()
+        check_task_creation_list(self, task_path, publisher, [InstallFromTarTask])
+
     @patch_dbus_publish_object
     def post_install_with_tasks_test(self, publisher):
         """Test Live Image post installation configuration task."""
@@ -275,3 +315,114 @@ class LiveImageInterfaceTestCase(unittest.TestCase):
         task_path = self.live_image_interface.TeardownWithTask()
 
         check_task_creation(self, task_path, publisher, TeardownInstallationSourceImageTask)
+
+
+class InstallFromTarStreamTaskTestCase(unittest.TestCase):
+    """Test the installation from a streamed tarball."""
+
+    def _create_tarball(self):
+        """Create a compressed tarball with a kernel and a file."""
+        data = io.BytesIO()
+
+        with tarfile.open(fileobj=data, mode="w:gz") as archive:
+            for name, content in [("boot/vmlinuz-1.2-3.x86_64", b"kernel"),
+                                  ("etc/my.conf", b"content")]:
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+
+        return data.getvalue()
+
+    def _create_session(self, tarball, error=None):
+        """Create a session that streams the tarball in small chunks."""
+        def iter_content(chunk_size):
+            for i in range(0, len(tarball), 100):
+                yield tarball[i:i + 100]
+
+            if error:
+                raise error
+
+        response = Mock()
+        response.headers = {"content-length": str(len(tarball))}
+        response.iter_content = iter_content
+
+        session = Mock()
+        session.get.return_value = response
+        return session
+
+    def _run_task(self, session, checksum, dest_path):
+        """Run the installation task."""
+        task = InstallFromTarStreamTask(
+            url="http://my/image.tar.gz",
+            proxy="",
+            checksum=checksum,
+            noverifyssl=False,
+            session=session,
+            dest_path=dest_path
+        )
+        return task.run()
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.create_rescue_image")
+    def streamed_installation_test(self, create_rescue_image):
+        """Test the streamed installation."""
+        tarball = self._create_tarball()
+        checksum = hashlib.sha256(tarball).hexdigest()
+
+        with tempfile.TemporaryDirectory() as dest_path:
+            result = self._run_task(self._create_session(tarball), checksum, dest_path)
+
+            self.assertEqual(result, ["1.2-3.x86_64"])
+            create_rescue_image.assert_called_once_with(dest_path, ["1.2-3.x86_64"])
+
+            with open(os.path.join(dest_path, "etc/my.conf")) as f:
+                self.assertEqual(f.read(), "content")
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.create_rescue_image")
+    def streamed_installation_checksum_test(self, create_rescue_image):
+        """Test the streamed installation with a wrong checksum."""
+        tarball = self._create_tarball()
+
+        with tempfile.TemporaryDirectory() as dest_path:
+            with self.assertRaises(InstallError) as cm:
+                self._run_task(self._create_session(tarball), "invalid", dest_path)
+
+            self.assertIn("Checksum of image", str(cm.exception))
+            create_rescue_image.assert_not_called()
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.create_rescue_image")
+    def streamed_installation_failed_download_test(self, create_rescue_image):
+        """Test the streamed installation with a failed download."""
+        tarball = self._create_tarball()
+        session = self._create_session(tarball[:200], error=RequestException("Fake!"))
+
+        with tempfile.TemporaryDirectory() as dest_path:
+            with self.assertRaises(InstallError) as cm:
+                self._run_task(session, "", dest_path)
+
+            self.assertIn("Fake!", str(cm.exception))
+            create_rescue_image.assert_not_called()
+
+
+class InstallFromTarTaskTestCase(unittest.TestCase):
+    """Test the installation from a tarball."""
+
+    @patch("pyanaconda.modules.payloads.payload.live_image.installation.create_rescue_image")
+    def installation_test(self, create_rescue_image):
+        """Test the installation from a tarball."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tarfile_path = os.path.join(tmp_dir, "image.tar")
+            dest_path = os.path.join(tmp_dir, "sysroot")
+            os.mkdir(dest_path)
+
+            with tarfile.open(tarfile_path, mode="w") as archive:
+                for name in ["boot/vmlinuz-1.2-3.x86_64", "boot/vmlinuz-0-rescue-123",
+                             "etc/my.conf"]:
+                    archive.addfile(tarfile.TarInfo(name), io.BytesIO(b""))
+
+            task = InstallFromTarTask(tarfile_path, dest_path)
+            result = task.run()
+
+            # The kernels are found in the extracted files.
+            self.assertEqual(result, ["1.2-3.x86_64"])
+            create_rescue_image.assert_called_once_with(dest_path, ["1.2-3.x86_64"])
+            self.assertTrue(os.path.exists(os.path.join(dest_path, "etc/my.conf")))
@@ -16,6 +16,7 @@
 # Red Hat, Inc.
 #
 import unittest
+from threading import Event, Barrier
 from time import sleep
 from unittest.mock import Mock, call
 
@@ -547,3 +548,223 @@ class TaskInterfaceTestCase(unittest.TestCase):
         # The result is publishable, but there is no result.
         with self.assertRaises(NoResultError):
             self.task_interface.GetResult()
+
+    def resources_test(self):
+        """Test the default resources of a task."""
+        self._set_up_task(self.SimpleTask())
+        self.assertEqual(self.task_interface.Resources, ["all"])
+        self.assertEqual(self.task_interface.Prerequisites, [])
+
+    class WaitingTask(Task):
+
+        def __init__(self, name, resources, started, waited_for, prerequisites=()):
+            super().__init__()
+            self._name = name
+            self._resources = resources
+            self._prerequisites = list(prerequisites)
+            self._started = started
+            self._waited_for = waited_for
+            self.waited = None
+
+        @property
+        def name(self):
+            return self._name
+
+        @property
+        def resources(self):
+            return self._resources
+
+        @property
+        def prerequisites(self):
+            return self._prerequisites
+
+        def run(self):
+            self._started.set()
+            self.waited = self._waited_for.wait(timeout=1)
+
+    def _create_waiting_tasks(self, resources_a, resources_b, prerequisites_b=()):
+        """Create two tasks that wait for each other."""
+        started_a = Event()
+        started_b = Event()
+
+        return (
+            self.WaitingTask("Install A", resources_a, started_a, started_b),
+            self.WaitingTask("Install B", resources_b, started_b, started_a, prerequisites_b)
+        )
+
+    def install_in_parallel_test(self):
+        """Install independent tasks in parallel."""
+        task_a, task_b = self._create_waiting_tasks(["a"], ["b"])
+        self._set_up_task(
+            DBusMetaTask("Task", [
+                TaskInterface(task_a),
+                TaskInterface(task_b),
+                TaskInterface(self.InstallationTaskC())
+            ], parallel=True)
+        )
+        self._check_steps(3)
+        self._run_task()
+        self._finish_task()
+
+        # The tasks were running at the same time.
+        self.assertTrue(task_a.waited)
+        self.assertTrue(task_b.waited)
+
+        # The task C requires all resources, so it runs last.
+        self.progress_changed_callback.assert_called_with(3, "Install C")
+
+    def install_conflicting_tasks_in_parallel_test(self):
+        """Install conflicting tasks in parallel."""
+        task_a, task_b = self._create_waiting_tasks(["a", "b"], ["b"])
+        self._set_up_task(
+            DBusMetaTask("Task", [
+                TaskInterface(task_a),
+                TaskInterface(task_b)
+            ], parallel=True)
+        )
+        self._check_steps(2)
+        self._run_task()
+        self._finish_task()
+
+        # The tasks were running one by one.
+        self.assertFalse(task_a.waited)
+        self.assertTrue(task_b.waited)
+
+        self.progress_changed_callback.assert_has_calls([
+            call(1, "Install A"),
+            call(2, "Install B"),
+        ])
+
+    def install_failing_task_in_parallel_test(self):
+        """Install a failing task in parallel."""
+        task_a, task_b = self._create_waiting_tasks(["a"], ["b"])
+        self._set_up_task(
+            DBusMetaTask("Task", [
+                TaskInterface(task_a),
+                TaskInterface(self.FailingTask()),
+                TaskInterface(task_b)
+            ], parallel=True)
+        )
+        self._run_task()
+        self._finish_failed_task()
+
+        # The tasks that are not started yet are canceled.
+        self.assertIsNotNone(task_a.waited)
+        self.assertIsNone(task_b.waited)
+
+    def install_serially_in_parallel_mode_test(self):
+        """Install tasks without declared resources in the parallel mode."""
+        self._set_up_task(
+            DBusMetaTask("Task", [
+                TaskInterface(self.InstallationTaskA()),
+                TaskInterface(self.InstallationTaskB()),
+                TaskInterface(self.InstallationTaskC())
+            ], parallel=True)
+        )
+        self._check_steps(3)
+        self._run_task()
+        self._finish_task()
+
+        self.progress_changed_callback.assert_has_calls([
+            call(1, "Install A"),
+            call(2, "Install B"),
+            call(3, "Install C")
+        ])
+
+    def install_resources_serially_test(self):
+        """Install tasks with declared resources in the serial mode."""
+        task_a, task_b = self._create_waiting_tasks(["a"], ["b"])
+        self._set_up_task(
+            DBusMetaTask("Task", [
+                TaskInterface(task_a),
+                TaskInterface(task_b)
+            ])
+        )
+        self._run_task()
+        self._finish_task()
+
+        # The tasks were running one by one.
+        self.assertFalse(task_a.waited)
+        self.assertTrue(task_b.waited)
+
+    def install_with_prerequisites_in_parallel_test(self):
+        """Install tasks with prerequisites in parallel."""
+        task_a, task_b = self._create_waiting_tasks(["a"], ["b"], ["Install A"])
+        self._set_up_task(
+            DBusMetaTask("Task", [
+                TaskInterface(task_a),
+                TaskInterface(task_b)
+            ], parallel=True)
+        )
+        self._run_task()
+        self._finish_task()
+
+        # The task B waited for the task A.
+        self.assertFalse(task_a.waited)
+        self.assertTrue(task_b.waited)
+
+        self.progress_changed_callback.assert_has_calls([
+            call(1, "Install A"),
+            call(2, "Install B"),
+        ])
+
+    class ReportingTask(Task):
+
+        def __init__(self, name, resources, barrier, reported, wait_before=None, wait_after=None):
+            super().__init__()
+            self._name = name
+            self._resources = resources
+            self._barrier = barrier
+            self._reported = reported
+            self._wait_before = wait_before
+            self._wait_after = wait_after
+
+        @property
+        def name(self):
+            return self._name
+
+        @property
+        def steps(self):
+            return 2
+
+        @property
+        def resources(self):
+            return self._resources
+
+        def run(self):
+            self._barrier.wait(timeout=1)
+
+            if self._wait_before:
+                self._wait_before.wait(timeout=1)
+
+            self.report_progress("Finish " + self.name, step_number=2)
+            self._reported.set()
+
+            if self._wait_after:
+                self._wait_after.wait(timeout=1)
+
+    def install_with_progress_in_parallel_test(self):
+        """Report the progress of parallel tasks."""
+        barrier = Barrier(2)
+        reported_a = Event()
+        reported_b = Event()
+
+        self._set_up_task(
+            DBusMetaTask("Task", [
+                TaskInterface(self.ReportingTask(
+                    "A", ["a"], barrier, reported_a, wait_after=reported_b
+                )),
+                TaskInterface(self.ReportingTask(
+                    "B", ["b"], barrier, reported_b, wait_before=reported_a
+                )),
+            ], parallel=True)
+        )
+        self._check_steps(4)
+        self._run_task()
+        self._finish_task()
+
+        # The steps of the running tasks are summed up.
+        self.assertEqual(self.progress_changed_callback.call_args_list[-2:], [
+            call(3, "Finish A"),
+            call(4, "Finish B"),
+        ])
@@ -22,6 +22,7 @@ from unittest.mock import Mock
 
 from dasbus.client.observer import DBusObserverError
 from pyanaconda.modules.boss.module_manager.module_observer import ModuleObserver
+from pyanaconda.modules.security.kickstart import SecurityKickstartSpecification
 
 
 class ModuleObserverTestCase(unittest.TestCase):
@@ -91,3 +92,35 @@ class ModuleObserverTestCase(unittest.TestCase):
 
         with self.assertRaises(DBusObserverError):
             observer.proxy.DoSomething()
+
+    def started_module_observer_test(self):
+        """Test the module observer of a started module."""
+        dbus = Mock()
+        observer = ModuleObserver(dbus, "my.test.module", is_lazy=True)
+        self.assertTrue(observer.is_lazy)
+
+        # Setup the observer.
+        self._setup_observer(observer)
+
+        # The service was started.
+        observer.set_service_started()
+        self._test_if_service_available(observer)
+
+        # The name watcher doesn't enable the service again.
+        observer._service_name_appeared_callback()
+        self.assertTrue(observer.is_service_available)
+        observer._service_available.emit.assert_not_called()
+
+        # Service unavailable.
+        self._make_service_unavailable(observer)
+
+    def kickstart_specification_test(self):
+        """Test the kickstart specification of the observed module."""
+        observer = ModuleObserver(Mock(), "org.fedoraproject.Anaconda.Modules.Security")
+        self.assertEqual(observer.kickstart_specification, SecurityKickstartSpecification)
+
+        observer = ModuleObserver(Mock(), "org.fedoraproject.Anaconda.Modules.Unknown")
+        self.assertIsNone(observer.kickstart_specification)
+
+        observer = ModuleObserver(Mock(), "org.fedoraproject.Anaconda.Addons.Baz", is_addon=True)
+        self.assertIsNone(observer.kickstart_specification)
@@ -23,6 +23,7 @@ import tempfile
 import os
 import hashlib
 import shutil
+import threading
 import gi
 
 import pyanaconda.core.payload as util
@@ -31,14 +32,19 @@ from tempfile import TemporaryDirectory
 from unittest.mock import patch, Mock, call
 
 from blivet.size import Size
+from dnf.exceptions import RepoError
 
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.modules.common.structures.requirement import Requirement
 from pyanaconda.payload.dnf import utils
+from pyanaconda.payload.dnf.payload import DNFPayload
 from pyanaconda.payload.flatpak import FlatpakPayload
-from pyanaconda.payload.dnf.repomd import RepoMDMetaHash
+from pyanaconda.payload.dnf.repomd import RepoMDMetaHash, RepoMDCache
+from pyanaconda.payload.dnf.resolution import ResolutionCache, ResolutionResult, \
+    get_selection_key
+from pyanaconda.payload.base import Payload, INITRAMFS_JOB_MEMORY
 from pyanaconda.payload.requirement import PayloadRequirements
-from pyanaconda.payload.errors import PayloadRequirementsMissingApply
+from pyanaconda.payload.errors import PayloadRequirementsMissingApply, DependencyError
 
 gi.require_version("Flatpak", "1.0")
 from gi.repository.Flatpak import RefKind
@@ -98,6 +104,358 @@ class PickLocation(unittest.TestCase):
         self.assertEqual(mpoint, None)
 
 
+class SplitIntoBatchesTestCase(unittest.TestCase):
+    """Test the dependency-ordered batches."""
+
+    def _check_batches(self, batches, dependencies):
+        """Check that every item is in the same or later batch than its dependencies."""
+        positions = {item: i for i, batch in enumerate(batches) for item in batch}
+        self.assertEqual(sorted(positions), sorted(dependencies))
+
+        for item, deps in dependencies.items():
+            for dep in deps:
+                self.assertLessEqual(positions[dep], positions[item])
+
+    def empty_test(self):
+        """Split no items."""
+        self.assertEqual(utils.split_into_batches([], lambda item: [], 10), [])
+
+    def chain_test(self):
+        """Split a chain of dependencies."""
+        dependencies = {"a": ["b"], "b": ["c"], "c": ["d"], "d": []}
+        batches = utils.split_into_batches(list("abcd"), dependencies.get, 2)
+        self.assertEqual(batches, [["d", "c"], ["b", "a"]])
+
+    def cycle_test(self):
+        """Don't split a dependency cycle."""
+        dependencies = {"a": ["b"], "b": ["c"], "c": ["b"], "d": ["a", "e"], "e": []}
+        batches = utils.split_into_batches(list("abcde"), dependencies.get, 1)
+        self.assertEqual(batches, [["b", "c"], ["a"], ["e"], ["d"]])
+        self._check_batches(batches, dependencies)
+
+    def unknown_dependencies_test(self):
+        """Ignore dependencies that are not split."""
+        dependencies = {"a": ["x", "a"], "b": ["y"]}
+        batches = utils.split_into_batches(list("ab"), dependencies.get, 10)
+        self.assertEqual(batches, [["a", "b"]])
+
+    def long_chain_test(self):
+        """Split a chain that is longer than the recursion limit."""
+        items = list(range(5000))
+        dependencies = {i: [i + 1] for i in items[:-1]}
+        dependencies[items[-1]] = []
+
+        batches = utils.split_into_batches(items, dependencies.get, 100)
+        self.assertEqual(len(batches), 50)
+        self._check_batches(batches, dependencies)
+
+
+class FakePackage(object):
+    """Fake DNF package."""
+
+    def __init__(self, name, requires=()):
+        self.name = name
+        self.requires = list(requires)
+
+    def __str__(self):
+        return self.name
+
+
+class SplitPackagesIntoBatchesTestCase(unittest.TestCase):
+    """Test the batches of DNF packages."""
+
+    def get_dependent_items_test(self):
+        """Get items that depend on the selected items."""
+        dependencies = {"a": {"b"}, "b": {"c"}, "c": set(), "d": {"a"}, "e": set()}
+        result = utils.get_dependent_items(list("abcde"), dependencies, {"b"})
+        self.assertEqual(result, {"a", "b", "d"})
+
+        result = utils.get_dependent_items(list("abcde"), dependencies, set())
+        self.assertEqual(result, set())
+
+    def unresolved_dependencies_test(self):
+        """Install packages with unresolved dependencies in the last batch."""
+        a = FakePackage("a", ["b"])
+        b = FakePackage("b", ["(c if d)"])
+        c = FakePackage("c")
+        d = FakePackage("d", ["broken"])
+        e = FakePackage("e", ["c"])
+        f = FakePackage("f")
+        providers = {"b": [b], "c": [c]}
+
+        def filter_providers(provides):
+            if provides == "broken":
+                raise RuntimeError("Fake error!")
+
+            return providers.get(provides, [])
+
+        base = Mock()
+        query = base.sack.query.return_value.filter.return_value
+        query.filter.side_effect = filter_providers
+
+        batches = utils.split_packages_into_batches(base, [a, b, c, d, e, f], batch_size=1)
+        self.assertEqual(batches, [[c], [e], [f], [a, b, d]])
+
+        # The rich dependency is not looked up in the sack.
+        self.assertNotIn(
+            "(c if d)",
+            [args[1]["provides"] for args in query.filter.call_args_list]
+        )
+
+    def batch_transaction_test(self):
+        """Install a batch with the inherited sack."""
+        base = Mock()
+        queue_instance = Mock()
+        package = FakePackage("a")
+        base.sack.query.return_value.available.return_value.filter.return_value = [package]
+        base.transaction.install_set = [package]
+
+        utils.do_batch_transaction(base, [{"name": "a"}], queue_instance, 0, 1)
+
+        base.reset.assert_called_once_with(goal=True)
+        base.sack.load_system_repo.assert_called_once_with(build_cache=False)
+        base.fill_sack.assert_not_called()
+        base.do_transaction.assert_called_once()
+        queue_instance.put.assert_called_once_with(('quit', 'DNF quit'))
+
+    def download_batches_failure_test(self):
+        """Report a failed download of the batches."""
+        payload = Mock()
+        payload._base.download_packages.side_effect = [None, RuntimeError("Fake error!")]
+        queue_instance = Mock()
+
+        batches = [[FakePackage("a")], [FakePackage("b")], [FakePackage("c")]]
+        DNFPayload._download_batches(payload, batches, queue_instance)
+
+        self.assertEqual(queue_instance.put.call_args_list, [
+            call(('downloaded', 0)),
+            call(('download_failed', 'Fake error!')),
+        ])
+
+    def wait_for_batch_transaction_test(self):
+        """Wait for the running batch after a failed download."""
+        payload = Mock()
+        process = Mock()
+        queue_instance = Mock()
+        queue_instance.get.side_effect = [
+            ('install', 'a'),
+            ('done', None),
+            ('quit', 'DNF quit'),
+        ]
+
+        DNFPayload._wait_for_batch_transaction(payload, process, queue_instance)
+
+        payload._handle_transaction_message.assert_called_once_with('install', 'a')
+        process.join.assert_called_once_with()
+
+
+class LoadRepositoriesTestCase(unittest.TestCase):
+    """Test the concurrent loading of repositories."""
+
+    def no_repositories_test(self):
+        """Load no repositories."""
+        self.assertEqual(utils.load_repositories([]), [])
+
+    def load_repositories_test(self):
+        """Load repositories and collect errors in order."""
+        error = RepoError("Failed to download metadata.")
+        repos = [Mock(), Mock(), Mock(), Mock()]
+        repos[1].load.side_effect = error
+        repos[3].load.side_effect = error
+
+        results = utils.load_repositories(repos, max_workers=2)
+        self.assertEqual(results, [None, error, None, error])
+
+        for repo in repos:
+            repo.load.assert_called_once_with()
+
+
+class ResolutionCacheTestCase(unittest.TestCase):
+    """Test the cache of the dependency resolution."""
+
+    def selection_key_test(self):
+        """Test the key of the software selection."""
+        key = get_selection_key(["@core", "vim", "@core"], ["nano"], ([], ["m:1"]), (True,))
+        self.assertEqual(key, (("@core", "vim"), ("nano",), ((), ("m:1",)), (True,)))
+
+        self.assertEqual(
+            get_selection_key(["a", "b"], [], ([], []), ()),
+            get_selection_key(["b", "a"], [], ([], []), ())
+        )
+        self.assertNotEqual(
+            get_selection_key(["a", "b"], [], ([], []), ()),
+            get_selection_key(["a"], ["b"], ([], []), ())
+        )
+        self.assertNotEqual(
+            get_selection_key(["a"], [], (["m"], []), ()),
+            get_selection_key(["a"], [], ([], ["m"]), ())
+        )
+        self.assertNotEqual(
+            get_selection_key(["a"], [], ([], []), (True,)),
+            get_selection_key(["a"], [], ([], []), (False,))
+        )
+
+    def cache_test(self):
+        """Test the cache of results."""
+        cache = ResolutionCache(max_size=2)
+        first = ResolutionResult(package_count=1)
+        second = ResolutionResult(error="Error!")
+        third = ResolutionResult(package_count=3)
+
+        self.assertIsNone(cache.get("a"))
+
+        cache.set("a", first)
+        cache.set("b", second)
+        self.assertIs(cache.get("a"), first)
+        self.assertIs(cache.get("b"), second)
+
+        # The least recently used result is dropped.
+        cache.get("a")
+        cache.set("c", third)
+        self.assertIs(cache.get("a"), first)
+        self.assertIsNone(cache.get("b"))
+        self.assertIs(cache.get("c"), third)
+
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("c"))
+
+    def result_test(self):
+        """Test the result of the resolution."""
+        result = ResolutionResult(package_count=10, install_space=Size("1 GiB"),
+                                  download_space=Size("500 MiB"))
+        self.assertEqual(result.package_count, 10)
+        self.assertEqual(result.install_space, Size("1 GiB"))
+        self.assertEqual(result.download_space, Size("500 MiB"))
+        self.assertIsNone(result.error)
+        self.assertEqual(
+            repr(result),
+            "ResolutionResult(package_count=10, install_space=1 GiB, "
+            "download_space=500 MiB, error=None)"
+        )
+
+
+    def _get_payload(self, key):
+        """Get a mock of the DNF payload with a real cache."""
+        payload = Mock()
+        payload._resolution_cache = ResolutionCache()
+        payload._resolution_lock = threading.RLock()
+        payload._get_selection.return_value = (["a"], [])
+        payload._get_selection_key.return_value = key
+        return payload
+
+    def resolve_selection_test(self):
+        """Store the errors and the warnings of the selection."""
+        payload = self._get_payload("key")
+        payload._base.transaction = [Mock(), Mock()]
+        error = RuntimeError("Fake error!")
+
+        def apply_selections(include_list, exclude_list, report_error, report_warning):
+            report_error(error)
+            report_warning("Fake warning!")
+
+        payload._apply_selections.side_effect = apply_selections
+        result = DNFPayload._resolve_selection(payload, ["a"], [], "key")
+
+        self.assertEqual(result.package_count, 2)
+        self.assertEqual(result.setup_errors, [error])
+        self.assertEqual(result.warnings, ["Fake warning!"])
+        self.assertIs(payload._resolution_cache.get("key"), result)
+        self.assertEqual(payload._transaction_key, "key")
+        payload._payload_setup_error.assert_not_called()
+
+    def cancelled_resolution_test(self):
+        """Cancel the resolution of the selection."""
+        payload = self._get_payload("key")
+
+        result = DNFPayload._resolve_selection(payload, ["a"], [], "key", cancelled=lambda: True)
+        self.assertIsNone(result)
+        self.assertIsNone(payload._resolution_cache.get("key"))
+        self.assertIsNone(payload._transaction_key)
+        payload._base.resolve.assert_not_called()
+
+    def cached_selection_test(self):
+        """Report the errors of a cached selection again."""
+        payload = self._get_payload("key")
+        payload._transaction_key = "other"
+        error = RuntimeError("Fake error!")
+
+        result = ResolutionResult(package_count=1, setup_errors=[error], warnings=["Warning!"])
+        payload._resolution_cache.set("key", result)
+
+        DNFPayload.check_software_selection(payload)
+        payload._resolve_selection.assert_not_called()
+        payload._payload_setup_error.assert_called_once_with(error)
+        self.assertIs(payload._resolution, result)
+
+        # The transaction of a different selection is dropped.
+        payload._base.reset.assert_called_once_with(goal=True)
+        self.assertIsNone(payload._transaction_key)
+
+        # The cached error is raised again.
+        result = ResolutionResult(error="Fake dependency error!")
+        payload._resolution_cache.set("key", result)
+
+        with self.assertRaises(DependencyError):
+            DNFPayload.check_software_selection(payload)
+
+
+class PackageMock(object):
+    """Mock of a DNF package with lazily loaded file lists."""
+
+    def __init__(self, installsize, files_nm):
+        self.installsize = installsize
+        self._files_nm = files_nm
+        self.files_loaded = False
+
+    @property
+    def files(self):
+        self.files_loaded = True
+        return ["/usr/share/file-{}".format(i) for i in range(self._files_nm)]
+
+
+class RequiredSpaceTestCase(unittest.TestCase):
+    """Test the calculation of the required space."""
+
+    def precise_test(self):
+        """Calculate the required space from the file lists."""
+        packages = [PackageMock(1000, 10), PackageMock(2000, 20)]
+        size = utils.calculate_required_space(packages, precise=True)
+
+        self.assertEqual(size, (Size(3000) + 30 * utils.BONUS_SIZE_ON_FILE) * 1.1)
+        self.assertTrue(all(p.files_loaded for p in packages))
+
+    def estimated_test(self):
+        """Estimate the required space without the file lists."""
+        packages = [PackageMock(1000, 10), PackageMock(2000, 20)]
+        size = utils.calculate_required_space(packages)
+
+        self.assertEqual(size, (Size(3000) + 2 * utils.BONUS_SIZE_ON_PACKAGE) * 1.1)
+        self.assertFalse(any(p.files_loaded for p in packages))
+
+    def no_packages_test(self):
+        """Calculate the required space of no packages."""
+        self.assertEqual(utils.calculate_required_space([]), Size(0))
+        self.assertEqual(utils.calculate_required_space([], precise=True), Size(0))
+
+    def known_sizes_test(self):
+        """Compare the precise and the estimated calculation for known sizes."""
+        packages = [PackageMock(Size("1 MiB").get_bytes(), 150) for _ in range(100)]
+        expected = (Size("100 MiB") + Size("90000 KiB")) * 1.1
+
+        # Both results are the same for the average number of files.
+        self.assertEqual(utils.calculate_required_space(packages), expected)
+        self.assertEqual(utils.calculate_required_space(packages, precise=True), expected)
+
+        # Packages with fewer files are overestimated.
+        packages = [PackageMock(Size("1 MiB").get_bytes(), 10) for _ in range(100)]
+        self.assertEqual(utils.calculate_required_space(packages), expected)
+        self.assertEqual(
+            utils.calculate_required_space(packages, precise=True),
+            (Size("100 MiB") + Size("6000 KiB")) * 1.1
+        )
+
+
 class DummyRepo(object):
     def __init__(self):
         self.id = "anaconda"
@@ -152,6 +510,166 @@ or it should be. Nah it's just a test!
         os.remove(self._md_file)
         self.assertFalse(r.verify_repoMD())
 
+    def repomd_downloaded_test(self):
+        """Test if we know that repomd.xml was downloaded."""
+        r = RepoMDMetaHash(self._dummyRepo, None)
+        self.assertFalse(r.repoMD_downloaded)
+
+        r.store_repoMD_hash()
+        self.assertTrue(r.repoMD_downloaded)
+
+        os.remove(self._md_file)
+        r.store_repoMD_hash()
+        self.assertFalse(r.repoMD_downloaded)
+
+    def cache_test(self):
+        """Test the cache of repomd hashes."""
+        cache = RepoMDCache()
+
+        # the first check only stores the hash
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+        self.assertTrue(cache.is_valid(self._dummyRepo, None))
+
+        # test if repomd change will be detected
+        with open(self._md_file, 'a') as f:
+            f.write("This should not be here!")
+
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+        self.assertTrue(cache.is_valid(self._dummyRepo, None))
+
+        # test invalidation of the cache
+        cache.invalidate(self._dummyRepo)
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+        self.assertTrue(cache.is_valid(self._dummyRepo, None))
+
+        # test correct behavior when the repo file won't be available
+        os.remove(self._md_file)
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+
+    def cached_hash_test(self):
+        """Test the hash of the last check."""
+        cache = RepoMDCache()
+        self.assertIsNone(cache.get_repo_md(self._dummyRepo))
+
+        cache.is_valid(self._dummyRepo, None)
+        repo_md = cache.get_repo_md(self._dummyRepo)
+        self.assertTrue(repo_md.repoMD_downloaded)
+        self.assertTrue(repo_md.verify_repoMD())
+
+        cache.invalidate(self._dummyRepo)
+        self.assertIsNone(cache.get_repo_md(self._dummyRepo))
+
+    def cache_without_url_test(self):
+        """Test the cache of a repo without a base URL."""
+        cache = RepoMDCache()
+        self._dummyRepo.baseurl = []
+
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+
+    def cache_with_different_url_test(self):
+        """Test the cache of a repo with a changed base URL."""
+        cache = RepoMDCache()
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+
+        self._dummyRepo.baseurl = ["file://" + self._temp_dir + "/"]
+        self.assertFalse(cache.is_valid(self._dummyRepo, None))
+        self.assertTrue(cache.is_valid(self._dummyRepo, None))
+
+
+class KernelsPayload(Payload):
+    """A payload with kernels."""
+
+    def __init__(self, kernels):
+        super().__init__(Mock())
+        self._kernels = kernels
+
+    @property
+    def type(self):
+        return None
+
+    @property
+    def kernel_version_list(self):
+        return self._kernels
+
+
+class RecreateInitrdsTestCase(unittest.TestCase):
+    """Test the generation of initrds."""
+
+    @patch("pyanaconda.payload.base.os.cpu_count", return_value=8)
+    @patch("pyanaconda.payload.base.util.get_available_memory")
+    def initrd_jobs_test(self, get_memory, cpu_count):
+        """Test the number of parallel jobs."""
+        get_memory.return_value = None
+        self.assertEqual(Payload._get_initrd_jobs(1), 1)
+        self.assertEqual(Payload._get_initrd_jobs(3), 3)
+        self.assertEqual(Payload._get_initrd_jobs(10), 8)
+
+        get_memory.return_value = 2 * INITRAMFS_JOB_MEMORY
+        self.assertEqual(Payload._get_initrd_jobs(3), 2)
+
+        get_memory.return_value = 0
+        self.assertEqual(Payload._get_initrd_jobs(3), 1)
+
+    @patch("pyanaconda.payload.base.conf")
+    @patch("pyanaconda.payload.base.util.execWithRedirect")
+    def recreate_initrds_test(self, exec_mock, conf_mock):
+        """Test the parallel generation of initrds."""
+        conf_mock.target.is_image = False
+
+        def run(command, argv, stdout, **kwargs):
+            stdout.write("{} {}\n".format(command, argv[-1]))
+            return 0
+
+        exec_mock.side_effect = run
+
+        with TemporaryDirectory() as sysroot:
+            conf_mock.target.system_root = sysroot
+            payload = KernelsPayload(["5.6.1", "5.6.2", "5.6.3"])
+
+            with self.assertLogs("program", level="INFO") as cm:
+                payload.recreate_initrds()
+
+        self.assertEqual(exec_mock.call_count, 6)
+
+        for kernel in ["5.6.1", "5.6.2", "5.6.3"]:
+            exec_mock.assert_any_call(
+                "depmod", ["-a", kernel],
+                stdout=unittest.mock.ANY, root=sysroot, log_output=False
+            )
+            exec_mock.assert_any_call(
+                "dracut", ["-f", "/boot/initramfs-%s.img" % kernel, kernel],
+                stdout=unittest.mock.ANY, root=sysroot, log_output=False
+            )
+
+            # the output of the kernel is logged in one block
+            lines = ["INFO:program:[{}] depmod {}".format(kernel, kernel),
+                     "INFO:program:[{}] dracut {}".format(kernel, kernel)]
+            index = cm.output.index(lines[0])
+            self.assertEqual(cm.output[index:index + 2], lines)
+
+    @patch("pyanaconda.payload.base.conf")
+    @patch("pyanaconda.payload.base.util.execWithRedirect")
+    def recreate_initrds_failure_test(self, exec_mock, conf_mock):
+        """Test a failed generation of initrds."""
+        conf_mock.target.is_image = True
+        conf_mock.target.system_root = "/nonexistent"
+
+        def run(command, argv, stdout, **kwargs):
+            if argv[-1] == "5.6.1":
+                raise OSError("Fake error.")
+            return 1
+
+        exec_mock.side_effect = run
+        payload = KernelsPayload(["5.6.1", "5.6.2"])
+
+        with self.assertRaises(OSError):
+            payload.recreate_initrds()
+
+        # the other kernels are still processed
+        self.assertEqual(exec_mock.call_count, 2)
+
 
 class PayloadRequirementsTestCase(unittest.TestCase):
 
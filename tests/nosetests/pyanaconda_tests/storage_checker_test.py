@@ -18,11 +18,15 @@
 #
 # Red Hat Author(s): Vendula Poncova <vponcova@redhat.com>
 #
+import threading
 import unittest
+from unittest.mock import Mock, patch
+
 import pyanaconda.modules.storage.checker.utils as checks
 
 from blivet.size import Size
-from pyanaconda.modules.storage.checker.utils import StorageChecker
+from pyanaconda.modules.storage.checker.utils import StorageChecker, depends_on, \
+    MODEL_ACTIONS, MODEL_SWAPS
 
 
 class StorageCheckerTests(unittest.TestCase):
@@ -76,7 +80,8 @@ class StorageCheckerTests(unittest.TestCase):
             "Storage check finished with success."
         ])
 
-    def info_test(self):
+    @patch("time.perf_counter", return_value=0)
+    def info_test(self, perf_counter):
         """Test info messages. """
         checker = StorageChecker()
 
@@ -99,12 +104,94 @@ class StorageCheckerTests(unittest.TestCase):
             "Storage check started with constraints {'x': None}.",
             "Run sanity check error_check.",
             "Found sanity error: error",
+            "Sanity check error_check took 0.000 s.",
             "Run sanity check warning_check.",
             "Found sanity warning: warning",
+            "Sanity check warning_check took 0.000 s.",
             "Skipped sanity check skipped_check.",
             "Storage check finished with failure(s)."
         ])
 
+    def cached_results_test(self):
+        """Test the cached results of checks."""
+        checker = StorageChecker()
+        callback = Mock()
+
+        @depends_on(MODEL_ACTIONS)
+        def cached_check(storage, constraints, report_error, report_warning):
+            callback()
+            report_error("error")
+
+        def uncached_check(storage, constraints, report_error, report_warning):
+            callback()
+            report_warning("warning")
+
+        checker.add_constraint("x", 1)
+        checker.add_check(cached_check)
+        checker.add_check(uncached_check)
+
+        storage = Mock()
+        storage.devicetree.actions = [Mock(id=1)]
+
+        report = checker.check(storage)
+        self.assertEqual(callback.call_count, 2)
+        self.assertIn("Run sanity check cached_check.", report.info)
+
+        # Reuse the results of the declared check.
+        callback.reset_mock()
+        storage.fsset.swap_devices = [Mock(id=2)]
+        report = checker.check(storage)
+        self.assertEqual(callback.call_count, 1)
+        self.assertListEqual(report.errors, ["error"])
+        self.assertListEqual(report.warnings, ["warning"])
+        self.assertIn("Reused results of sanity check cached_check.", report.info)
+        self.assertIn("Run sanity check uncached_check.", report.info)
+
+        # Run the check again if the dependencies are changed.
+        callback.reset_mock()
+        storage.devicetree.actions.append(Mock(id=3))
+        checker.check(storage)
+        self.assertEqual(callback.call_count, 2)
+
+        # Run the check again if the constraints are changed.
+        callback.reset_mock()
+        checker.set_constraint("x", 2)
+        checker.check(storage)
+        self.assertEqual(callback.call_count, 2)
+
+        # Drop the results of removed checks.
+        checker.remove_check(cached_check)
+        checker.add_check(cached_check)
+        callback.reset_mock()
+        checker.check(storage)
+        self.assertEqual(callback.call_count, 2)
+
+    def parallel_checks_test(self):
+        """Test checks running in parallel."""
+        checker = StorageChecker()
+        barrier = threading.Barrier(2, timeout=10)
+
+        @depends_on(MODEL_ACTIONS)
+        def check_1(storage, constraints, report_error, report_warning):
+            barrier.wait()
+            report_error("error 1")
+
+        @depends_on(MODEL_SWAPS)
+        def check_2(storage, constraints, report_error, report_warning):
+            barrier.wait()
+            report_error("error 2")
+
+        checker.add_check(check_1)
+        checker.add_check(check_2)
+
+        storage = Mock()
+        storage.devicetree.actions = []
+        storage.fsset.swap_devices = []
+
+        # The checks would break the barrier if they run in order.
+        report = checker.check(storage)
+        self.assertListEqual(report.errors, ["error 1", "error 2"])
+
     def simple_constraints_test(self):
         """Test simple constraint adding."""
         checker = StorageChecker()
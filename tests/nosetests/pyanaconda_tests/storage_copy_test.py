@@ -0,0 +1,88 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from unittest.mock import Mock, patch
+
+from blivet.devices import DiskDevice
+from blivet.formats import get_format
+from blivet.size import Size
+
+from pyanaconda.modules.storage.devicetree import create_storage, StorageCopy
+from pyanaconda.modules.storage.partitioning.automatic.automatic_module import \
+    AutoPartitioningModule
+
+
+class StorageCopyTestCase(unittest.TestCase):
+    """Test the lazy copy of the storage model."""
+
+    def copy_test(self):
+        """Test the lazy copy."""
+        storage = Mock()
+        setup = Mock()
+
+        storage_copy = StorageCopy(storage, setup)
+        self.assertFalse(storage_copy.is_created)
+        storage.copy.assert_not_called()
+        setup.assert_not_called()
+
+        copied_storage = storage_copy.get()
+        self.assertTrue(storage_copy.is_created)
+        self.assertEqual(copied_storage, storage.copy.return_value)
+        setup.assert_called_once_with(copied_storage)
+
+        self.assertEqual(storage_copy.get(), copied_storage)
+        storage.copy.assert_called_once_with()
+        setup.assert_called_once_with(copied_storage)
+
+    def copy_without_setup_test(self):
+        """Test the lazy copy without the setup."""
+        storage = Mock()
+        storage_copy = StorageCopy(storage)
+        self.assertEqual(storage_copy.get(), storage.copy.return_value)
+
+    def _create_storage(self, disks):
+        """Create a synthetic storage model with the given number of disks."""
+        storage = create_storage()
+
+        for i in range(disks):
+            storage.devicetree._add_device(DiskDevice(
+                "disk{}".format(i),
+                fmt=get_format("ext4"),
+                size=Size("10 GiB"),
+                exists=True
+            ))
+
+        return storage
+
+    def reset_test(self):
+        """Test that the resets don't copy the storage model."""
+        storage = self._create_storage(10)
+
+        module = AutoPartitioningModule()
+        module.on_storage_changed(storage)
+        module.get_device_tree()
+
+        with patch.object(storage, "copy", wraps=storage.copy) as copy:
+            for _ in range(10):
+                module.on_partitioning_reset()
+
+            copy.assert_not_called()
+
+            # The storage is copied when it is used.
+            self.assertEqual(len(module.storage.devices), 10)
+            copy.assert_called_once_with()
@@ -0,0 +1,152 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from unittest.mock import patch
+
+from blivet.devices import DiskDevice, StorageDevice
+from blivet.formats import get_format
+from blivet.size import Size
+
+from pyanaconda.modules.storage.devicetree import create_storage
+from pyanaconda.modules.storage.devicetree.index import DeviceTreeIndex
+from pyanaconda.modules.storage.devicetree.root import Root
+from pyanaconda.modules.storage.partitioning.automatic.utils import lookup_alias
+from pyanaconda.modules.storage.partitioning.interactive.utils import collect_unused_devices, \
+    collect_used_devices
+
+
+class CountingDiskDevice(DiskDevice):
+    """Disk device that counts the computations of its ancestors."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ancestors_count = 0
+
+    @property
+    def ancestors(self):
+        self.ancestors_count += 1
+        return super().ancestors
+
+
+class DeviceTreeIndexTestCase(unittest.TestCase):
+    """Test the index of the device tree."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.storage = create_storage()
+
+    def _add_disk(self, name, alias=None, mount_point=None, disk_class=DiskDevice):
+        """Add a disk to the device tree."""
+        disk = disk_class(
+            name,
+            fmt=get_format("ext4", mountpoint=mount_point, uuid="uuid-" + name, exists=True),
+            size=Size("10 GiB"),
+            exists=True
+        )
+
+        if alias:
+            disk.req_name = alias
+
+        self.storage.devicetree._add_device(disk)
+        return disk
+
+    def index_test(self):
+        """Test the lookups in the index."""
+        dev1 = self._add_disk("dev1", alias="pv.1", mount_point="/")
+        dev2 = self._add_disk("dev2", alias="pv.2", mount_point="/home")
+        dev3 = StorageDevice("dev3", size=Size("1 GiB"), parents=[dev2], exists=True)
+        self.storage.devicetree._add_device(dev3)
+
+        index = DeviceTreeIndex(self.storage.devices)
+        self.assertEqual(len(index), 3)
+        self.assertIn(dev1, index)
+        self.assertNotIn(DiskDevice("dev4"), index)
+
+        self.assertEqual(index.get_device_by_name("dev2"), dev2)
+        self.assertEqual(index.get_device_by_name("dev4"), None)
+        self.assertEqual(index.get_device_by_path("/dev/dev1"), dev1)
+        self.assertEqual(index.get_device_by_path("/dev/dev4"), None)
+        self.assertEqual(index.get_device_by_uuid("uuid-dev2"), dev2)
+        self.assertEqual(index.get_device_by_uuid("uuid-dev4"), None)
+        self.assertEqual(index.get_device_by_alias("pv.1"), dev1)
+        self.assertEqual(index.get_device_by_alias("pv.4"), None)
+
+        self.assertEqual(index.get_ancestors(dev1), [dev1])
+        self.assertEqual(set(index.get_ancestors(dev3)), {dev2, dev3})
+
+    def storage_index_test(self):
+        """Test the index of the storage model."""
+        dev1 = self._add_disk("dev1", alias="pv.1")
+
+        index = self.storage.index
+        self.assertIn(dev1, index)
+        self.assertIs(self.storage.index, index)
+
+        # Create a new index if the model is changed.
+        self.storage.update_generation()
+        self.assertIsNot(self.storage.index, index)
+
+        # Keep the index until the model is updated.
+        index = self.storage.index
+        dev2 = self._add_disk("dev2", alias="pv.2")
+        self.assertIs(self.storage.index, index)
+        self.assertNotIn(dev2, self.storage.index)
+
+        self.storage.update_generation()
+        self.assertIsNot(self.storage.index, index)
+        self.assertIn(dev2, self.storage.index)
+
+        # Look up the aliases.
+        self.assertEqual(lookup_alias(self.storage, "pv.1"), dev1)
+        self.assertEqual(lookup_alias(self.storage, "pv.2"), dev2)
+        self.assertEqual(lookup_alias(self.storage, "pv.3"), None)
+
+    def _create_tree(self, size):
+        """Create a synthetic device tree with a root of all devices."""
+        mounts = {}
+
+        for i in range(size):
+            mount_point = "/mnt/{}".format(i)
+            disk = self._add_disk(
+                "disk{}".format(i), "alias{}".format(i), mount_point, CountingDiskDevice
+            )
+            mounts[mount_point] = disk
+
+        self.storage.roots = [Root(name="Linux", mounts=mounts, swaps=[])]
+
+    def lookups_test(self):
+        """Test that the lookups don't scan the device tree."""
+        size = 100
+        self._create_tree(size)
+        self.storage.update_generation()
+
+        with patch.object(DeviceTreeIndex, "_add_device", autospec=True,
+                          side_effect=DeviceTreeIndex._add_device) as add_device:
+            used = collect_used_devices(self.storage)
+            unused = collect_unused_devices(self.storage)
+            aliases = [lookup_alias(self.storage, "alias{}".format(i)) for i in range(size)]
+
+        self.assertEqual(len(used), size)
+        self.assertEqual(unused, [])
+        self.assertEqual(set(aliases), set(self.storage.devices))
+
+        # The index is created only once.
+        self.assertEqual(add_device.call_count, size)
+
+        # The ancestors of every device are computed only once.
+        self.assertEqual({d.ancestors_count for d in self.storage.devices}, {1})
@@ -0,0 +1,191 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from pyanaconda.modules.storage.devicetree.root import find_existing_installations, \
+    _Installation
+
+
+class FindExistingInstallationsTestCase(unittest.TestCase):
+    """Test the search for existing installations."""
+
+    def setUp(self):
+        self.devices = {}
+        self.devicetree = Mock()
+        self.devicetree.devices = []
+        self.cache = {}
+
+    def _add_device(self, name, uuid):
+        """Add a device with a mountable format."""
+        device = Mock(direct=True, controllable=True, size=1024)
+        device.name = name
+        device.format.linux_native = True
+        device.format.mountable = True
+        device.format.exists = True
+        device.format.type = "ext4"
+        device.format.uuid = uuid
+        device.format.label = None
+        self.devices[name] = device
+        self.devicetree.devices.append(device)
+        return device
+
+    def _search(self, device, sysroot, result):
+        """Simulate the search on a mounted device."""
+        # Every device has its own mount point.
+        self.assertTrue(os.path.isdir(sysroot))
+        self.assertNotIn(sysroot, self.mount_points)
+        self.mount_points.add(sysroot)
+
+        # Finish the searches in the reversed order.
+        time.sleep(0.1 / (list(self.devices).index(device.name) + 1))
+        return result
+
+    def _find(self):
+        """Find existing installations with the cache."""
+        return find_existing_installations(self.devicetree, cache=self.cache)
+
+    @patch("pyanaconda.modules.storage.devicetree.root._search_mounted_device")
+    def search_test(self, search):
+        """Test the search in parallel."""
+        self.mount_points = set()
+
+        for i in range(5):
+            self._add_device("dev{}".format(i), "uuid{}".format(i))
+
+        search.side_effect = lambda devicetree, device, sysroot, lock: self._search(
+            device, sysroot, _Installation(
+                product="Linux",
+                version=device.name,
+                arch="x86_64",
+                mounts={"/": device},
+                swaps=[]
+            )
+        )
+
+        roots = self._find()
+
+        # The order of the roots is deterministic.
+        self.assertEqual(
+            [r.device for r in roots],
+            [self.devices["dev{}".format(i)] for i in range(5)]
+        )
+        self.assertEqual(search.call_count, 5)
+        self.devicetree.teardown_all.assert_called_once_with()
+
+        # The temporary mount points are removed.
+        for mount_point in self.mount_points:
+            self.assertFalse(os.path.exists(mount_point))
+
+    @patch("pyanaconda.modules.storage.devicetree.root._search_mounted_device")
+    def cache_test(self, search):
+        """Test the cache of the results."""
+        dev1 = self._add_device("dev1", "uuid1")
+        dev2 = self._add_device("dev2", "uuid2")
+        dev3 = self._add_device("dev3", "uuid3")
+
+        results = {
+            "dev1": _Installation("Linux", "1", "x86_64", {"/": dev1}, [dev2]),
+            "dev2": False,
+            "dev3": None,
+        }
+        search.side_effect = lambda devicetree, device, sysroot, lock: results[device.name]
+
+        roots = self._find()
+        self.assertEqual(len(roots), 1)
+        self.assertEqual(roots[0].mounts, {"/": dev1})
+        self.assertEqual(roots[0].swaps, [dev2])
+        self.assertEqual(search.call_count, 3)
+
+        # Search only the device that failed to mount.
+        search.reset_mock()
+        roots = self._find()
+        self.assertEqual(len(roots), 1)
+        search.assert_called_once()
+        self.assertEqual(search.call_args[0][1], dev3)
+
+        # The devices are found by their UUIDs.
+        search.reset_mock()
+        dev1.name = "dev4"
+        roots = self._find()
+        self.assertEqual(roots[0].mounts, {"/": dev1})
+        self.assertCountEqual([c[0][1] for c in search.call_args_list], [dev3])
+
+        # Search the changed device again.
+        search.reset_mock()
+        dev1.name = "dev1"
+        dev1.format.uuid = "uuid4"
+        self._find()
+        self.assertCountEqual([c[0][1] for c in search.call_args_list], [dev1, dev3])
+
+        # Search the device again if its swap is changed.
+        search.reset_mock()
+        dev2.format.label = "swap"
+        self._find()
+        self.assertCountEqual([c[0][1] for c in search.call_args_list], [dev1, dev2, dev3])
+
+        # Search the device again if its swap is not in the tree.
+        search.reset_mock()
+        self.devicetree.devices.remove(dev2)
+        self._find()
+        self.assertCountEqual([c[0][1] for c in search.call_args_list], [dev1, dev3])
+
+    @patch("pyanaconda.modules.storage.devicetree.root._search_mounted_device")
+    def ambiguous_uuid_test(self, search):
+        """Test devices with the same UUID."""
+        dev1 = self._add_device("dev1", "uuid1")
+        dev2 = self._add_device("dev2", "uuid1")
+        search.side_effect = lambda devicetree, device, sysroot, lock: \
+            _Installation("Linux", "1", "x86_64", {"/": device}, [])
+
+        roots = self._find()
+        self.assertEqual([r.device for r in roots], [dev1, dev2])
+        self.assertEqual(self.cache, {})
+
+        # The devices are searched again.
+        search.reset_mock()
+        self._find()
+        self.assertEqual(search.call_count, 2)
+
+    @patch("pyanaconda.modules.storage.devicetree.root._search_mounted_device")
+    def setup_failure_test(self, search):
+        """Test a failed setup of a device."""
+        dev1 = self._add_device("dev1", "uuid1")
+        dev1.setup.side_effect = Exception("Fake error!")
+
+        self.assertEqual(self._find(), [])
+        search.assert_not_called()
+        self.assertEqual(self.cache, {})
+
+    @patch("pyanaconda.modules.storage.devicetree.root._search_mounted_device")
+    def rmdir_failure_test(self, search):
+        """Test a failed removal of the mount point."""
+        dev1 = self._add_device("dev1", "uuid1")
+        search.return_value = _Installation("Linux", "1", "x86_64", {"/": dev1}, [])
+
+        with patch("pyanaconda.modules.storage.devicetree.root.os.rmdir") as rmdir:
+            rmdir.side_effect = OSError("Fake error!")
+
+            with self.assertLogs("anaconda.modules.storage.devicetree.root", "WARNING") as cm:
+                roots = self._find()
+
+        self.assertEqual(len(roots), 1)
+        self.assertIn("Failed to remove the mount point", "\n".join(cm.output))
+        os.rmdir(search.call_args[0][2])
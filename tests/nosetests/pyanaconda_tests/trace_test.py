@@ -0,0 +1,109 @@
+#
+# Copyright (C) 2020  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyanaconda.core.trace import Tracer, trace_span
+
+
+class TracerTestCase(unittest.TestCase):
+    """Test the tracer."""
+
+    def _load_events(self, file_name):
+        """Load the events like the trace viewers do."""
+        with open(file_name) as f:
+            content = f.read().rstrip()
+
+        self.assertTrue(content.startswith("["))
+        self.assertTrue(content.endswith(","))
+        return json.loads(content[:-1] + "]")
+
+    def disabled_test(self):
+        """Test a disabled tracer."""
+        tracer = Tracer()
+        self.assertFalse(tracer.enabled)
+
+        # Nothing happens.
+        tracer.add_span("Span", 1, 2)
+
+    def add_span_test(self):
+        """Test the add_span method."""
+        with tempfile.TemporaryDirectory() as d:
+            file_name = os.path.join(d, "anaconda.trace.json")
+
+            tracer = Tracer()
+            tracer.enable("anaconda", file_name)
+            self.assertTrue(tracer.enabled)
+
+            tracer.add_span("Span", 1.5, 2.25, category="test")
+
+            # Another process appends to the same file.
+            tracer = Tracer()
+            tracer.enable("module", file_name)
+            tracer.add_span("Another span", 2, 3)
+
+            events = self._load_events(file_name)
+
+        self.assertEqual(len(events), 4)
+        self.assertEqual(events[0]["ph"], "M")
+        self.assertEqual(events[0]["args"], {"name": "anaconda"})
+        self.assertEqual(events[2]["args"], {"name": "module"})
+
+        span = events[1]
+        self.assertEqual(span["name"], "Span")
+        self.assertEqual(span["cat"], "test")
+        self.assertEqual(span["ph"], "X")
+        self.assertEqual(span["ts"], 1500000)
+        self.assertEqual(span["dur"], 750000)
+        self.assertEqual(span["pid"], os.getpid())
+        self.assertEqual(span["args"], {"thread": "MainThread"})
+
+        span = events[3]
+        self.assertEqual(span["name"], "Another span")
+        self.assertEqual(span["cat"], "anaconda")
+
+    def trace_span_test(self):
+        """Test the trace_span function."""
+        tracer = Tracer()
+
+        with patch("pyanaconda.core.trace.tracer", tracer):
+            with tempfile.TemporaryDirectory() as d:
+                file_name = os.path.join(d, "anaconda.trace.json")
+                tracer.enable("anaconda", file_name)
+
+                with trace_span("Span"):
+                    pass
+
+                @trace_span("Function", category="function")
+                def function():
+                    pass
+
+                function()
+                function()
+
+                with self.assertRaises(ValueError):
+                    with trace_span("Failed span"):
+                        raise ValueError()
+
+                events = self._load_events(file_name)
+
+        names = [e["name"] for e in events if e["ph"] == "X"]
+        self.assertEqual(names, ["Span", "Function", "Function", "Failed span"])
@@ -16,6 +16,7 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 
+import io
 import unittest
 import os
 import tempfile
@@ -94,13 +95,53 @@ class RunProgramTests(unittest.TestCase):
         self.assertEqual(retcode, 0)
         self.assertEqual(output, b'\xa0\xa1\xa2')
 
+    def stream_program_test(self):
+        """Test the _stream_program method."""
+        retcode, output = util._stream_program(['ls'])
+        self.assertEqual(retcode, 0)
+        self.assertIsInstance(output, str)
+
+        retcode, output = util._stream_program(['ls', '--asdasd'])
+        self.assertNotEqual(retcode, 0)
+        self.assertIn("asdasd", output)
+
+        with self.assertRaises(OSError):
+            util._stream_program(['asdasdadasd'])
+
+    def stream_program_output_test(self):
+        """Test the output of the _stream_program method."""
+        stdout = io.StringIO()
+        retcode, output = util._stream_program(
+            ['/bin/sh', '-c', 'seq 1 1000; echo -n end; exit 3'],
+            stdout=stdout,
+            tail_size=2
+        )
+
+        self.assertEqual(retcode, 3)
+        self.assertEqual(output, "1000\nend\n")
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 1001)
+        self.assertEqual(lines[0], "1")
+        self.assertEqual(lines[-1], "end")
+
     def exec_with_redirect_test(self):
         """Test execWithRedirect."""
         # correct calling should return rc==0
         self.assertEqual(util.execWithRedirect('ls', []), 0)
 
-        # incorrect calling should return rc!=0
-        self.assertNotEqual(util.execWithRedirect('ls', ['--asdasd']), 0)
+        # incorrect calling should return rc!=0 and point to the logged output
+        with self.assertLogs("anaconda.core.util", level="INFO") as cm:
+            self.assertNotEqual(util.execWithRedirect('ls', ['--asdasd']), 0)
+
+        self.assertIn("see program.log", "\n".join(cm.output))
+        self.assertNotIn("asdasd", "\n".join(cm.output))
+
+        # the output that is not logged should be logged on failure
+        with self.assertLogs("anaconda.core.util", level="INFO") as cm:
+            self.assertNotEqual(util.execWithRedirect('ls', ['--asdasd'], log_output=False), 0)
+
+        self.assertIn("asdasd", "\n".join(cm.output))
 
     def exec_with_capture_test(self):
         """Test execWithCapture."""
@@ -186,6 +227,31 @@ exit 0
                 self.assertEqual(next(rl_iterator), "three")
                 self.assertRaises(StopIteration, rl_iterator.__next__)
 
+    def exec_readlines_test_universal_newlines(self):
+        """Test the output of execReadlines with carriage returns."""
+        with tempfile.NamedTemporaryFile(mode="w+t") as testscript:
+            testscript.write("""#!/bin/sh
+printf "one\\rtwo\\r\\nthree\\n"
+exit 3
+""")
+            testscript.flush()
+
+            with timer(5):
+                rl_iterator = util.execReadlines("/bin/sh", [testscript.name])
+                self.assertEqual(next(rl_iterator), "one\rtwo")
+                self.assertEqual(next(rl_iterator), "three")
+                self.assertRaises(OSError, rl_iterator.__next__)
+                self.assertEqual(rl_iterator.returncode, 3)
+
+            with timer(5):
+                rl_iterator = util.execReadlines("/bin/sh", [testscript.name],
+                                                 universal_newlines=True)
+                self.assertEqual(next(rl_iterator), "one")
+                self.assertEqual(next(rl_iterator), "two")
+                self.assertEqual(next(rl_iterator), "three")
+                self.assertRaises(OSError, rl_iterator.__next__)
+                self.assertEqual(rl_iterator.returncode, 3)
+
     def exec_readlines_test_exits(self):
         """Test execReadlines in different child exit situations."""
 